@@ -0,0 +1 @@
+Add `max_connections` and `max_inflight_requests` admission control to the low level web server, answering `503 Service Unavailable` when the in-flight limit is reached.
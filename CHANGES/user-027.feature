@@ -0,0 +1 @@
+Add an adaptive AIMD concurrency limiter for the server request path.
@@ -0,0 +1 @@
+Add server-side handler timeouts and request deadlines that cancel slow handlers and answer `503 Service Unavailable`.
@@ -0,0 +1 @@
+Add a built-in low overhead server metrics registry.
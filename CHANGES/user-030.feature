@@ -0,0 +1 @@
+Add an event loop lag monitor and slow callback reporter to app runners.
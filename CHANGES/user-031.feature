@@ -0,0 +1 @@
+Spool uploaded files in memory up to a configurable threshold in `BaseRequest.post()` and write larger files to disk in a thread.
@@ -0,0 +1 @@
+Add `BaseRequest.iter_form()` for streaming multipart form fields without temporary files.
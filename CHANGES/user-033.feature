@@ -0,0 +1 @@
+Speed up multipart boundary scanning by searching chunks without joining them.
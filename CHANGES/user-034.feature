@@ -0,0 +1 @@
+Decode base64 and quoted-printable multipart body parts incrementally.
@@ -0,0 +1 @@
+Pass JSON bodies to `loads` as bytes in `Request.json()` and `ClientResponse.json()` when the loader supports it.
@@ -0,0 +1 @@
+Add lazy materialization of incoming request headers.
@@ -0,0 +1 @@
+Use `__slots__` for per-request objects to reduce memory usage.
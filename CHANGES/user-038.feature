@@ -0,0 +1 @@
+Add `workers` argument to `web.run_app()` for running several processes sharing a port with `SO_REUSEPORT`.
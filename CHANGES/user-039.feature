@@ -0,0 +1 @@
+Add `threads` argument to `web.run_app()` for running one event loop per thread.
@@ -0,0 +1 @@
+Add a queue-based non-blocking access log writer.
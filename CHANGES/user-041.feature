@@ -0,0 +1 @@
+Compile access log formats into specialised formatting functions.
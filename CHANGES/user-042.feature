@@ -0,0 +1 @@
+Add a structured JSON access logger and per status class access log sampling.
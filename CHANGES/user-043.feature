@@ -0,0 +1 @@
+Hand free connection slots to waiters round-robin in constant time in `BaseConnector`.
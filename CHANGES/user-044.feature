@@ -0,0 +1 @@
+Keep idle connections ordered by release time so that cleanup only visits expired connections.
@@ -0,0 +1 @@
+Add connection lifetime and max requests per connection limits to the client pool.
@@ -0,0 +1 @@
+Add `BaseConnector.prewarm()` and `ClientSession.prewarm()` for opening pooled connections ahead of time.
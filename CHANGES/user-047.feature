@@ -0,0 +1 @@
+Race connection attempts to resolved hosts in `TCPConnector` (Happy Eyeballs, RFC 8305).
@@ -0,0 +1 @@
+Refresh cached DNS entries in the background while serving the stale entry.
@@ -0,0 +1 @@
+Bound the connector DNS cache size and honour per-record TTLs.
@@ -0,0 +1 @@
+Run `ThreadedResolver` lookups in a dedicated bounded thread pool and coalesce concurrent lookups of the same host.
@@ -106,6 +106,17 @@ cdef inline object find_header(bytes raw_header):
     return headers[idx]
 
 
+cdef inline object find_known_header(bytes raw_header):
+    cdef Py_ssize_t size
+    cdef char *buf
+    cdef int idx
+    PyBytes_AsStringAndSize(raw_header, &buf, &size)
+    idx = _find_header.find_header(buf, size)
+    if idx == -1:
+        return None
+    return headers[idx]
+
+
 @cython.freelist(DEFAULT_FREELIST_SIZE)
 cdef class RawRequestMessage:
     cdef readonly str method
@@ -303,6 +314,7 @@ cdef class HttpParser:
         object  _payload_exception
         object  _last_error
         bint    _auto_decompress
+        bint    _lazy_headers
         int     _limit
 
         str     _content_encoding
@@ -330,7 +342,7 @@ cdef class HttpParser:
                    size_t max_line_size=8190, size_t max_headers=32768,
                    size_t max_field_size=8190, payload_exception=None,
                    bint response_with_body=True, bint read_until_eof=False,
-                   bint auto_decompress=True):
+                   bint auto_decompress=True, bint lazy_headers=False):
         cparser.http_parser_init(self._cparser, mode)
         self._cparser.data = <void*>self
         self._cparser.content_length = 0
@@ -358,6 +370,7 @@ cdef class HttpParser:
         self._read_until_eof = read_until_eof
         self._upgraded = False
         self._auto_decompress = auto_decompress
+        self._lazy_headers = lazy_headers
         self._content_encoding = None
 
         self._csettings.on_url = cb_on_url
@@ -379,13 +392,24 @@ cdef class HttpParser:
             raw_name = bytes(self._raw_name)
             raw_value = bytes(self._raw_value)
 
-            name = find_header(raw_name)
-            value = raw_value.decode('utf-8', 'surrogateescape')
+            if self._lazy_headers:
+                # only raw headers are kept, names of the headers
+                # the parser needs itself are looked up without decoding
+                name = find_known_header(raw_name)
+                if name is CONTENT_ENCODING:
+                    self._content_encoding = raw_value.decode(
+                        'utf-8', 'surrogateescape')
+                elif name is SEC_WEBSOCKET_KEY1:
+                    # do not support old websocket spec
+                    raise InvalidHeader(SEC_WEBSOCKET_KEY1)
+            else:
+                name = find_header(raw_name)
+                value = raw_value.decode('utf-8', 'surrogateescape')
 
-            self._headers.add(name, value)
+                self._headers.add(name, value)
 
-            if name is CONTENT_ENCODING:
-                self._content_encoding = value
+                if name is CONTENT_ENCODING:
+                    self._content_encoding = value
 
             PyByteArray_Resize(self._raw_name, 0)
             PyByteArray_Resize(self._raw_value, 0)
@@ -422,13 +446,17 @@ cdef class HttpParser:
         chunked = self._cparser.flags & cparser.F_CHUNKED
 
         raw_headers = tuple(self._raw_headers)
-        headers = CIMultiDictProxy(self._headers)
+        if self._lazy_headers:
+            headers = None
+        else:
+            headers = CIMultiDictProxy(self._headers)
 
         if upgrade or self._cparser.method == 5: # cparser.CONNECT:
             self._upgraded = True
 
-        # do not support old websocket spec
-        if SEC_WEBSOCKET_KEY1 in headers:
+        # do not support old websocket spec,
+        # lazy mode checks it in _process_header()
+        if headers is not None and SEC_WEBSOCKET_KEY1 in headers:
             raise InvalidHeader(SEC_WEBSOCKET_KEY1)
 
         encoding = None
@@ -566,10 +594,12 @@ cdef class HttpRequestParser(HttpParser):
                  size_t max_line_size=8190, size_t max_headers=32768,
                  size_t max_field_size=8190, payload_exception=None,
                  bint response_with_body=True, bint read_until_eof=False,
+                 bint auto_decompress=True, bint lazy_headers=False,
     ):
          self._init(cparser.HTTP_REQUEST, protocol, loop, limit, timer,
                     max_line_size, max_headers, max_field_size,
-                    payload_exception, response_with_body, read_until_eof)
+                    payload_exception, response_with_body, read_until_eof,
+                    auto_decompress, lazy_headers)
 
     cdef object _on_status_complete(self):
          cdef Py_buffer py_buf
@@ -612,7 +642,8 @@ cdef int cb_on_message_begin(cparser.http_parser* parser) except -1:
     cdef HttpParser pyparser = <HttpParser>parser.data
 
     pyparser._started = True
-    pyparser._headers = CIMultiDict()
+    if not pyparser._lazy_headers:
+        pyparser._headers = CIMultiDict()
     pyparser._raw_headers = []
     PyByteArray_Resize(pyparser._buf, 0)
     pyparser._path = None
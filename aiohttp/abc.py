@@ -120,7 +120,12 @@ class AbstractResolver(ABC):
 
     @abstractmethod
     async def resolve(self, host: str, port: int, family: int) -> List[Dict[str, Any]]:
-        """Return IP address for given hostname"""
+        """Return IP address for given hostname
+
+        Every address is a dict of "hostname", "host", "port", "family",
+        "proto" and "flags" items, an optional "ttl" item is the number
+        of seconds the address may be cached for.
+        """
 
     @abstractmethod
     async def close(self) -> None:
@@ -159,6 +164,10 @@ class AbstractCookieJar(Sized, IterableBase):
 class AbstractStreamWriter(ABC):
     """Abstract stream writer."""
 
+    # __dict__ keeps arbitrary attributes of writers working,
+    # it is allocated on the first assignment only
+    __slots__ = ("__dict__",)
+
     buffer_size = 0
     output_size = 0
     length = 0  # type: Optional[int]
@@ -927,6 +927,54 @@ class ClientSession:
         """Perform HTTP DELETE request."""
         return _RequestContextManager(self._request(hdrs.METH_DELETE, url, **kwargs))
 
+    async def prewarm(
+        self,
+        url: StrOrURL,
+        n: int = 32,
+        *,
+        top_up: bool = False,
+        proxy: Optional[StrOrURL] = None,
+        proxy_auth: Optional[BasicAuth] = None,
+        ssl: Optional[Union[SSLContext, bool, Fingerprint]] = None,
+        proxy_headers: Optional[LooseHeaders] = None,
+    ) -> int:
+        """Open connections to url in advance.
+
+        See BaseConnector.prewarm(), the session timeout is used.
+        Proxy and ssl parameters are applied like request() does, so
+        the connections are found by requests with the same parameters.
+        Return the number of opened connections.
+        """
+        if self.closed:
+            raise RuntimeError("Session is closed")
+        assert self._connector is not None
+        try:
+            url = URL(url)
+        except ValueError as e:
+            raise InvalidURL(url) from e
+        if proxy is not None:
+            try:
+                proxy = URL(proxy)
+            except ValueError as e:
+                raise InvalidURL(proxy) from e
+        elif self._trust_env:
+            for scheme, proxy_info in proxies_from_env().items():
+                if scheme == url.scheme:
+                    proxy = proxy_info.proxy
+                    proxy_auth = proxy_info.proxy_auth
+                    break
+        timeout = self._timeout  # type: ClientTimeout
+        return await self._connector.prewarm(
+            url,
+            n,
+            top_up=top_up,
+            timeout=timeout,
+            ssl=ssl,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+            proxy_headers=self._prepare_headers(proxy_headers),
+        )
+
     async def close(self) -> None:
         """Close underlying connector.
 
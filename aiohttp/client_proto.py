@@ -36,6 +36,10 @@ class ResponseHandler(BaseProtocol, DataQueue[Tuple[RawResponseMessage, StreamRe
         self._read_timeout = None  # type: Optional[float]
         self._read_timeout_handle = None  # type: Optional[asyncio.TimerHandle]
 
+        # lifetime limits set by the connector
+        self._expires_at = None  # type: Optional[float]
+        self._requests_left = None  # type: Optional[int]
+
         self.closed = self._loop.create_future()  # type: asyncio.Future[None]
 
     @property
@@ -56,6 +60,25 @@ class ResponseHandler(BaseProtocol, DataQueue[Tuple[RawResponseMessage, StreamRe
             or bool(self._tail)
         )
 
+    @property
+    def expired(self) -> bool:
+        """True if the connection outlived its lifetime limits."""
+        if self._requests_left is not None and self._requests_left <= 0:
+            return True
+        return self._expires_at is not None and self._loop.time() >= self._expires_at
+
+    def limit_lifetime(
+        self, max_age: Optional[float] = None, max_requests: Optional[int] = None
+    ) -> None:
+        """Expire the connection after max_age seconds or max_requests requests."""
+        if max_age is not None:
+            self._expires_at = self._loop.time() + max_age
+        self._requests_left = max_requests
+
+    def start_request(self) -> None:
+        if self._requests_left is not None:
+            self._requests_left -= 1
+
     def force_close(self) -> None:
         self._should_close = True
 
@@ -54,6 +54,7 @@ from .log import client_logger
 from .streams import StreamReader
 from .typedefs import (
     DEFAULT_JSON_DECODER,
+    JSONBytesDecoder,
     JSONDecoder,
     LooseCookies,
     LooseHeaders,
@@ -991,10 +992,13 @@ class ClientResponse(HeadersMixin):
                 encoding = None
         if not encoding:
             if mimetype.type == "application" and (
-                mimetype.subtype == "json" or mimetype.subtype == "rdap"
+                mimetype.subtype == "json"
+                or mimetype.subtype == "rdap"
+                or mimetype.suffix == "json"
             ):
                 # RFC 7159 states that the default encoding is UTF-8.
                 # RFC 7483 defines application/rdap+json
+                # RFC 6839 defines +json structured syntax suffix
                 encoding = "utf-8"
             elif self._body is None:
                 raise RuntimeError(
@@ -1023,8 +1027,14 @@ class ClientResponse(HeadersMixin):
         encoding: Optional[str] = None,
         loads: JSONDecoder = DEFAULT_JSON_DECODER,
         content_type: Optional[str] = "application/json",
+        loads_bytes: Optional[bool] = None,
     ) -> Any:
-        """Read and decodes JSON response."""
+        """Read and decodes JSON response.
+
+        The body is passed to loads as bytes without decoding to str
+        if loads_bytes is True and the encoding is UTF-8.
+        None means autodetection for json, orjson and ujson loads.
+        """
         if self._body is None:
             await self.read()
 
@@ -1043,6 +1053,11 @@ class ClientResponse(HeadersMixin):
         if encoding is None:
             encoding = self.get_encoding()
 
+        if loads_bytes is None:
+            loads_bytes = helpers.is_bytes_json_decoder(loads)
+        if loads_bytes and helpers.is_utf8(encoding):
+            return cast(JSONBytesDecoder, loads)(self._body)  # type: ignore
+
         return loads(self._body.decode(encoding))  # type: ignore
 
     async def __aenter__(self) -> "ClientResponse":
@@ -2,14 +2,16 @@ import asyncio
 import dataclasses
 import functools
 import logging
+import math
 import random
+import socket
 import sys
 import traceback
 import warnings
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from contextlib import suppress
 from http.cookies import SimpleCookie
-from itertools import cycle, islice
+from itertools import cycle, islice, zip_longest
 from time import monotonic
 from types import TracebackType
 from typing import (  # noqa
@@ -17,7 +19,9 @@ from typing import (  # noqa
     Any,
     Awaitable,
     Callable,
+    Coroutine,
     DefaultDict,
+    Deque,
     Dict,
     Iterator,
     List,
@@ -29,6 +33,8 @@ from typing import (  # noqa
     cast,
 )
 
+from yarl import URL
+
 from . import hdrs, helpers
 from .abc import AbstractResolver
 from .client_exceptions import (
@@ -45,10 +51,11 @@ from .client_exceptions import (
 )
 from .client_proto import ResponseHandler
 from .client_reqrep import SSL_ALLOWED_TYPES, ClientRequest, Fingerprint
-from .helpers import _SENTINEL, ceil_timeout, is_ip_address, sentinel
+from .helpers import _SENTINEL, BasicAuth, ceil_timeout, is_ip_address, sentinel
 from .http import RESPONSES
 from .locks import EventResultOrError
 from .resolver import DefaultResolver
+from .typedefs import LooseHeaders, StrOrURL
 
 try:
     import ssl
@@ -171,6 +178,15 @@ class BaseConnector:
     limit_per_host - Number of simultaneous connections to one host.
     enable_cleanup_closed - Enables clean-up closed ssl transports.
                             Disabled by default.
+    reuse_policy - Order of reusing idle connections, "lifo" (default)
+                   or "fifo".
+    max_connection_age - Close connections older than this amount of
+                         seconds on releasing, None (default) to disable.
+    max_requests_per_connection - Close connections on releasing after
+                                  this number of requests, None (default)
+                                  to disable.
+    lifetime_jitter - Fraction the lifetime limits are randomly lowered
+                      by for every connection, 0.1 by default.
     loop - Optional event loop.
     """
 
@@ -188,6 +204,10 @@ class BaseConnector:
         limit: int = 100,
         limit_per_host: int = 0,
         enable_cleanup_closed: bool = False,
+        reuse_policy: str = "lifo",
+        max_connection_age: Optional[float] = None,
+        max_requests_per_connection: Optional[int] = None,
+        lifetime_jitter: float = 0.1,
     ) -> None:
 
         if force_close:
@@ -198,6 +218,16 @@ class BaseConnector:
         else:
             if keepalive_timeout is sentinel:
                 keepalive_timeout = 15.0
+        if reuse_policy not in ("lifo", "fifo"):
+            raise ValueError(
+                f"reuse_policy should be 'lifo' or 'fifo', got {reuse_policy!r}"
+            )
+        if max_connection_age is not None and max_connection_age <= 0:
+            raise ValueError("max_connection_age should be positive")
+        if max_requests_per_connection is not None and max_requests_per_connection < 1:
+            raise ValueError("max_requests_per_connection should be positive")
+        if not 0 <= lifetime_jitter < 1:
+            raise ValueError("lifetime_jitter should be in [0, 1) range")
 
         loop = asyncio.get_running_loop()
 
@@ -205,9 +235,23 @@ class BaseConnector:
         if loop.get_debug():
             self._source_traceback = traceback.extract_stack(sys._getframe(1))
 
+        # idle connections per key, ordered by release time
         self._conns = (
             {}
-        )  # type: Dict[ConnectionKey, List[Tuple[ResponseHandler, float]]]
+        )  # type: Dict[ConnectionKey, Deque[Tuple[ResponseHandler, float]]]
+        # all idle connections ordered by release time, the keep-alive
+        # timeout is the same for every connection so the first ones
+        # expire first and _cleanup() stops at the first alive one
+        self._conns_order = (
+            OrderedDict()
+        )  # type: OrderedDict[ResponseHandler, Tuple[ConnectionKey, float]]
+        self._reuse_policy = reuse_policy
+        self._max_connection_age = max_connection_age
+        self._max_requests_per_connection = max_requests_per_connection
+        self._lifetime_jitter = lifetime_jitter
+        self._limit_lifetime = (
+            max_connection_age is not None or max_requests_per_connection is not None
+        )
         self._limit = limit
         self._limit_per_host = limit_per_host
         self._acquired = set()  # type: Set[ResponseHandler]
@@ -217,8 +261,17 @@ class BaseConnector:
         self._keepalive_timeout = cast(float, keepalive_timeout)
         self._force_close = force_close
 
-        # {host_key: FIFO list of waiters}
+        # {host_key: FIFO list of waiters}, the dict order is a round-robin
+        # ring of keys served by _release_waiter()
         self._waiters = defaultdict(deque)  # type: ignore
+        # waiters of keys which reached limit_per_host, a key is moved back
+        # to the ring when a connection of the key is released
+        self._waiters_parked = (
+            {}
+        )  # type: Dict[ConnectionKey, Deque[asyncio.Future[None]]]
+        # {host_key: number of waiters woken up but not resumed yet}, the
+        # key stays registered so new requests do not take their slots
+        self._waiters_woken = {}  # type: Dict[ConnectionKey, int]
 
         self._loop = loop
         self._factory = functools.partial(ResponseHandler, loop=loop)
@@ -290,6 +343,38 @@ class BaseConnector:
         """
         return self._limit_per_host
 
+    @property
+    def reuse_policy(self) -> str:
+        """Order of reusing idle connections.
+
+        "lifo" reuses the most recently released connection and keeps
+        a hot subset of connections warm, "fifo" reuses the least
+        recently released one and spreads requests over all of them.
+        """
+        return self._reuse_policy
+
+    @property
+    def max_connection_age(self) -> Optional[float]:
+        """Seconds after which a connection is closed on releasing."""
+        return self._max_connection_age
+
+    @property
+    def max_requests_per_connection(self) -> Optional[int]:
+        """Number of requests after which a connection is closed on releasing."""
+        return self._max_requests_per_connection
+
+    def _setup_lifetime(self, proto: ResponseHandler) -> None:
+        # lower the limits randomly so connections created at the same
+        # time are not closed at once
+        jitter = self._lifetime_jitter
+        max_age = self._max_connection_age
+        if max_age is not None:
+            max_age *= 1 - jitter * random.random()
+        max_requests = self._max_requests_per_connection
+        if max_requests is not None:
+            max_requests = max(1, round(max_requests * (1 - jitter * random.random())))
+        proto.limit_lifetime(max_age, max_requests)
+
     def _cleanup(self) -> None:
         """Cleanup unused transports."""
         if self._cleanup_handle:
@@ -301,30 +386,25 @@ class BaseConnector:
         now = self._loop.time()
         timeout = self._keepalive_timeout
 
-        if self._conns:
-            connections = {}
+        if self._conns_order:
             deadline = now - timeout
-            for key, conns in self._conns.items():
-                alive = []
-                for proto, use_time in conns:
-                    if proto.is_connected():
-                        if use_time - deadline < 0:
-                            transport = proto.transport
-                            proto.close()
-                            if key.is_ssl and not self._cleanup_closed_disabled:
-                                self._cleanup_closed_transports.append(transport)
-                        else:
-                            alive.append((proto, use_time))
-                    else:
-                        transport = proto.transport
-                        proto.close()
-                        if key.is_ssl and not self._cleanup_closed_disabled:
-                            self._cleanup_closed_transports.append(transport)
-
-                if alive:
-                    connections[key] = alive
-
-            self._conns = connections
+            conns_order = self._conns_order
+            # only expired connections are visited, a disconnected one
+            # is dropped when it expires or when _get() picks it
+            while conns_order:
+                proto, (key, use_time) = next(iter(conns_order.items()))
+                if use_time - deadline >= 0:
+                    break
+                del conns_order[proto]
+                conns = self._conns[key]
+                # per key connections are ordered by release time as well
+                conns.popleft()
+                if not conns:
+                    del self._conns[key]
+                transport = proto.transport
+                proto.close()
+                if key.is_ssl and not self._cleanup_closed_disabled:
+                    self._cleanup_closed_transports.append(transport)
 
         if self._conns:
             self._cleanup_handle = helpers.weakref_handle(
@@ -341,6 +421,9 @@ class BaseConnector:
         conns.remove(val)
         if not conns:
             del self._acquired_per_host[key]
+        parked = self._waiters_parked.pop(key, None)
+        if parked is not None:
+            self._waiters[key].extend(parked)
 
     def _cleanup_closed(self) -> None:
         """Double confirmation for transport close.
@@ -408,8 +491,11 @@ class BaseConnector:
 
         finally:
             self._conns.clear()
+            self._conns_order.clear()
             self._acquired.clear()
             self._waiters.clear()
+            self._waiters_parked.clear()
+            self._waiters_woken.clear()
             self._cleanup_handle = None
             self._cleanup_closed_transports.clear()
             self._cleanup_closed_handle = None
@@ -464,11 +550,14 @@ class BaseConnector:
 
         # Wait if there are no available connections or if there are/were
         # waiters (i.e. don't steal connection from a waiter about to wake up)
-        if available <= 0 or key in self._waiters:
+        if available <= 0 or self._has_waiters(key):
             fut = self._loop.create_future()
 
             # This connection will now count towards the limit.
-            self._waiters[key].append(fut)
+            waiters = self._waiters_parked.get(key)
+            if waiters is None:
+                waiters = self._waiters[key]
+            waiters.append(fut)
 
             if traces:
                 for trace in traces:
@@ -477,18 +566,28 @@ class BaseConnector:
             try:
                 await fut
             except BaseException as e:
-                if key in self._waiters:
-                    # remove a waiter even if it was cancelled, normally it's
-                    #  removed when it's notified
-                    try:
-                        self._waiters[key].remove(fut)
-                    except ValueError:  # fut may no longer be in list
-                        pass
+                # remove a waiter even if it was cancelled, normally it's
+                #  removed when it's notified
+                for queues in (self._waiters, self._waiters_parked):
+                    if key in queues:
+                        try:
+                            queues[key].remove(fut)
+                        except ValueError:  # fut may no longer be in list
+                            pass
 
                 raise e
             finally:
                 if key in self._waiters and not self._waiters[key]:
                     del self._waiters[key]
+                if key in self._waiters_parked and not self._waiters_parked[key]:
+                    del self._waiters_parked[key]
+                if fut.done() and not fut.cancelled():
+                    woken = self._waiters_woken.get(key)
+                    if woken is not None:
+                        if woken > 1:
+                            self._waiters_woken[key] = woken - 1
+                        else:
+                            del self._waiters_woken[key]
 
             if traces:
                 for trace in traces:
@@ -519,6 +618,8 @@ class BaseConnector:
                 if not self._closed:
                     self._acquired.remove(placeholder)
                     self._drop_acquired_per_host(key, placeholder)
+                if self._limit_lifetime:
+                    self._setup_lifetime(proto)
 
             if traces:
                 for trace in traces:
@@ -536,8 +637,120 @@ class BaseConnector:
 
         self._acquired.add(proto)
         self._acquired_per_host[key].add(proto)
+        if self._limit_lifetime:
+            proto.start_request()
         return Connection(self, key, proto, self._loop)
 
+    async def prewarm(
+        self,
+        url: StrOrURL,
+        n: int = 32,
+        *,
+        top_up: bool = False,
+        timeout: Optional["ClientTimeout"] = None,
+        ssl: Union[SSLContext, bool, Fingerprint, None] = None,
+        proxy: Optional[StrOrURL] = None,
+        proxy_auth: Optional[BasicAuth] = None,
+        proxy_headers: Optional[LooseHeaders] = None,
+    ) -> int:
+        """Open connections to url in parallel and put them to the pool.
+
+        Up to n connections are opened within limit and limit_per_host.
+        If top_up is True only connections missing to have n idle
+        connections to the host are opened. This is a one-shot top-up,
+        idle connections closed later by keepalive_timeout or by the
+        server are not replaced. Return the number of opened connections.
+
+        ssl and proxy parameters should be the same as of the requests
+        the connections are opened for, they are a part of the pool key.
+        """
+        if n < 1:
+            raise ValueError("n should be positive")
+        if self._closed:
+            raise ClientConnectionError("Connector is closed.")
+        if timeout is None:
+            from .client import DEFAULT_TIMEOUT  # circular import
+
+            timeout = DEFAULT_TIMEOUT
+
+        req = ClientRequest(
+            hdrs.METH_GET,
+            URL(url),
+            loop=self._loop,
+            ssl=ssl,
+            proxy=URL(proxy) if proxy is not None else None,
+            proxy_auth=proxy_auth,
+            proxy_headers=proxy_headers,
+        )
+        key = req.connection_key
+        if top_up:
+            n -= len(self._conns.get(key, ()))
+        if self._limit or self._limit_per_host:
+            # do not take connections of waiting requests
+            if self._has_waiters(key):
+                return 0
+            if self._limit:
+                n = min(n, self._limit - len(self._acquired))
+            if self._limit_per_host:
+                acquired = len(self._acquired_per_host.get(key, ()))
+                n = min(n, self._limit_per_host - acquired)
+        if n < 1 or self._force_close:
+            return 0
+
+        # opened connections count towards the limits
+        placeholders = []
+        for i in range(n):
+            placeholder = cast(ResponseHandler, _TransportPlaceholder(self._loop))
+            self._acquired.add(placeholder)
+            self._acquired_per_host[key].add(placeholder)
+            placeholders.append(placeholder)
+
+        async def create(timeout: "ClientTimeout") -> ResponseHandler:
+            async with ceil_timeout(timeout.connect):
+                return await self._create_connection(req, [], timeout)
+
+        tasks = [self._loop.create_task(create(timeout)) for i in range(n)]
+        try:
+            await asyncio.wait(tasks)
+        except BaseException:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.exception() is None:
+                    task.result().close()
+            raise
+        finally:
+            if not self._closed:
+                for placeholder in placeholders:
+                    self._acquired.remove(placeholder)
+                    self._drop_acquired_per_host(key, placeholder)
+
+        opened = 0
+        error = None  # type: Optional[BaseException]
+        for task in tasks:
+            if task.cancelled():
+                continue
+            exc = task.exception()
+            if exc is not None:
+                error = error or exc
+                continue
+            proto = task.result()
+            if self._closed:
+                proto.close()
+                continue
+            if self._limit_lifetime:
+                self._setup_lifetime(proto)
+            self._acquired.add(proto)
+            self._acquired_per_host[key].add(proto)
+            self._release(key, proto)
+            opened += 1
+
+        if not self._closed:
+            self._release_waiter()
+        if not opened and error is not None:
+            raise error
+        return opened
+
     def _get(self, key: "ConnectionKey") -> Optional[ResponseHandler]:
         try:
             conns = self._conns[key]
@@ -545,10 +758,14 @@ class BaseConnector:
             return None
 
         t1 = self._loop.time()
+        pop = conns.popleft if self._reuse_policy == "fifo" else conns.pop
         while conns:
-            proto, t0 = conns.pop()
+            proto, t0 = pop()
+            self._conns_order.pop(proto, None)
             if proto.is_connected():
-                if t1 - t0 > self._keepalive_timeout:
+                if t1 - t0 > self._keepalive_timeout or (
+                    self._limit_lifetime and proto.expired
+                ):
                     transport = proto.transport
                     proto.close()
                     # only for SSL transports
@@ -569,28 +786,45 @@ class BaseConnector:
         del self._conns[key]
         return None
 
+    def _has_waiters(self, key: "ConnectionKey") -> bool:
+        return (
+            key in self._waiters
+            or key in self._waiters_parked
+            or key in self._waiters_woken
+        )
+
     def _release_waiter(self) -> None:
         """
-        Iterates over all waiters till found one that is not finsihed and
-        belongs to a host that has available connections.
+        Wake up the first not finished waiter of the first key in the
+        round-robin ring that has available connections.
+
+        A key served is moved to the end of the ring. Keys that reached
+        limit_per_host are parked until a connection of the key is
+        released, so every key is skipped at most once and a call costs
+        amortized O(1) regardless of the amount of waiting hosts.
         """
-        if not self._waiters:
+        waiters_ring = self._waiters
+        if not waiters_ring:
+            return
+        if self._limit and len(self._acquired) >= self._limit:
             return
 
-        # Having the dict keys ordered this avoids to iterate
-        # at the same order at each call.
-        queues = list(self._waiters.keys())
-        random.shuffle(queues)
-
-        for key in queues:
+        while waiters_ring:
+            key = next(iter(waiters_ring))
+            waiters = waiters_ring.pop(key)
             if self._available_connections(key) < 1:
+                self._waiters_parked[key] = waiters
                 continue
 
-            waiters = self._waiters[key]
             while waiters:
                 waiter = waiters.popleft()
                 if not waiter.done():
                     waiter.set_result(None)
+                    woken = self._waiters_woken
+                    woken[key] = woken.get(key, 0) + 1
+                    if waiters:
+                        # to the end of the ring
+                        waiters_ring[key] = waiters
                     return
 
     def _release_acquired(self, key: "ConnectionKey", proto: ResponseHandler) -> None:
@@ -624,17 +858,23 @@ class BaseConnector:
         if self._force_close:
             should_close = True
 
-        if should_close or protocol.should_close:
+        if (
+            should_close
+            or protocol.should_close
+            or (self._limit_lifetime and protocol.expired)
+        ):
             transport = protocol.transport
             protocol.close()
 
             if key.is_ssl and not self._cleanup_closed_disabled:
                 self._cleanup_closed_transports.append(transport)
         else:
+            now = self._loop.time()
             conns = self._conns.get(key)
             if conns is None:
-                conns = self._conns[key] = []
-            conns.append((protocol, self._loop.time()))
+                conns = self._conns[key] = deque()
+            conns.append((protocol, now))
+            self._conns_order[protocol] = (key, now)
 
             if self._cleanup_handle is None:
                 self._cleanup_handle = helpers.weakref_handle(
@@ -647,45 +887,119 @@ class BaseConnector:
         raise NotImplementedError()
 
 
+def _interleave_hosts(
+    hosts: List[Dict[str, Any]], first_family_count: int
+) -> List[Dict[str, Any]]:
+    """Interleave resolved hosts by address family, RFC 8305 section 4."""
+    families = {}  # type: Dict[int, List[Dict[str, Any]]]
+    for hinfo in hosts:
+        families.setdefault(hinfo["family"], []).append(hinfo)
+    groups = list(families.values())
+    if len(groups) < 2:
+        return hosts
+    result = groups[0][: first_family_count - 1]
+    groups[0] = groups[0][first_family_count - 1 :]
+    for items in zip_longest(*groups):
+        result.extend(item for item in items if item is not None)
+    return result
+
+
 class _DNSCacheTable:
-    def __init__(self, ttl: Optional[float] = None) -> None:
+    """Resolved addresses by (host, port), least recently used first.
+
+    An entry lives for the TTL of its records if the resolver provides
+    one, clamped to *min_ttl* and *ttl*, and for *ttl* otherwise. Adding
+    more than *max_size* entries evicts the least recently used ones.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        *,
+        min_ttl: float = 0,
+        max_size: Optional[int] = None,
+    ) -> None:
         self._addrs_rr = (
-            {}
-        )  # type: Dict[Tuple[str, int], Tuple[Iterator[Dict[str, Any]], int]]
-        self._timestamps = {}  # type: Dict[Tuple[str, int], float]
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[str, int], Tuple[Iterator[Dict[str, Any]], int]]
+        self._expires = {}  # type: Dict[Tuple[str, int], float]
         self._ttl = ttl
+        self._min_ttl = min_ttl
+        self._max_size = max_size
+        self.evictions = 0
 
     def __contains__(self, host: object) -> bool:
         return host in self._addrs_rr
 
-    def add(self, key: Tuple[str, int], addrs: List[Dict[str, Any]]) -> None:
+    def __len__(self) -> int:
+        return len(self._addrs_rr)
+
+    def add(
+        self,
+        key: Tuple[str, int],
+        addrs: List[Dict[str, Any]],
+        ttl: Optional[float] = None,
+    ) -> None:
         self._addrs_rr[key] = (cycle(addrs), len(addrs))
+        self._addrs_rr.move_to_end(key)
 
-        if self._ttl:
-            self._timestamps[key] = monotonic()
+        if ttl is None:
+            ttl = self._ttl
+        else:
+            ttl = max(ttl, self._min_ttl)
+            if self._ttl is not None:
+                ttl = min(ttl, self._ttl)
+        if ttl is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = monotonic() + ttl
+
+        if self._max_size is not None:
+            while len(self._addrs_rr) > self._max_size:
+                evicted, _ = self._addrs_rr.popitem(last=False)
+                self._expires.pop(evicted, None)
+                self.evictions += 1
 
     def remove(self, key: Tuple[str, int]) -> None:
         self._addrs_rr.pop(key, None)
-
-        if self._ttl:
-            self._timestamps.pop(key, None)
+        self._expires.pop(key, None)
 
     def clear(self) -> None:
         self._addrs_rr.clear()
-        self._timestamps.clear()
+        self._expires.clear()
 
     def next_addrs(self, key: Tuple[str, int]) -> List[Dict[str, Any]]:
         loop, length = self._addrs_rr[key]
+        self._addrs_rr.move_to_end(key)
         addrs = list(islice(loop, length))
         # Consume one more element to shift internal state of `cycle`
         next(loop)
         return addrs
 
     def expired(self, key: Tuple[str, int]) -> bool:
-        if self._ttl is None:
-            return False
+        return self.ttl_left(key) < 0
 
-        return self._timestamps[key] + self._ttl < monotonic()
+    def ttl_left(self, key: Tuple[str, int]) -> float:
+        """Seconds until the entry expires, negative for an expired one."""
+        expires = self._expires.get(key)
+        if expires is None:
+            return math.inf
+
+        return expires - monotonic()
+
+
+# getaddrinfo() errors meaning the host does not exist
+_HOST_NOT_FOUND_ERRORS = frozenset(
+    [socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)]
+)
+
+
+def _host_not_found(exc: BaseException) -> bool:
+    return isinstance(exc, socket.gaierror) and exc.errno in _HOST_NOT_FOUND_ERRORS
+
+
+# seconds a host is not resolved in background after a failed refresh
+_DNS_REFRESH_BACKOFF = 1.0
 
 
 class TCPConnector(BaseConnector):
@@ -700,8 +1014,27 @@ class TCPConnector(BaseConnector):
         resolver
     use_dns_cache - Use memory cache for DNS lookups.
     ttl_dns_cache - Max seconds having cached a DNS entry, None forever.
+    ttl_dns_min - Min seconds having cached a DNS entry if the resolver
+                  provides TTLs of records.
+    dns_cache_size - Max number of cached DNS entries, least recently
+                     used entries are evicted, None for no limit.
+    dns_refresh_window - Seconds before expiry of a cached DNS entry when
+                         using the entry starts resolving the host again
+                         in background.
+    dns_stale_grace - Seconds an expired DNS entry is still used while the
+                      host is being resolved again or if it cannot be,
+                      a failed refresh is retried after a second.
+    ttl_dns_negative - Seconds to cache "host not found" errors, None
+                       (default) to not cache them.
     family - socket address family
     local_addr - local tuple of (host, port) to bind socket to
+    happy_eyeballs_delay - Seconds to wait for a connection attempt
+                           before starting the next one in parallel,
+                           0.25 by default, None to try hosts one by one.
+    interleave - Number of addresses of the first address family tried
+                 before alternating families, 1 by default if
+                 happy_eyeballs_delay is set, 0 to keep the resolver
+                 order.
 
     keepalive_timeout - (optional) Keep-alive timeout.
     force_close - Set to True to force close and do reconnect
@@ -710,6 +1043,15 @@ class TCPConnector(BaseConnector):
     limit_per_host - Number of simultaneous connections to one host.
     enable_cleanup_closed - Enables clean-up closed ssl transports.
                             Disabled by default.
+    reuse_policy - Order of reusing idle connections, "lifo" (default)
+                   or "fifo".
+    max_connection_age - Close connections older than this amount of
+                         seconds on releasing, None (default) to disable.
+    max_requests_per_connection - Close connections on releasing after
+                                  this number of requests, None (default)
+                                  to disable.
+    lifetime_jitter - Fraction the lifetime limits are randomly lowered
+                      by for every connection, 0.1 by default.
     loop - Optional event loop.
     """
 
@@ -727,6 +1069,17 @@ class TCPConnector(BaseConnector):
         limit: int = 100,
         limit_per_host: int = 0,
         enable_cleanup_closed: bool = False,
+        reuse_policy: str = "lifo",
+        max_connection_age: Optional[float] = None,
+        max_requests_per_connection: Optional[int] = None,
+        lifetime_jitter: float = 0.1,
+        happy_eyeballs_delay: Optional[float] = 0.25,
+        interleave: Optional[int] = None,
+        dns_refresh_window: float = 0,
+        dns_stale_grace: float = 0,
+        ttl_dns_negative: Optional[float] = None,
+        ttl_dns_min: float = 0,
+        dns_cache_size: Optional[int] = 10000,
     ) -> None:
         super().__init__(
             keepalive_timeout=keepalive_timeout,
@@ -734,6 +1087,10 @@ class TCPConnector(BaseConnector):
             limit=limit,
             limit_per_host=limit_per_host,
             enable_cleanup_closed=enable_cleanup_closed,
+            reuse_policy=reuse_policy,
+            max_connection_age=max_connection_age,
+            max_requests_per_connection=max_requests_per_connection,
+            lifetime_jitter=lifetime_jitter,
         )
 
         if not isinstance(ssl, SSL_ALLOWED_TYPES):
@@ -747,16 +1104,46 @@ class TCPConnector(BaseConnector):
         self._resolver = resolver
 
         self._use_dns_cache = use_dns_cache
-        self._cached_hosts = _DNSCacheTable(ttl=ttl_dns_cache)
+        if ttl_dns_min < 0:
+            raise ValueError("ttl_dns_min should not be negative")
+        if dns_cache_size is not None and dns_cache_size < 1:
+            raise ValueError("dns_cache_size should be positive or None")
+        self._cached_hosts = _DNSCacheTable(
+            ttl=ttl_dns_cache, min_ttl=ttl_dns_min, max_size=dns_cache_size
+        )
         self._throttle_dns_events = (
             {}
         )  # type: Dict[Tuple[str, int], EventResultOrError]
+        if dns_refresh_window < 0 or dns_stale_grace < 0:
+            raise ValueError(
+                "dns_refresh_window and dns_stale_grace should not be negative"
+            )
+        self._dns_refresh_window = dns_refresh_window
+        self._dns_stale_grace = dns_stale_grace
+        self._dns_refresh_tasks = set()  # type: Set[asyncio.Task[None]]
+        # {(host, port): time of the last failed background refresh}
+        self._dns_refresh_failures = {}  # type: Dict[Tuple[str, int], float]
+        self._ttl_dns_negative = ttl_dns_negative
+        # {(host, port): (error, expiration time)}
+        self._dns_negative = (
+            {}
+        )  # type: Dict[Tuple[str, int], Tuple[BaseException, float]]
         self._family = family
         self._local_addr = local_addr
+        if happy_eyeballs_delay is not None and happy_eyeballs_delay < 0:
+            raise ValueError("happy_eyeballs_delay should not be negative")
+        self._happy_eyeballs_delay = happy_eyeballs_delay
+        if interleave is None:
+            interleave = 1 if happy_eyeballs_delay is not None else 0
+        elif interleave < 0:
+            raise ValueError("interleave should not be negative")
+        self._interleave = interleave
 
     def _close_immediately(self) -> List["asyncio.Future[None]"]:
         for ev in self._throttle_dns_events.values():
             ev.cancel()
+        for task in self._dns_refresh_tasks:
+            task.cancel()
         return super()._close_immediately()
 
     @property
@@ -769,16 +1156,23 @@ class TCPConnector(BaseConnector):
         """True if local DNS caching is enabled."""
         return self._use_dns_cache
 
+    @property
+    def dns_cache_evictions(self) -> int:
+        """Number of DNS entries evicted from the full cache."""
+        return self._cached_hosts.evictions
+
     def clear_dns_cache(
         self, host: Optional[str] = None, port: Optional[int] = None
     ) -> None:
         """Remove specified host/port or clear all dns local cache."""
         if host is not None and port is not None:
             self._cached_hosts.remove((host, port))
+            self._dns_negative.pop((host, port), None)
         elif host is not None or port is not None:
             raise ValueError("either both host and port " "or none of them are allowed")
         else:
             self._cached_hosts.clear()
+            self._dns_negative.clear()
 
     async def _resolve_host(
         self, host: str, port: int, traces: Optional[List["Trace"]] = None
@@ -811,14 +1205,31 @@ class TCPConnector(BaseConnector):
 
         key = (host, port)
 
-        if (key in self._cached_hosts) and (not self._cached_hosts.expired(key)):
-            # get result early, before any await (#4014)
-            result = self._cached_hosts.next_addrs(key)
+        if key in self._cached_hosts:
+            ttl_left = self._cached_hosts.ttl_left(key)
+            if ttl_left + self._dns_stale_grace >= 0:
+                # get result early, before any await (#4014)
+                result = self._cached_hosts.next_addrs(key)
 
-            if traces:
-                for trace in traces:
-                    await trace.send_dns_cache_hit(host)
-            return result
+                if (
+                    ttl_left < self._dns_refresh_window
+                    and key not in self._throttle_dns_events
+                ):
+                    failed = self._dns_refresh_failures.get(key)
+                    if failed is None or monotonic() >= failed + _DNS_REFRESH_BACKOFF:
+                        self._refresh_host(key)
+
+                if traces:
+                    for trace in traces:
+                        await trace.send_dns_cache_hit(host, stale=ttl_left < 0)
+                return result
+
+        negative = self._dns_negative.get(key)
+        if negative is not None:
+            exc, expires = negative
+            if expires >= monotonic():
+                raise exc.with_traceback(None)
+            del self._dns_negative[key]
 
         if key in self._throttle_dns_events:
             # get event early, before any await (#4014)
@@ -833,28 +1244,54 @@ class TCPConnector(BaseConnector):
             if traces:
                 for trace in traces:
                     await trace.send_dns_cache_miss(host)
-            try:
+            await self._resolve_and_cache(key, traces)
 
-                if traces:
-                    for trace in traces:
-                        await trace.send_dns_resolvehost_start(host)
+        return self._cached_hosts.next_addrs(key)
 
-                addrs = await self._resolver.resolve(host, port, family=self._family)
-                if traces:
-                    for trace in traces:
-                        await trace.send_dns_resolvehost_end(host)
+    async def _resolve_and_cache(
+        self, key: Tuple[str, int], traces: Optional[List["Trace"]]
+    ) -> None:
+        # the throttle event of the key is set by the caller
+        host, port = key
+        try:
 
-                self._cached_hosts.add(key, addrs)
-                self._throttle_dns_events[key].set()
-            except BaseException as e:
-                # any DNS exception, independently of the implementation
-                # is set for the waiters to raise the same exception.
-                self._throttle_dns_events[key].set(exc=e)
-                raise
-            finally:
-                self._throttle_dns_events.pop(key)
+            if traces:
+                for trace in traces:
+                    await trace.send_dns_resolvehost_start(host)
 
-        return self._cached_hosts.next_addrs(key)
+            addrs = await self._resolver.resolve(host, port, family=self._family)
+            if traces:
+                for trace in traces:
+                    await trace.send_dns_resolvehost_end(host)
+
+            ttls = [addr["ttl"] for addr in addrs if "ttl" in addr]
+            self._cached_hosts.add(key, addrs, min(ttls) if ttls else None)
+            self._dns_refresh_failures.pop(key, None)
+            self._throttle_dns_events[key].set()
+        except BaseException as e:
+            if self._ttl_dns_negative is not None and _host_not_found(e):
+                self._dns_negative[key] = (e, monotonic() + self._ttl_dns_negative)
+            # any DNS exception, independently of the implementation
+            # is set for the waiters to raise the same exception.
+            self._throttle_dns_events[key].set(exc=e)
+            raise
+        finally:
+            self._throttle_dns_events.pop(key)
+
+    def _refresh_host(self, key: Tuple[str, int]) -> None:
+        """Resolve a cached host again in background."""
+        self._throttle_dns_events[key] = EventResultOrError(self._loop)
+        task = self._loop.create_task(self._refresh_host_task(key))
+        self._dns_refresh_tasks.add(task)
+        task.add_done_callback(self._dns_refresh_tasks.discard)
+
+    async def _refresh_host_task(self, key: Tuple[str, int]) -> None:
+        try:
+            await self._resolve_and_cache(key, None)
+        except Exception:
+            # the stale entry is used until the grace period ends, back
+            # off instead of resolving again on every lookup meanwhile
+            self._dns_refresh_failures[key] = monotonic()
 
     async def _create_connection(
         self, req: "ClientRequest", traces: List["Trace"], timeout: "ClientTimeout"
@@ -987,44 +1424,138 @@ class TCPConnector(BaseConnector):
             # it is problem of resolving proxy ip itself
             raise ClientConnectorError(req.connection_key, exc) from exc
 
-        last_exc = None  # type: Optional[Exception]
-
-        for hinfo in hosts:
-            host = hinfo["host"]
-            port = hinfo["port"]
+        if not hosts:
+            # a custom resolver may return no addresses
+            raise ClientConnectorError(
+                req.connection_key, OSError("No addresses resolved for %s" % host)
+            )
 
-            try:
-                transp, proto = await self._wrap_create_connection(
-                    self._factory,
-                    host,
-                    port,
-                    timeout=timeout,
-                    ssl=sslcontext,
-                    family=hinfo["family"],
-                    proto=hinfo["proto"],
-                    flags=hinfo["flags"],
-                    server_hostname=hinfo["hostname"] if sslcontext else None,
-                    local_addr=self._local_addr,
-                    req=req,
-                    client_error=client_error,
-                )
-            except ClientConnectorError as exc:
-                last_exc = exc
-                continue
+        async def connect(
+            hinfo: Dict[str, Any]
+        ) -> Tuple[asyncio.Transport, ResponseHandler]:
+            transp, proto = await self._wrap_create_connection(
+                self._factory,
+                hinfo["host"],
+                hinfo["port"],
+                timeout=timeout,
+                ssl=sslcontext,
+                family=hinfo["family"],
+                proto=hinfo["proto"],
+                flags=hinfo["flags"],
+                server_hostname=hinfo["hostname"] if sslcontext else None,
+                local_addr=self._local_addr,
+                req=req,
+                client_error=client_error,
+            )
 
             if req.is_ssl() and fingerprint:
                 try:
                     fingerprint.check(transp)
-                except ServerFingerprintMismatch as exc:
+                except ServerFingerprintMismatch:
                     transp.close()
                     if not self._cleanup_closed_disabled:
                         self._cleanup_closed_transports.append(transp)
-                    last_exc = exc
-                    continue
+                    raise
 
             return transp, proto
-        assert last_exc is not None
-        raise last_exc
+
+        if self._interleave:
+            hosts = _interleave_hosts(hosts, self._interleave)
+        return await self._race_connections(hosts, connect, is_ssl=req.is_ssl())
+
+    async def _race_connections(
+        self,
+        hosts: List[Dict[str, Any]],
+        connect: Callable[
+            [Dict[str, Any]],
+            Coroutine[Any, Any, Tuple[asyncio.Transport, ResponseHandler]],
+        ],
+        *,
+        is_ssl: bool = False,
+    ) -> Tuple[asyncio.Transport, ResponseHandler]:
+        """Connect to the first reachable of hosts, RFC 8305 style.
+
+        The next attempt starts when happy_eyeballs_delay passes or an
+        attempt fails, the first established connection wins and the
+        other attempts are cancelled. Without the delay hosts are tried
+        one by one. hosts must not be empty.
+        """
+        assert hosts
+        delay = self._happy_eyeballs_delay
+        pending = (
+            set()
+        )  # type: Set[asyncio.Task[Tuple[asyncio.Transport, ResponseHandler]]]
+        indexes = {}  # type: Dict[asyncio.Future[Any], int]
+        errors = {}  # type: Dict[int, Exception]
+
+        def drop(
+            task: "asyncio.Task[Tuple[asyncio.Transport, ResponseHandler]]",
+        ) -> None:
+            # close a connection established after the race was decided
+            if not task.cancelled() and task.exception() is None:
+                self._drop_connection(task.result()[0], is_ssl)
+
+        def winner(
+            done: Set["asyncio.Task[Tuple[asyncio.Transport, ResponseHandler]]"],
+        ) -> Optional[Tuple[asyncio.Transport, ResponseHandler]]:
+            result = None
+            unexpected = None
+            for task in sorted(done, key=indexes.__getitem__):
+                exc = task.exception()
+                if exc is None:
+                    if result is None:
+                        result = task.result()
+                    else:
+                        drop(task)
+                elif isinstance(
+                    exc,
+                    (
+                        ClientConnectorError,
+                        ServerFingerprintMismatch,
+                        # sock_connect timeout, not an OSError before Python 3.11
+                        asyncio.TimeoutError,
+                    ),
+                ):
+                    errors[indexes[task]] = exc
+                elif unexpected is None:
+                    unexpected = exc
+            # an established connection wins over failures of the others
+            if result is None and unexpected is not None:
+                raise unexpected
+            return result
+
+        try:
+            for index, hinfo in enumerate(hosts):
+                task = self._loop.create_task(connect(hinfo))
+                indexes[task] = index
+                pending.add(task)
+                done, pending = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                result = winner(done)
+                if result is not None:
+                    return result
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                result = winner(done)
+                if result is not None:
+                    return result
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(drop)
+
+        # the error of the last host, like trying them one by one does
+        raise errors[max(errors)]
+
+    def _drop_connection(self, transport: asyncio.Transport, is_ssl: bool) -> None:
+        transport.close()
+        # only for SSL transports
+        if is_ssl and not self._cleanup_closed_disabled:
+            self._cleanup_closed_transports.append(transport)
 
     async def _create_proxy_connection(
         self, req: "ClientRequest", traces: List["Trace"], timeout: "ClientTimeout"
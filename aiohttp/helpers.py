@@ -4,6 +4,7 @@ import asyncio
 import base64
 import binascii
 import cgi
+import codecs
 import dataclasses
 import datetime
 import functools
@@ -19,7 +20,7 @@ from contextlib import suppress
 from http.cookies import SimpleCookie
 from math import ceil
 from pathlib import Path
-from types import TracebackType
+from types import MemberDescriptorType, TracebackType
 from typing import (
     Any,
     Callable,
@@ -410,6 +411,25 @@ def is_expected_content_type(
     return expected_content_type in response_content_type
 
 
+# loads() of these modules accept UTF-8 encoded bytes
+_BYTES_JSON_DECODER_MODULES = frozenset({"json", "orjson", "ujson"})
+
+
+def is_bytes_json_decoder(loads: Callable[..., Any]) -> bool:
+    """Check if loads is known to accept bytes."""
+    return (
+        getattr(loads, "__name__", None) == "loads"
+        and getattr(loads, "__module__", None) in _BYTES_JSON_DECODER_MODULES
+    )
+
+
+def is_utf8(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
 class _TSelf(Protocol):
     _cache: Dict[str, Any]
 
@@ -447,6 +467,46 @@ class reify(Generic[_T]):
 
 reify_py = reify
 
+
+class reify_slot(Generic[_T]):
+    """Use as a class method decorator like `reify`, the result of
+    the method is stored in the ``_<name>`` instance slot instead of
+    the ``_cache`` dict.
+
+    The slot should be declared in ``__slots__`` of the class, the
+    unset slot means the value is not evaluated yet.
+    """
+
+    def __init__(self, wrapped: Callable[..., _T]) -> None:
+        self.wrapped = wrapped
+        self.__doc__ = wrapped.__doc__
+        self.name = wrapped.__name__
+        self.slot = None  # type: Any
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        slot = getattr(owner, "_" + name, None)
+        if not isinstance(slot, MemberDescriptorType):
+            raise TypeError(
+                "{}.__slots__ should contain {!r} for reified property".format(
+                    owner.__name__, "_" + name
+                )
+            )
+        self.slot = slot
+
+    def __get__(self, inst: Any, owner: Optional[Type[Any]] = None) -> _T:
+        if inst is None:
+            return self  # type: ignore
+        try:
+            return self.slot.__get__(inst, owner)
+        except AttributeError:
+            val = self.wrapped(inst)
+            self.slot.__set__(inst, val)
+            return val
+
+    def __set__(self, inst: Any, value: _T) -> None:
+        raise AttributeError("reified property is read-only")
+
+
 try:
     from ._helpers import reify as reify_c
 
@@ -699,9 +759,9 @@ class HeadersMixin:
         super().__init__()
         self._content_type = None  # type: Optional[str]
         self._content_dict = None  # type: Optional[Dict[str, str]]
-        self._stored_content_type: Union[str, _SENTINEL] = sentinel
+        self._stored_content_type: Union[Optional[str], _SENTINEL] = sentinel
 
-    def _parse_content_type(self, raw: str) -> None:
+    def _parse_content_type(self, raw: Optional[str]) -> None:
         self._stored_content_type = raw
         if raw is None:
             # default value according to RFC 2616
@@ -710,10 +770,14 @@ class HeadersMixin:
         else:
             self._content_type, self._content_dict = cgi.parse_header(raw)
 
+    def _peek_header(self, name: str) -> Optional[str]:
+        """Return the first value of header *name* or None."""
+        return self._headers.get(name)  # type: ignore
+
     @property
     def content_type(self) -> str:
         """The value of content part for Content-Type HTTP header."""
-        raw = self._headers.get(hdrs.CONTENT_TYPE)  # type: ignore
+        raw = self._peek_header(hdrs.CONTENT_TYPE)
         if self._stored_content_type != raw:
             self._parse_content_type(raw)
         return self._content_type  # type: ignore
@@ -721,7 +785,7 @@ class HeadersMixin:
     @property
     def charset(self) -> Optional[str]:
         """The value of charset part for Content-Type HTTP header."""
-        raw = self._headers.get(hdrs.CONTENT_TYPE)  # type: ignore
+        raw = self._peek_header(hdrs.CONTENT_TYPE)
         if self._stored_content_type != raw:
             self._parse_content_type(raw)
         return self._content_dict.get("charset")  # type: ignore
@@ -729,7 +793,7 @@ class HeadersMixin:
     @property
     def content_length(self) -> Optional[int]:
         """The value of Content-Length HTTP header."""
-        content_length = self._headers.get(hdrs.CONTENT_LENGTH)  # type: ignore
+        content_length = self._peek_header(hdrs.CONTENT_LENGTH)
 
         if content_length is not None:
             return int(content_length)
@@ -794,6 +858,11 @@ class ChainMapProxy(Mapping[str, Any]):
 
 
 class CookieMixin:
+    # _cookies slot is provided by subclasses,
+    # HTTPException can't have non-empty slotted bases;
+    # __dict__ is allocated on the first attribute assignment only
+    __slots__ = ("__dict__",)
+
     def __init__(self) -> None:
         super().__init__()
         self._cookies = SimpleCookie()  # type: SimpleCookie[str]
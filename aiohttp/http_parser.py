@@ -8,8 +8,10 @@ from contextlib import suppress
 from enum import IntEnum
 from typing import (
     Any,
+    Dict,
     Generic,
     List,
+    Mapping,
     Optional,
     Pattern,
     Set,
@@ -69,6 +71,16 @@ METHRE: Final[Pattern[str]] = re.compile(r"[!#$%&'*+\-.^_`|~0-9A-Za-z]+")
 VERSRE: Final[Pattern[str]] = re.compile(r"HTTP/(\d+).(\d+)")
 HDRRE: Final[Pattern[bytes]] = re.compile(rb"[\x00-\x1F\x7F()<>@,;:\[\]={} \t\\\\\"]")
 
+# Headers the parser itself needs, they are extracted
+# from raw headers when the headers multidict is not built
+_FRAMEWORK_HEADERS: Final[Dict[bytes, istr]] = {
+    b"connection": hdrs.CONNECTION,
+    b"content-encoding": hdrs.CONTENT_ENCODING,
+    b"content-length": hdrs.CONTENT_LENGTH,
+    b"sec-websocket-key1": hdrs.SEC_WEBSOCKET_KEY1,
+    b"transfer-encoding": hdrs.TRANSFER_ENCODING,
+}
+
 RawRequestMessage = collections.namedtuple(
     "RawRequestMessage",
     [
@@ -134,7 +146,14 @@ class HeadersParser:
     def parse_headers(
         self, lines: List[bytes]
     ) -> Tuple["CIMultiDictProxy[str]", RawHeaders]:
-        headers = CIMultiDict()  # type: CIMultiDict[str]
+        raw_headers = self.parse_raw_headers(lines)
+        return (headers_from_raw(raw_headers), raw_headers)
+
+    def parse_raw_headers(self, lines: List[bytes]) -> RawHeaders:
+        """Parse headers into a sequence of (name, value) bytes pairs.
+
+        Names and values are not decoded, no multidict is built.
+        """
         raw_headers = []
 
         lines_idx = 1
@@ -205,13 +224,20 @@ class HeadersParser:
                     )
 
             bvalue = bvalue.strip()
-            name = bname.decode("utf-8", "surrogateescape")
-            value = bvalue.decode("utf-8", "surrogateescape")
-
-            headers.add(name, value)
             raw_headers.append((bname, bvalue))
 
-        return (CIMultiDictProxy(headers), tuple(raw_headers))
+        return tuple(raw_headers)
+
+
+def headers_from_raw(raw_headers: RawHeaders) -> "CIMultiDictProxy[str]":
+    """Build a case-insensitive multidict of decoded raw headers."""
+    headers = CIMultiDict()  # type: CIMultiDict[str]
+    for bname, bvalue in raw_headers:
+        headers.add(
+            bname.decode("utf-8", "surrogateescape"),
+            bvalue.decode("utf-8", "surrogateescape"),
+        )
+    return CIMultiDictProxy(headers)
 
 
 class HttpParser(abc.ABC, Generic[_MsgT]):
@@ -231,6 +257,7 @@ class HttpParser(abc.ABC, Generic[_MsgT]):
         response_with_body: bool = True,
         read_until_eof: bool = False,
         auto_decompress: bool = True,
+        lazy_headers: bool = False,
     ) -> None:
         self.protocol = protocol
         self.loop = loop
@@ -253,6 +280,9 @@ class HttpParser(abc.ABC, Generic[_MsgT]):
         self._auto_decompress = auto_decompress
         self._limit = limit
         self._headers_parser = HeadersParser(max_line_size, max_headers, max_field_size)
+        self._lazy_headers = lazy_headers
+        # the headers of the last parsed message used by the parser itself
+        self._framework_headers = {}  # type: Mapping[str, str]
 
     @abc.abstractmethod
     def parse_message(self, lines: List[bytes]) -> _MsgT:
@@ -317,17 +347,18 @@ class HttpParser(abc.ABC, Generic[_MsgT]):
                             self._lines.clear()
 
                         # payload length
-                        length = msg.headers.get(CONTENT_LENGTH)
-                        if length is not None:
+                        length = None  # type: Optional[int]
+                        content_length = self._framework_headers.get(CONTENT_LENGTH)
+                        if content_length is not None:
                             try:
-                                length = int(length)
+                                length = int(content_length)
                             except ValueError:
                                 raise InvalidHeader(CONTENT_LENGTH)
                             if length < 0:
                                 raise InvalidHeader(CONTENT_LENGTH)
 
                         # do not support old websocket spec
-                        if SEC_WEBSOCKET_KEY1 in msg.headers:
+                        if SEC_WEBSOCKET_KEY1 in self._framework_headers:
                             raise InvalidHeader(SEC_WEBSOCKET_KEY1)
 
                         self._upgraded = msg.upgrade
@@ -450,21 +481,43 @@ class HttpParser(abc.ABC, Generic[_MsgT]):
     def parse_headers(
         self, lines: List[bytes]
     ) -> Tuple[
-        "CIMultiDictProxy[str]", RawHeaders, Optional[bool], Optional[str], bool, bool
+        Optional["CIMultiDictProxy[str]"],
+        RawHeaders,
+        Optional[bool],
+        Optional[str],
+        bool,
+        bool,
     ]:
         """Parses RFC 5322 headers from a stream.
 
         Line continuations are supported. Returns list of header name
         and value pairs. Header name is in upper case.
+
+        In lazy headers mode the headers multidict is not built and
+        None is returned instead of it.
         """
-        headers, raw_headers = self._headers_parser.parse_headers(lines)
+        headers: Optional["CIMultiDictProxy[str]"]
+        found: Mapping[str, str]
+        if self._lazy_headers:
+            raw_headers = self._headers_parser.parse_raw_headers(lines)
+            headers = None
+            fields: Dict[str, str] = {}
+            for bname, bvalue in raw_headers:
+                name = _FRAMEWORK_HEADERS.get(bname.lower())
+                if name is not None and name not in fields:
+                    fields[name] = bvalue.decode("utf-8", "surrogateescape")
+            found = fields
+        else:
+            headers, raw_headers = self._headers_parser.parse_headers(lines)
+            found = headers
+        self._framework_headers = found
         close_conn = None
         encoding = None
         upgrade = False
         chunked = False
 
         # keep-alive
-        conn = headers.get(hdrs.CONNECTION)
+        conn = found.get(hdrs.CONNECTION)
         if conn:
             v = conn.lower()
             if v == "close":
@@ -475,14 +528,14 @@ class HttpParser(abc.ABC, Generic[_MsgT]):
                 upgrade = True
 
         # encoding
-        enc = headers.get(hdrs.CONTENT_ENCODING)
+        enc = found.get(hdrs.CONTENT_ENCODING)
         if enc:
             enc = enc.lower()
             if enc in ("gzip", "deflate", "br"):
                 encoding = enc
 
         # chunking
-        te = headers.get(hdrs.TRANSFER_ENCODING)
+        te = found.get(hdrs.TRANSFER_ENCODING)
         if te and "chunked" in te.lower():
             chunked = True
 
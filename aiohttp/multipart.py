@@ -59,6 +59,8 @@ __all__ = (
 if TYPE_CHECKING:  # pragma: no cover
     from .client_reqrep import ClientResponse
 
+_Decoder = Union["_Base64Decoder", "_QuotedPrintableDecoder", "_ZLibDecoder"]
+
 
 class BadContentDispositionHeader(RuntimeWarning):
     pass
@@ -245,6 +247,79 @@ class MultipartResponseWrapper:
         await self.resp.release()
 
 
+class _Base64Decoder:
+    """Incremental base64 decoder, incomplete quanta are kept till the
+    next chunk."""
+
+    __slots__ = ("_tail",)
+
+    pending = False
+
+    def __init__(self) -> None:
+        self._tail = b""
+
+    def decode(self, data: bytes) -> bytes:
+        data = self._tail + b"".join(data.split())
+        end = len(data) - len(data) % 4
+        self._tail = data[end:]
+        return base64.b64decode(data[:end])
+
+    def flush(self) -> bytes:
+        tail, self._tail = self._tail, b""
+        return base64.b64decode(tail) if tail else b""
+
+
+class _QuotedPrintableDecoder:
+    """Incremental quoted-printable decoder, a possibly incomplete escape
+    sequence or soft line break is kept till the next chunk."""
+
+    __slots__ = ("_tail",)
+
+    pending = False
+
+    def __init__(self) -> None:
+        self._tail = b""
+
+    def decode(self, data: bytes) -> bytes:
+        data = self._tail + data
+        end = data.find(b"=", len(data) - 2)
+        if end < 0:
+            end = len(data)
+        self._tail = data[end:]
+        return binascii.a2b_qp(data[:end])
+
+    def flush(self) -> bytes:
+        tail, self._tail = self._tail, b""
+        return binascii.a2b_qp(tail)
+
+
+class _ZLibDecoder:
+    """Incremental zlib decoder returning at most *max_length* bytes per
+    call, compressed data not decoded yet is kept till the next call."""
+
+    __slots__ = ("_decompressor", "_max_length")
+
+    def __init__(self, wbits: int, max_length: int) -> None:
+        self._decompressor = zlib.decompressobj(wbits=wbits)
+        self._max_length = max_length
+
+    @property
+    def pending(self) -> bool:
+        """True if decoding of the data passed so far is not finished."""
+        return bool(self._decompressor.unconsumed_tail)
+
+    def decode(self, data: bytes) -> bytes:
+        tail = self._decompressor.unconsumed_tail
+        if tail:
+            data = tail + data
+        return self._decompressor.decompress(data, self._max_length)
+
+    def flush(self) -> bytes:
+        if self.pending:
+            return b""
+        return self._decompressor.flush()
+
+
 class BodyPartReader:
     """Multipart reader for single body part."""
 
@@ -271,6 +346,8 @@ class BodyPartReader:
         self._prev_chunk = None  # type: Optional[bytes]
         self._content_eof = 0
         self._cache = {}  # type: Dict[str, Any]
+        # initialized on the first read_chunk(decode=True) call
+        self._decoders = None  # type: Optional[List[_Decoder]]
 
     def __aiter__(self) -> AsyncIterator["BodyPartReader"]:
         return self  # type: ignore
@@ -303,11 +380,19 @@ class BodyPartReader:
             return self.decode(data)
         return data
 
-    async def read_chunk(self, size: int = chunk_size) -> bytes:
+    async def read_chunk(
+        self, size: int = chunk_size, *, decode: bool = False
+    ) -> bytes:
         """Reads body part content chunk of the specified size.
 
         size: chunk size
+        decode: Decodes data following by encoding methods from
+                Content-Transfer-Encoding and Content-Encoding headers
+                incrementally, keeping incomplete data till the next chunk.
+                An empty result is returned only at the end of the part.
         """
+        if decode:
+            return await self._read_decoded_chunk(size)
         if self._at_eof:
             return b""
         if self._length:
@@ -350,6 +435,63 @@ class BodyPartReader:
             ), "reader did not read all the data or it is malformed"
         return chunk
 
+    async def _read_decoded_chunk(self, size: int) -> bytes:
+        decoders = self._decoders
+        if decoders is None:
+            decoders = self._decoders = self._get_decoders(size)
+        while True:
+            # a compressed chunk can expand a lot, the output is decoded
+            # by pieces before reading more data
+            pending = any(decoder.pending for decoder in decoders)
+            if pending:
+                chunk = b""
+            elif self._at_eof:
+                return b""
+            else:
+                chunk = await self.read_chunk(size)
+            for decoder in decoders:
+                chunk = decoder.decode(chunk)
+                if self._at_eof:
+                    chunk += decoder.flush()
+            if chunk:
+                return chunk
+
+    def _get_decoders(self, size: int) -> List["_Decoder"]:
+        decoders = []  # type: List[_Decoder]
+        encoding = self.headers.get(CONTENT_TRANSFER_ENCODING, "").lower()
+        if encoding == "base64":
+            decoders.append(_Base64Decoder())
+        elif encoding == "quoted-printable":
+            decoders.append(_QuotedPrintableDecoder())
+        elif encoding not in ("", "binary", "8bit", "7bit"):
+            raise RuntimeError(
+                "unknown content transfer encoding: {}" "".format(encoding)
+            )
+
+        encoding = self.headers.get(CONTENT_ENCODING, "").lower()
+        if encoding == "deflate":
+            decoders.append(_ZLibDecoder(-zlib.MAX_WBITS, size))
+        elif encoding == "gzip":
+            decoders.append(_ZLibDecoder(16 + zlib.MAX_WBITS, size))
+        elif encoding not in ("", "identity"):
+            raise RuntimeError(f"unknown content encoding: {encoding}")
+        return decoders
+
+    async def iter_chunked(
+        self, size: int = chunk_size, *, decode: bool = False
+    ) -> AsyncIterator[bytes]:
+        """Iterates over body part content by chunks of the specified size.
+
+        decode: Decodes data incrementally, see read_chunk()
+        """
+        while True:
+            chunk = await self.read_chunk(size, decode=decode)
+            if chunk:
+                yield chunk
+            elif self._at_eof:
+                # decoded data can be left after the end of the part
+                return
+
     async def _read_chunk_from_length(self, size: int) -> bytes:
         # Reads body part content chunk of the specified size.
         # The body part must has Content-Length header with proper value.
@@ -368,34 +510,52 @@ class BodyPartReader:
         if first_chunk:
             self._prev_chunk = await self._content.read(size)
 
+        boundary = self._newline + self._boundary
         chunk = await self._content.read(size)
+        # the boundary could be split between the chunks only
+        # if the look-ahead chunk is not shorter than the boundary
+        while chunk and len(chunk) < len(boundary) and not self._content.at_eof():
+            more = await self._content.read(size)
+            if not more:
+                break
+            chunk += more
         self._content_eof += int(self._content.at_eof())
         assert self._content_eof < 3, "Reading after EOF"
-        assert self._prev_chunk is not None
-        window = self._prev_chunk + chunk
+        prev_chunk = self._prev_chunk
+        assert prev_chunk is not None
+
+        # The previous chunk has been already scanned except for its tail,
+        # so only the tail and the new chunk are searched for the boundary,
+        # without concatenating the chunks.
+        prev_len = len(prev_chunk)
+        idx = prev_chunk.find(boundary) if first_chunk else -1
+        if idx < 0:
+            tail = prev_chunk[-len(boundary) + 1 :]
+            pos = (tail + chunk[: len(boundary) - 1]).find(boundary)
+            if pos >= 0:
+                idx = prev_len - len(tail) + pos
+        if idx < 0:
+            pos = chunk.find(boundary)
+            if pos >= 0:
+                idx = prev_len + pos
 
-        intermeditate_boundary = self._newline + self._boundary
-
-        if first_chunk:
-            pos = 0
-        else:
-            pos = max(0, len(self._prev_chunk) - len(intermeditate_boundary))
-
-        idx = window.find(intermeditate_boundary, pos)
         if idx >= 0:
             # pushing boundary back to content
+            if idx < prev_len:
+                rest = prev_chunk[idx:] + chunk
+                prev_chunk = prev_chunk[:idx]
+                chunk = b""
+            else:
+                rest = chunk[idx - prev_len :]
+                chunk = chunk[: idx - prev_len]
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=DeprecationWarning)
-                self._content.unread_data(window[idx:])
-            if size > idx:
-                self._prev_chunk = self._prev_chunk[:idx]
-            chunk = window[len(self._prev_chunk) : idx]
+                self._content.unread_data(rest)
             if not chunk:
                 self._at_eof = True
 
-        result = self._prev_chunk
         self._prev_chunk = chunk
-        return result
+        return prev_chunk
 
     async def readline(self) -> bytes:
         """Reads body part by line by line."""
@@ -547,10 +707,10 @@ class BodyPartReaderPayload(Payload):
 
     async def write(self, writer: Any) -> None:
         field = self._value
-        chunk = await field.read_chunk(size=2 ** 16)
+        chunk = await field.read_chunk(size=2 ** 16, decode=True)
         while chunk:
-            await writer.write(field.decode(chunk))
-            chunk = await field.read_chunk(size=2 ** 16)
+            await writer.write(chunk)
+            chunk = await field.read_chunk(size=2 ** 16, decode=True)
 
 
 class MultipartReader:
@@ -1,6 +1,11 @@
 import asyncio
+import concurrent.futures
+import functools
+import os
 import socket
-from typing import Any, Dict, List
+import threading
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
 from .abc import AbstractResolver
 
@@ -10,34 +15,187 @@ try:
     import aiodns
 
     # aiodns_default = hasattr(aiodns.DNSResolver, 'gethostbyname')
+    _ARES_NOT_FOUND = frozenset(
+        [aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA]
+    )
+    # getaddrinfo() of aiodns 3.2+ returns TTLs of records
+    aiodns_getaddrinfo = hasattr(aiodns.DNSResolver, "getaddrinfo")
 except ImportError:  # pragma: no cover
     aiodns = None
+    aiodns_getaddrinfo = False
 
 aiodns_default = False
 
+# default number of threads running getaddrinfo()
+RESOLVER_THREADS = 16
+
+_AddrInfo = List[Tuple[Any, ...]]
+_LookupKey = Tuple[asyncio.AbstractEventLoop, str, int, int]
+
+
+class _Lookup:
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: "asyncio.Future[_AddrInfo]") -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class _LookupPool:
+    """getaddrinfo() calls in a thread pool shared by threaded resolvers.
+
+    Lookups exceeding *max_workers* wait in the executor queue, identical
+    lookups in flight on the same event loop share a single call.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="aiohttp-resolver"
+        )
+        self._lock = threading.Lock()
+        self._lookups = {}  # type: Dict[_LookupKey, _Lookup]
+        self.queued = 0
+        self.active = 0
+        self.lookups = 0
+        self.coalesced = 0
+        self.lookup_time = 0.0
+
+    async def getaddrinfo(self, host: str, port: int, family: int) -> _AddrInfo:
+        loop = asyncio.get_running_loop()
+        key = (loop, host, port, family)
+        with self._lock:
+            lookup = self._lookups.get(key)
+            if lookup is None or lookup.future.cancelled():
+                cfut = self._executor.submit(self._getaddrinfo, host, port, family)
+                self.queued += 1
+                cfut.add_done_callback(self._cancelled)
+                lookup = self._lookups[key] = _Lookup(
+                    asyncio.wrap_future(cfut, loop=loop)
+                )
+                lookup.future.add_done_callback(
+                    functools.partial(self._forget, key, lookup)
+                )
+            else:
+                self.coalesced += 1
+            lookup.waiters += 1
+
+        try:
+            return await asyncio.shield(lookup.future)
+        finally:
+            lookup.waiters -= 1
+            if not lookup.waiters:
+                # nobody waits for the result, drop the queued call
+                lookup.future.cancel()
+
+    def _getaddrinfo(self, host: str, port: int, family: int) -> _AddrInfo:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        started = monotonic()
+        try:
+            return socket.getaddrinfo(
+                host, port, family, socket.SOCK_STREAM, 0, socket.AI_ADDRCONFIG
+            )
+        finally:
+            elapsed = monotonic() - started
+            with self._lock:
+                self.active -= 1
+                self.lookups += 1
+                self.lookup_time += elapsed
+
+    def _cancelled(self, cfut: "concurrent.futures.Future[_AddrInfo]") -> None:
+        if cfut.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def _forget(
+        self, key: _LookupKey, lookup: _Lookup, fut: "asyncio.Future[_AddrInfo]"
+    ) -> None:
+        with self._lock:
+            if self._lookups.get(key) is lookup:
+                del self._lookups[key]
+
+
+# {max_workers: pool}
+_pools = {}  # type: Dict[int, _LookupPool]
+_pools_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> _LookupPool:
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = _LookupPool(max_workers)
+        return pool
+
+
+def _reset_pools() -> None:
+    # threads of executors do not survive fork()
+    global _pools_lock
+    _pools.clear()
+    _pools_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_pools)
+
 
 class ThreadedResolver(AbstractResolver):
-    """Use Executor for synchronous getaddrinfo() calls, which defaults to
-    concurrent.futures.ThreadPoolExecutor.
+    """Use a thread pool for synchronous getaddrinfo() calls.
+
+    Resolvers with the same *max_workers* share a pool of that many
+    threads, RESOLVER_THREADS by default, separate from the default
+    executor of the event loop. Identical lookups in flight on an event
+    loop are made once for all resolvers of the pool.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        if max_workers is None:
+            max_workers = RESOLVER_THREADS
+        if max_workers < 1:
+            raise ValueError("max_workers should be positive")
         self._loop = asyncio.get_running_loop()
+        self._max_workers = max_workers
+
+    @property
+    def _pool(self) -> _LookupPool:
+        # looked up every time, pools of the parent process
+        # are replaced in a forked child
+        return _get_pool(self._max_workers)
+
+    @property
+    def queued(self) -> int:
+        """Number of lookups waiting for a thread of the pool."""
+        return self._pool.queued
+
+    @property
+    def active(self) -> int:
+        """Number of lookups running in threads of the pool."""
+        return self._pool.active
+
+    @property
+    def lookups(self) -> int:
+        """Number of finished getaddrinfo() calls of the pool."""
+        return self._pool.lookups
+
+    @property
+    def coalesced(self) -> int:
+        """Number of lookups which joined an identical one in flight."""
+        return self._pool.coalesced
+
+    @property
+    def lookup_time(self) -> float:
+        """Total seconds of finished getaddrinfo() calls of the pool."""
+        return self._pool.lookup_time
 
     async def resolve(
         self, hostname: str, port: int = 0, family: int = socket.AF_INET
     ) -> List[Dict[str, Any]]:
-        infos = await self._loop.getaddrinfo(
-            hostname,
-            port,
-            type=socket.SOCK_STREAM,
-            family=family,
-            flags=socket.AI_ADDRCONFIG,
-        )
+        infos = await self._pool.getaddrinfo(hostname, port, family)
 
         hosts = []
         for family, _, proto, _, address in infos:
-            if family == socket.AF_INET6 and address[3]:  # type: ignore
+            if family == socket.AF_INET6 and address[3]:
                 # This is essential for link-local IPv6 addresses.
                 # LL IPv6 is a VERY rare case. Strictly speaking, we should use
                 # getnameinfo() unconditionally, but performance makes sense.
@@ -78,9 +236,14 @@ class AsyncResolver(AbstractResolver):
         self, host: str, port: int = 0, family: int = socket.AF_INET
     ) -> List[Dict[str, Any]]:
         try:
+            if aiodns_getaddrinfo:
+                return await self._resolve_getaddrinfo(host, port, family)
             resp = await self._resolver.gethostbyname(host, family)
         except aiodns.error.DNSError as exc:
             msg = exc.args[1] if len(exc.args) >= 1 else "DNS lookup failed"
+            if exc.args and exc.args[0] in _ARES_NOT_FOUND:
+                # the same error as getaddrinfo() raises
+                raise socket.gaierror(socket.EAI_NONAME, msg) from exc
             raise OSError(msg) from exc
         hosts = []
         for address in resp.addresses:
@@ -100,6 +263,45 @@ class AsyncResolver(AbstractResolver):
 
         return hosts
 
+    async def _resolve_getaddrinfo(
+        self, host: str, port: int, family: int
+    ) -> List[Dict[str, Any]]:
+        resp = await self._resolver.getaddrinfo(
+            host,
+            family=socket.AddressFamily(family),
+            port=port,
+            type=socket.SOCK_STREAM,
+            flags=socket.AI_ADDRCONFIG,
+        )
+        hosts = []
+        for node in resp.nodes:
+            address = node.addr
+            addr = address[0]
+            if isinstance(addr, bytes):
+                addr = addr.decode("ascii")
+            if node.family == socket.AF_INET6 and len(address) > 3 and address[3]:
+                # link-local IPv6 address, see ThreadedResolver
+                addr, _port = socket.getnameinfo(
+                    (addr, *address[1:]),
+                    socket.NI_NUMERICHOST | socket.NI_NUMERICSERV,
+                )
+            hosts.append(
+                {
+                    "hostname": host,
+                    "host": addr,
+                    "port": port,
+                    "family": node.family,
+                    "proto": node.protocol,
+                    "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+                    "ttl": node.ttl,
+                }
+            )
+
+        if not hosts:
+            raise OSError("DNS lookup failed")
+
+        return hosts
+
     async def close(self) -> None:
         return self._resolver.cancel()
 
@@ -61,6 +61,8 @@ class ChunkTupleAsyncStreamIterator:
 
 
 class AsyncStreamReaderMixin:
+    __slots__ = ()
+
     def __aiter__(self) -> AsyncStreamIterator[bytes]:
         return AsyncStreamIterator(self.readline)  # type: ignore
 
@@ -103,7 +105,25 @@ class StreamReader(AsyncStreamReaderMixin):
 
     """
 
-    total_bytes = 0
+    __slots__ = (
+        "_protocol",
+        "_low_water",
+        "_high_water",
+        "_loop",
+        "_size",
+        "_cursor",
+        "_http_chunk_splits",
+        "_buffer",
+        "_buffer_offset",
+        "_eof",
+        "_waiter",
+        "_eof_waiter",
+        "_exception",
+        "_timer",
+        "_eof_callbacks",
+        "total_bytes",
+        "__dict__",
+    )
 
     def __init__(
         self,
@@ -130,6 +150,7 @@ class StreamReader(AsyncStreamReaderMixin):
         self._exception = None  # type: Optional[BaseException]
         self._timer = timer
         self._eof_callbacks = []  # type: List[Callable[[], None]]
+        self.total_bytes = 0
 
     def __repr__(self) -> str:
         info = [self.__class__.__name__]
@@ -231,7 +252,6 @@ class StreamReader(AsyncStreamReaderMixin):
         self._size += len(data)
         self._cursor -= len(data)
         self._buffer.appendleft(data)
-        self._eof_counter = 0
 
     # TODO: size is ignored, remove the param later
     def feed_data(self, data: bytes, size: int = 0) -> None:
@@ -493,6 +513,11 @@ class StreamReader(AsyncStreamReaderMixin):
 
 
 class EmptyStreamReader(StreamReader):  # lgtm [py/missing-call-to-init]
+    __slots__ = ()
+
+    # the instance is shared, __init__ of the parent is not called
+    total_bytes = 0
+
     def __init__(self) -> None:
         pass
 
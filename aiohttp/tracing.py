@@ -318,6 +318,7 @@ class TraceDnsCacheHitParams:
     """ Parameters sent by the `on_dns_cache_hit` signal"""
 
     host: str
+    stale: bool = False
 
 
 @dataclasses.dataclass(frozen=True)
@@ -451,9 +452,9 @@ class Trace:
             self._session, self._trace_config_ctx, TraceDnsResolveHostEndParams(host)
         )
 
-    async def send_dns_cache_hit(self, host: str) -> None:
+    async def send_dns_cache_hit(self, host: str, stale: bool = False) -> None:
         return await self._trace_config.on_dns_cache_hit.send(
-            self._session, self._trace_config_ctx, TraceDnsCacheHitParams(host)
+            self._session, self._trace_config_ctx, TraceDnsCacheHitParams(host, stale)
         )
 
     async def send_dns_cache_miss(self, host: str) -> None:
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import signal
 import socket
 import sys
 from argparse import ArgumentParser
@@ -81,7 +82,11 @@ from .web_exceptions import (
     HTTPVersionNotSupported as HTTPVersionNotSupported,
 )
 from .web_fileresponse import FileResponse as FileResponse
-from .web_log import AccessLogger
+from .web_limiter import AIMDLimiter as AIMDLimiter
+from .web_log import AccessLogger, JSONAccessLogger as JSONAccessLogger
+from .web_log_queue import AccessLogQueue as AccessLogQueue
+from .web_loop_monitor import LoopLagMonitor as LoopLagMonitor, LoopStall as LoopStall
+from .web_metrics import ServerMetrics as ServerMetrics
 from .web_middlewares import (
     middleware as middleware,
     normalize_path_middleware as normalize_path_middleware,
@@ -212,6 +217,17 @@ __all__ = (
     "HTTPVersionNotSupported",
     # web_fileresponse
     "FileResponse",
+    # web_limiter
+    "AIMDLimiter",
+    # web_log
+    "JSONAccessLogger",
+    # web_log_queue
+    "AccessLogQueue",
+    # web_loop_monitor
+    "LoopLagMonitor",
+    "LoopStall",
+    # web_metrics
+    "ServerMetrics",
     # web_middlewares
     "middleware",
     "normalize_path_middleware",
@@ -301,13 +317,34 @@ async def _run_app(
     handle_signals: bool = True,
     reuse_address: Optional[bool] = None,
     reuse_port: Optional[bool] = None,
+    loop_monitor: Optional[LoopLagMonitor] = None,
+    threads: Optional[int] = None,
+    access_log_queue: Optional[AccessLogQueue] = None,
 ) -> None:
     # An internal function to actually do all dirty job for application running
+    from .web_workers import (
+        HAS_REUSE_PORT,
+        LoopThread,
+        _has_cleanup_ctx,
+        clone_listening,
+    )
+
+    if threads is not None:
+        if reuse_port is None:
+            # let the kernel balance connections between loops
+            reuse_port = HAS_REUSE_PORT or None
+
     if asyncio.iscoroutine(app):
         app = await app  # type: ignore
 
     app = cast(Application, app)
 
+    if threads is not None and threads > 1 and _has_cleanup_ctx(app):
+        raise RuntimeError(
+            "run_app(threads=...) does not support cleanup contexts, "
+            "the contexts would be bound to one of the event loops"
+        )
+
     runner = AppRunner(
         app,
         handle_signals=handle_signals,
@@ -315,11 +352,14 @@ async def _run_app(
         access_log_format=access_log_format,
         access_log=access_log,
         keepalive_timeout=keepalive_timeout,
+        loop_monitor=loop_monitor,
+        access_log_queue=access_log_queue,
     )
 
     await runner.setup()
 
     sites = []  # type: List[BaseSite]
+    loop_threads = []  # type: List[LoopThread]
 
     try:
         if host is not None:
@@ -411,12 +451,35 @@ async def _run_app(
         for site in sites:
             await site.start()
 
+        if threads is not None:
+            listening = []  # type: List[Any]
+            for site in sites:
+                assert site._server is not None
+                listening.extend(site._server.sockets or ())  # type: ignore
+            # the current loop is the first one
+            for _ in range(1, threads):
+                loop_thread = LoopThread(
+                    runner,
+                    clone_listening(listening, backlog=backlog),
+                    shutdown_timeout=shutdown_timeout,
+                    ssl_context=ssl_context,
+                    backlog=backlog,
+                )
+                loop_threads.append(loop_thread)
+                loop_thread.start()
+
         if print:  # pragma: no branch
             names = sorted(str(s.name) for s in runner.sites)
-            print(
-                "======== Running on {} ========\n"
-                "(Press CTRL+C to quit)".format(", ".join(names))
-            )
+            if threads is None:
+                print(
+                    "======== Running on {} ========\n"
+                    "(Press CTRL+C to quit)".format(", ".join(names))
+                )
+            else:
+                print(
+                    "======== Running on {} ({} threads) ========\n"
+                    "(Press CTRL+C to quit)".format(", ".join(names), threads)
+                )
 
         # sleep forever by 1 hour intervals,
         # on Windows before Python 3.8 wake up every 1 second to handle
@@ -429,6 +492,8 @@ async def _run_app(
         while True:
             await asyncio.sleep(delay)
     finally:
+        for loop_thread in loop_threads:
+            await loop_thread.stop()
         await runner.cleanup()
 
 
@@ -477,8 +542,41 @@ def run_app(
     handle_signals: bool = True,
     reuse_address: Optional[bool] = None,
     reuse_port: Optional[bool] = None,
+    loop_monitor: Optional[LoopLagMonitor] = None,
+    workers: Optional[int] = None,
+    cpu_affinity: bool = False,
+    threads: Optional[int] = None,
+    access_log_queue: Optional[AccessLogQueue] = None,
 ) -> None:
     """Run an app locally"""
+    if threads is not None and threads < 1:
+        raise ValueError("threads should be positive")
+    if workers is not None:
+        _run_workers(
+            app,
+            workers=workers,
+            cpu_affinity=cpu_affinity,
+            threads=threads,
+            debug=debug,
+            host=host,
+            port=port,
+            path=path,
+            sock=sock,
+            shutdown_timeout=shutdown_timeout,
+            keepalive_timeout=keepalive_timeout,
+            ssl_context=ssl_context,
+            print=print,
+            backlog=backlog,
+            access_log_class=access_log_class,
+            access_log_format=access_log_format,
+            access_log=access_log,
+            reuse_address=reuse_address,
+            reuse_port=reuse_port,
+            loop_monitor=loop_monitor,
+            access_log_queue=access_log_queue,
+        )
+        return
+
     loop = asyncio.get_event_loop()
     loop.set_debug(debug)
 
@@ -508,6 +606,9 @@ def run_app(
                 handle_signals=handle_signals,
                 reuse_address=reuse_address,
                 reuse_port=reuse_port,
+                loop_monitor=loop_monitor,
+                threads=threads,
+                access_log_queue=access_log_queue,
             )
         )
         loop.run_until_complete(main_task)
@@ -521,6 +622,131 @@ def run_app(
         asyncio.set_event_loop(None)
 
 
+def _run_workers(
+    app: Union[Application, Awaitable[Application]],
+    *,
+    workers: int,
+    cpu_affinity: bool,
+    host: Optional[Union[str, HostSequence]],
+    port: Optional[int],
+    path: Optional[str],
+    sock: Optional[socket.socket],
+    ssl_context: Optional[SSLContext],
+    print: Optional[Callable[..., None]],
+    backlog: int,
+    reuse_address: Optional[bool],
+    reuse_port: Optional[bool],
+    **kwargs: Any,
+) -> None:
+    # Listening sockets are bound before fork, so binding errors are
+    # raised here and restarted workers keep accepting on the same sockets.
+    # With SO_REUSEPORT every worker gets own TCP sockets and the kernel
+    # balances connections between them, other sockets are shared.
+    from .web_runner import _raise_graceful_exit, _sock_name
+    from .web_workers import (
+        HAS_REUSE_PORT,
+        WorkerSupervisor,
+        bind_same,
+        bind_tcp,
+        bind_unix,
+    )
+
+    if workers < 1:
+        raise ValueError("workers should be positive")
+    if reuse_port is None:
+        reuse_port = HAS_REUSE_PORT
+
+    hosts = []  # type: List[Optional[str]]
+    if host is not None:
+        if isinstance(host, (str, bytes, bytearray, memoryview)):
+            hosts.append(host)  # type: ignore
+        else:
+            hosts.extend(host)
+    elif path is None and sock is None or port is not None:
+        hosts.append(None)
+    if port is None:
+        port = 8443 if ssl_context else 8080
+
+    own = []  # type: List[socket.socket]
+    shared = []  # type: List[socket.socket]
+    groups = []  # type: List[List[socket.socket]]
+    try:
+        tcp = []  # type: List[socket.socket]
+        for h in hosts:
+            tcp.extend(
+                bind_tcp(
+                    h,
+                    port,
+                    backlog=backlog,
+                    reuse_address=reuse_address,
+                    reuse_port=reuse_port,
+                )
+            )
+        own.extend(tcp)
+        if reuse_port and tcp:
+            groups.append(tcp)
+            for _ in range(1, workers):
+                group = bind_same(tcp, backlog=backlog, reuse_address=reuse_address)
+                own.extend(group)
+                groups.append(group)
+        else:
+            shared.extend(tcp)
+
+        if path is not None:
+            paths = [path] if isinstance(path, str) else list(path)
+            for p in paths:
+                unix_sock = bind_unix(p, backlog=backlog)
+                own.append(unix_sock)
+                shared.append(unix_sock)
+
+        if sock is not None:
+            if not isinstance(sock, Iterable):
+                shared.append(sock)
+            else:
+                shared.extend(sock)
+
+        def serve(index: int) -> None:
+            sockets = list(shared)
+            for i, group in enumerate(groups):
+                if i == index:
+                    sockets.extend(group)
+                else:
+                    for s in group:
+                        s.close()
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.add_signal_handler(signal.SIGTERM, _raise_graceful_exit)
+            run_app(
+                app,
+                sock=sockets,  # type: ignore[arg-type]
+                ssl_context=ssl_context,
+                print=None,
+                backlog=backlog,
+                handle_signals=False,
+                **kwargs,
+            )
+
+        supervisor = WorkerSupervisor(serve, workers, cpu_affinity=cpu_affinity)
+
+        if print:  # pragma: no branch
+            scheme = "https" if ssl_context else "http"
+            names = sorted(
+                _sock_name(s, scheme) for s in shared + (groups[0] if groups else [])
+            )
+            print(
+                "======== Running on {} ({} workers) ========\n"
+                "(Press CTRL+C to quit)".format(", ".join(names), workers)
+            )
+
+        supervisor.run()
+    finally:
+        for s in own:
+            s.close()
+        if asyncio.iscoroutine(app):
+            # every worker awaits own copy of the coroutine
+            app.close()
+
+
 def main(argv: List[str]) -> None:
     arg_parser = ArgumentParser(
         description="aiohttp.web Application server", prog="aiohttp.web"
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import threading
 import warnings
 from functools import partial, update_wrapper
 from typing import (  # noqa
@@ -27,9 +28,11 @@ from frozenlist import FrozenList
 from typing_extensions import final
 
 from . import hdrs
+from .abc import AbstractMatchInfo
 from .log import web_logger
+from .web_exceptions import HTTPServiceUnavailable
 from .web_middlewares import _fix_request_current_app
-from .web_request import Request
+from .web_request import Request, _SpoolBudget
 from .web_response import StreamResponse
 from .web_routedef import AbstractRouteDef
 from .web_urldispatcher import (
@@ -40,6 +43,7 @@ from .web_urldispatcher import (
     MatchedSubAppResource,
     PrefixedSubAppResource,
     UrlDispatcher,
+    UrlMappingMatchInfo,
 )
 
 __all__ = ("Application", "CleanupError")
@@ -84,7 +88,17 @@ class Application(MutableMapping[str, Any]):
         "_on_shutdown",
         "_on_cleanup",
         "_client_max_size",
+        "_upload_spool_threshold",
+        "_upload_dir",
+        "_upload_spool_budget",
         "_cleanup_ctx",
+        "_max_inflight_requests",
+        "_inflight_requests",
+        "_rejected_requests",
+        "_inflight_lock",
+        "_run_inflight_limits",
+        "_handler_timeout",
+        "_run_handler_timeouts",
     )
 
     def __init__(
@@ -94,6 +108,11 @@ class Application(MutableMapping[str, Any]):
         middlewares: Iterable[_Middleware] = (),
         handler_args: Optional[Mapping[str, Any]] = None,
         client_max_size: int = 1024 ** 2,
+        upload_spool_threshold: int = 1024 ** 2,
+        upload_dir: Optional[str] = None,
+        upload_spool_max_size: int = 0,
+        max_inflight_requests: Optional[int] = None,
+        handler_timeout: Optional[float] = None,
         debug: Any = ...,  # mypy doesn't support ellipsis
     ) -> None:
 
@@ -127,6 +146,23 @@ class Application(MutableMapping[str, Any]):
         self._on_startup.append(self._cleanup_ctx._on_startup)
         self._on_cleanup.append(self._cleanup_ctx._on_cleanup)
         self._client_max_size = client_max_size
+        if upload_spool_threshold < 0:
+            raise ValueError("upload_spool_threshold should not be negative")
+        self._upload_spool_threshold = upload_spool_threshold
+        self._upload_dir = upload_dir
+        self._upload_spool_budget = _SpoolBudget(upload_spool_max_size)
+        if max_inflight_requests is not None and max_inflight_requests < 1:
+            raise ValueError("max_inflight_requests should be positive or None")
+        self._max_inflight_requests = max_inflight_requests
+        self._inflight_requests = 0
+        self._rejected_requests = 0
+        # the counters are shared by loops of run_app(threads=N)
+        self._inflight_lock = threading.Lock()
+        # initialized on freezing
+        self._run_inflight_limits = None  # type: Optional[bool]
+        self._handler_timeout = handler_timeout
+        # initialized on freezing
+        self._run_handler_timeouts = None  # type: Optional[bool]
 
     def __init_subclass__(cls: Type["Application"]) -> None:
         raise TypeError(
@@ -194,10 +230,18 @@ class Application(MutableMapping[str, Any]):
         # middlewares are configured the handler will receive the proper
         # current_app without needing all of this code.
         self._run_middlewares = True if self.middlewares else False
+        self._run_inflight_limits = self._max_inflight_requests is not None
+        self._run_handler_timeouts = self._handler_timeout is not None
 
         for subapp in self._subapps:
             subapp.pre_freeze()
             self._run_middlewares = self._run_middlewares or subapp._run_middlewares
+            self._run_inflight_limits = (
+                self._run_inflight_limits or subapp._run_inflight_limits
+            )
+            self._run_handler_timeouts = (
+                self._run_handler_timeouts or subapp._run_handler_timeouts
+            )
 
     @property
     def frozen(self) -> bool:
@@ -291,6 +335,24 @@ class Application(MutableMapping[str, Any]):
     def cleanup_ctx(self) -> "CleanupContext":
         return self._cleanup_ctx
 
+    @property
+    def max_inflight_requests(self) -> Optional[int]:
+        return self._max_inflight_requests
+
+    @property
+    def inflight_requests(self) -> int:
+        """Number of requests currently handled by the application."""
+        return self._inflight_requests
+
+    @property
+    def rejected_requests(self) -> int:
+        """Number of requests rejected by max_inflight_requests limit."""
+        return self._rejected_requests
+
+    @property
+    def handler_timeout(self) -> Optional[float]:
+        return self._handler_timeout
+
     @property
     def router(self) -> UrlDispatcher:
         return self._router
@@ -333,9 +395,48 @@ class Application(MutableMapping[str, Any]):
         match_info.add_app(self)
         match_info.freeze()
 
+        handler_timeout = None
+        if isinstance(match_info, UrlMappingMatchInfo):
+            handler_timeout = match_info.route.handler_timeout
+        if handler_timeout is None and self._run_handler_timeouts:
+            for app in reversed(match_info.apps):
+                if app._handler_timeout is not None:
+                    handler_timeout = app._handler_timeout
+                    break
+        if handler_timeout is not None:
+            request.protocol.set_handler_timeout(handler_timeout)
+
+        if not self._run_inflight_limits:
+            return await self._handle_match(request, match_info)
+
+        limited = [
+            app for app in match_info.apps if app._max_inflight_requests is not None
+        ]
+        with self._inflight_lock:
+            for app in limited:
+                if app._inflight_requests >= cast(int, app._max_inflight_requests):
+                    app._rejected_requests += 1
+                    # same Retry-After as the server's own overload responses
+                    manager = request.protocol._manager
+                    retry_after = manager.retry_after if manager is not None else 1
+                    raise HTTPServiceUnavailable(
+                        headers={hdrs.RETRY_AFTER: str(retry_after)}
+                    )
+            for app in limited:
+                app._inflight_requests += 1
+        try:
+            return await self._handle_match(request, match_info)
+        finally:
+            with self._inflight_lock:
+                for app in limited:
+                    app._inflight_requests -= 1
+
+    async def _handle_match(
+        self, request: Request, match_info: AbstractMatchInfo
+    ) -> StreamResponse:
         resp = None
         request._match_info = match_info  # type: ignore
-        expect = request.headers.get(hdrs.EXPECT)
+        expect = request._peek_header(hdrs.EXPECT)
         if expect:
             resp = await match_info.expect_handler(request)
             await request.writer.drain()
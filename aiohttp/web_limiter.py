@@ -0,0 +1,156 @@
+"""Adaptive concurrency limiting for the low level HTTP server."""
+import asyncio
+from collections import deque
+from contextlib import suppress
+from typing import Deque
+
+from .helpers import ceil_timeout
+
+__all__ = ("AIMDLimiter",)
+
+
+class AIMDLimiter:
+    """Adaptive limit of simultaneously handled requests.
+
+    The limit grows additively while handlers finish faster than
+    *latency_threshold* and shrinks multiplicatively by *backoff_ratio*
+    when they don't.  Requests over the limit wait in a bounded queue
+    for at most *queue_timeout* seconds and are shed otherwise.
+    """
+
+    __slots__ = (
+        "_limit",
+        "_min_limit",
+        "_max_limit",
+        "_latency_threshold",
+        "_backoff_ratio",
+        "_queue_size",
+        "_queue_timeout",
+        "_inflight",
+        "_waiters",
+        "_rejected",
+    )
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        latency_threshold: float = 1.0,
+        backoff_ratio: float = 0.9,
+        queue_size: int = 0,
+        queue_timeout: float = 1.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "min_limit <= initial_limit <= max_limit should be positive, "
+                "got {}, {}, {}".format(min_limit, initial_limit, max_limit)
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio should be in (0, 1) range")
+        if queue_size < 0:
+            raise ValueError("queue_size should be non-negative")
+        if queue_timeout <= 0:
+            raise ValueError("queue_timeout should be positive")
+        self._limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_threshold = latency_threshold
+        self._backoff_ratio = backoff_ratio
+        self._queue_size = queue_size
+        self._queue_timeout = queue_timeout
+        self._inflight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._rejected = 0
+
+    def __repr__(self) -> str:
+        return "<AIMDLimiter limit={} inflight={} queued={}>".format(
+            self._limit, self._inflight, len(self._waiters)
+        )
+
+    @property
+    def limit(self) -> int:
+        """Currently allowed amount of simultaneously handled requests."""
+        return self._limit
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def rejected(self) -> int:
+        """Amount of shed requests."""
+        return self._rejected
+
+    async def acquire(self) -> bool:
+        """Take a slot for a request.
+
+        Return False if the request should be shed.
+        """
+        if self._inflight < self._limit and not self._waiters:
+            self._inflight += 1
+            return True
+
+        if len(self._waiters) >= self._queue_size:
+            self._rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with ceil_timeout(self._queue_timeout):
+                await waiter
+        except asyncio.TimeoutError:
+            self._drop_waiter(waiter)
+            self._rejected += 1
+            return False
+        except asyncio.CancelledError:
+            self._drop_waiter(waiter)
+            raise
+        # the slot was handed over by release()
+        return True
+
+    def release(self, latency: float) -> None:
+        """Give the slot back, *latency* is the handling time in seconds."""
+        self._inflight -= 1
+        if latency > self._latency_threshold:
+            self._limit = max(self._min_limit, int(self._limit * self._backoff_ratio))
+        elif self._inflight * 2 >= self._limit:
+            # grow only if the current limit is actually used
+            self._limit = min(self._max_limit, self._limit + 1)
+        self._wakeup()
+
+    def _copy(self) -> "AIMDLimiter":
+        """Return a limiter with the same settings for another event loop."""
+        return AIMDLimiter(
+            initial_limit=self._limit,
+            min_limit=self._min_limit,
+            max_limit=self._max_limit,
+            latency_threshold=self._latency_threshold,
+            backoff_ratio=self._backoff_ratio,
+            queue_size=self._queue_size,
+            queue_timeout=self._queue_timeout,
+        )
+
+    def _drop_waiter(self, waiter: "asyncio.Future[None]") -> None:
+        if waiter.cancelled():
+            # could be already dropped by _wakeup()
+            with suppress(ValueError):
+                self._waiters.remove(waiter)
+        else:
+            # the slot was handed over concurrently, pass it to the next one
+            self._inflight -= 1
+            self._wakeup()
+
+    def _wakeup(self) -> None:
+        waiters = self._waiters
+        while waiters and self._inflight < self._limit:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                self._inflight += 1
+                waiter.set_result(None)
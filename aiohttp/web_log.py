@@ -1,11 +1,16 @@
 import datetime
 import functools
 import logging
+import math
 import os
+import random
 import re
 import time as time_mod
 from collections import namedtuple
-from typing import Any, Callable, Dict, Iterable, List, Tuple  # noqa
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple  # noqa
+
+from multidict import istr
 
 from .abc import AbstractAccessLogger
 from .web_request import BaseRequest
@@ -13,6 +18,97 @@ from .web_response import StreamResponse
 
 KeyMethod = namedtuple("KeyMethod", "key method")
 
+_LineFormatter = Callable[
+    [BaseRequest, StreamResponse, float, bool], Tuple[str, Optional[Dict[str, Any]]]
+]
+
+# source lines computing value of a format atom into {v},
+# {k} is a name of the header key constant
+_ATOM_CODE = {
+    "a": [
+        "if request is None:",
+        "    {v} = '-'",
+        "else:",
+        "    {v} = request.remote",
+        "    if {v} is None:",
+        "        {v} = '-'",
+    ],
+    "t": ["{v} = _start_time(time)"],
+    "P": ["{v} = '<%s>' % os.getpid()"],
+    "r": [
+        "if request is None:",
+        "    {v} = '-'",
+        "else:",
+        "    version = request.version",
+        "    {v} = '%s %s HTTP/%s.%s' % (",
+        "        request.method, request.path_qs, version.major, version.minor",
+        "    )",
+    ],
+    "s": ["{v} = response.status"],
+    "b": ["{v} = response.body_length"],
+    "T": ["{v} = str(round(time))"],
+    "Tf": ["{v} = '%06f' % time"],
+    "D": ["{v} = str(round(time * 1000000))"],
+    "i": [
+        "if request is None:",
+        "    {v} = '(no headers)'",
+        "else:",
+        "    {v} = request.headers.get({k}, '-')",
+    ],
+    "o": ["{v} = response.headers.get({k}, '-')"],
+}
+
+# handlers which use only the formatted message and the formatter
+_PLAIN_HANDLERS = (logging.StreamHandler, logging.NullHandler)
+
+_start_time_cache = (-1, "")  # type: Tuple[int, str]
+
+
+def _start_time(time: float) -> str:
+    """Format request start time, the string is cached per second."""
+    global _start_time_cache
+    second = math.floor(time_mod.time() - time)
+    cached = _start_time_cache
+    if cached[0] == second:
+        return cached[1]
+    tz = datetime.timezone(datetime.timedelta(seconds=-time_mod.timezone))
+    stamp = datetime.datetime.fromtimestamp(second, tz).strftime(
+        "[%d/%b/%Y:%H:%M:%S %z]"
+    )
+    _start_time_cache = (second, stamp)
+    return stamp
+
+
+def _handler_uses_extra(handler: logging.Handler, keys: Iterable[str]) -> bool:
+    if handler.filters or not isinstance(handler, _PLAIN_HANDLERS):
+        return True
+    formatter = handler.formatter
+    if formatter is None:
+        return False
+    if type(formatter) is not logging.Formatter:
+        return True
+    fmt = formatter._fmt or ""
+    return any(key in fmt for key in keys)
+
+
+def _logger_uses_extra(logger: logging.Logger, keys: Iterable[str]) -> bool:
+    """Check if extra attributes of access log records can be used.
+
+    Filters, custom handlers and formatters are expected to use
+    them, standard formatters are checked for the attribute names.
+    """
+    current = logger  # type: Optional[logging.Logger]
+    while current is not None:
+        if not isinstance(current, logging.Logger) or current.filters:
+            return True
+        for handler in current.handlers:
+            if _handler_uses_extra(handler, keys):
+                return True
+        if not current.propagate:
+            break
+        current = current.parent
+    return False
+
 
 class AccessLogger(AbstractAccessLogger):
     """Helper object to log access.
@@ -39,6 +135,12 @@ class AccessLogger(AbstractAccessLogger):
         %{FOO}o  response.headers['FOO']
         %{FOO}e  os.environ['FOO']
 
+    Lines can be sampled per status class, sample_rates maps the first
+    digit of the response status to a fraction of logged lines, e.g.
+    {2: 0.01} logs 1% of 2xx responses and all other lines. Pass it to
+    the constructor or set it in a subclass to use with run_app(), the
+    sampling decision is made before formatting.
+
     """
 
     LOG_FORMAT_MAP = {
@@ -58,23 +160,35 @@ class AccessLogger(AbstractAccessLogger):
     LOG_FORMAT = '%a %t "%r" %s %b "%{Referer}i" "%{User-Agent}i"'
     FORMAT_RE = re.compile(r"%(\{([A-Za-z0-9\-_]+)\}([ioe])|[atPrsbOD]|Tf?)")
     CLEANUP_RE = re.compile(r"(%[^s])")
-    _FORMAT_CACHE = {}  # type: Dict[str, Tuple[str, List[KeyMethod]]]
+    _FORMAT_CACHE = {}  # type: Dict[str, Tuple[str, _LineFormatter, List[str]]]
+
+    sample_rates = None  # type: Optional[Mapping[int, float]]
 
-    def __init__(self, logger: logging.Logger, log_format: str = LOG_FORMAT) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        log_format: str = LOG_FORMAT,
+        *,
+        sample_rates: Optional[Mapping[int, float]] = None,
+    ) -> None:
         """Initialise the logger.
 
         logger is a logger object to be used for logging.
         log_format is a string with apache compatible log format description.
+        sample_rates overrides the sample_rates class attribute.
 
         """
         super().__init__(logger, log_format=log_format)
+        if sample_rates is not None:
+            self.sample_rates = sample_rates
 
-        _compiled_format = AccessLogger._FORMAT_CACHE.get(log_format)
+        _compiled_format = self._FORMAT_CACHE.get(log_format)
         if not _compiled_format:
-            _compiled_format = self.compile_format(log_format)
-            AccessLogger._FORMAT_CACHE[log_format] = _compiled_format
+            _compiled_format = self._compile_line(log_format)
+            self._FORMAT_CACHE[log_format] = _compiled_format
 
-        self._log_format, self._methods = _compiled_format
+        self._log_format, self._format_line, self._extra_keys = _compiled_format
+        self._uses_extra = None  # type: Optional[bool]
 
     def compile_format(self, log_format: str) -> Tuple[str, List[KeyMethod]]:
         """Translate log_format into form usable by modulo formatting
@@ -117,6 +231,57 @@ class AccessLogger(AbstractAccessLogger):
         log_format = self.CLEANUP_RE.sub(r"%\1", log_format)
         return log_format, methods
 
+    @classmethod
+    def _compile_line(cls, log_format: str) -> Tuple[str, _LineFormatter, List[str]]:
+        """Generate a function formatting a log line for log_format.
+
+        The function is called with (request, response, time, with_extra)
+        and returns (message, extra), extra is None unless with_extra.
+        """
+        lines = ["def format_line(request, response, time, with_extra):"]
+        namespace = {
+            "os": os,
+            "_start_time": _start_time,
+        }  # type: Dict[str, Any]
+        values = []
+        extra = {}  # type: Dict[str, Any]
+        for i, atom in enumerate(cls.FORMAT_RE.findall(log_format)):
+            value = "v%d" % i
+            header_key = "k%d" % i
+            if atom[1] == "":
+                code = _ATOM_CODE[atom[0]]
+                extra[cls.LOG_FORMAT_MAP[atom[0]]] = value
+            else:
+                code = _ATOM_CODE[atom[2]]
+                namespace[header_key] = istr(atom[1])
+                dct = extra.setdefault(cls.LOG_FORMAT_MAP[atom[2]], {})
+                dct[atom[1]] = value
+            lines.extend("    " + line.format(v=value, k=header_key) for line in code)
+            values.append(value)
+
+        message_format = cls.FORMAT_RE.sub(r"%s", log_format)
+        message_format = cls.CLEANUP_RE.sub(r"%\1", message_format)
+        message = cls._message_code(message_format, values, extra, namespace)
+        lines.append("    message = " + message)
+        lines.append("    if not with_extra:")
+        lines.append("        return message, None")
+        lines.append("    return message, {}".format(_dict_literal(extra)))
+
+        exec(compile("\n".join(lines), "<access log format>", "exec"), namespace)
+        return message_format, namespace["format_line"], list(extra)
+
+    @classmethod
+    def _message_code(
+        cls,
+        message_format: str,
+        values: List[str],
+        extra: Dict[str, Any],
+        namespace: Dict[str, Any],
+    ) -> str:
+        """Return an expression building the message from atom values."""
+        namespace["message_format"] = message_format
+        return "message_format % ({})".format("".join(v + ", " for v in values))
+
     @staticmethod
     def _format_i(
         key: str, request: BaseRequest, response: StreamResponse, time: float
@@ -143,10 +308,7 @@ class AccessLogger(AbstractAccessLogger):
 
     @staticmethod
     def _format_t(request: BaseRequest, response: StreamResponse, time: float) -> str:
-        tz = datetime.timezone(datetime.timedelta(seconds=-time_mod.timezone))
-        now = datetime.datetime.now(tz)
-        start_time = now - datetime.timedelta(seconds=time)
-        return start_time.strftime("[%d/%b/%Y:%H:%M:%S %z]")
+        return _start_time(time)
 
     @staticmethod
     def _format_P(request: BaseRequest, response: StreamResponse, time: float) -> str:
@@ -183,28 +345,99 @@ class AccessLogger(AbstractAccessLogger):
     def _format_D(request: BaseRequest, response: StreamResponse, time: float) -> str:
         return str(round(time * 1000000))
 
-    def _format_line(
-        self, request: BaseRequest, response: StreamResponse, time: float
-    ) -> Iterable[Tuple[str, Callable[[BaseRequest, StreamResponse, float], str]]]:
-        return [(key, method(request, response, time)) for key, method in self._methods]
-
     def log(self, request: BaseRequest, response: StreamResponse, time: float) -> None:
         try:
-            fmt_info = self._format_line(request, response, time)
-
-            values = list()
-            extra = dict()
-            for key, value in fmt_info:
-                values.append(value)
-
-                if key.__class__ is str:
-                    extra[key] = value
-                else:
-                    k1, k2 = key  # type: ignore
-                    dct = extra.get(k1, {})  # type: ignore
-                    dct[k2] = value  # type: ignore
-                    extra[k1] = dct  # type: ignore
-
-            self.logger.info(self._log_format % tuple(values), extra=extra)
+            sample_rates = self.sample_rates
+            if sample_rates is not None and response is not None:
+                rate = sample_rates.get(response.status // 100)
+                if rate is not None and random.random() >= rate:
+                    return
+            logger = self.logger
+            if not logger.isEnabledFor(logging.INFO):
+                return
+            uses_extra = self._uses_extra
+            if uses_extra is None:
+                uses_extra = self._uses_extra = _logger_uses_extra(
+                    logger, self._extra_keys
+                )
+            message, extra = self._format_line(request, response, time, uses_extra)
+            logger.info(message, extra=extra)
         except Exception:
             self.logger.exception("Error in logging")
+
+
+class JSONAccessLogger(AccessLogger):
+    """Access logger writing a JSON object per line.
+
+    Fields are selected with the same format atoms as for AccessLogger,
+    only the atoms are used, other text of the format is ignored. Keys
+    are named after LOG_FORMAT_MAP, e.g. "%a %s %{User-Agent}i" gives
+    {"remote_address": "127.0.0.1", "response_status": 200,
+     "request_header": {"User-Agent": "curl/7.68.0"}}.
+
+    Keys are encoded once per format, only values are encoded per line.
+    """
+
+    _FORMAT_CACHE = {}  # type: Dict[str, Tuple[str, _LineFormatter, List[str]]]
+
+    @classmethod
+    def _message_code(
+        cls,
+        message_format: str,
+        values: List[str],
+        extra: Dict[str, Any],
+        namespace: Dict[str, Any],
+    ) -> str:
+        namespace["_json_value"] = _json_value
+        parts = []  # type: List[Tuple[bool, str]]
+        _json_object_code(extra, parts)
+        code = []  # type: List[str]
+        const = ""
+        for is_const, part in parts:
+            if is_const:
+                const += part
+            else:
+                if const:
+                    code.append(repr(const))
+                    const = ""
+                code.append(part)
+        code.append(repr(const))
+        return " + ".join(code)
+
+
+# atoms values of which are always int
+_INT_FIELDS = frozenset(("response_status", "response_size"))
+
+
+def _json_value(value: Any) -> str:
+    if value.__class__ is str:
+        return encode_basestring_ascii(value)
+    if value.__class__ is int:
+        return str(value)
+    return encode_basestring_ascii(str(value))
+
+
+def _json_object_code(dct: Dict[str, Any], parts: List[Tuple[bool, str]]) -> None:
+    # append (is constant, text) parts of a JSON object: constant
+    # strings and expressions encoding values
+    parts.append((True, "{"))
+    for i, (key, value) in enumerate(dct.items()):
+        prefix = ", " if i else ""
+        parts.append((True, prefix + encode_basestring_ascii(key) + ": "))
+        if isinstance(value, dict):
+            _json_object_code(value, parts)
+        elif key in _INT_FIELDS:
+            parts.append((False, "'%d' % {}".format(value)))
+        else:
+            parts.append((False, "_json_value({})".format(value)))
+    parts.append((True, "}"))
+
+
+def _dict_literal(dct: Dict[str, Any]) -> str:
+    # values are names of local variables or nested dicts
+    items = []
+    for key, value in dct.items():
+        if isinstance(value, dict):
+            value = _dict_literal(value)
+        items.append("{!r}: {}".format(key, value))
+    return "{" + ", ".join(items) + "}"
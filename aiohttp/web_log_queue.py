@@ -0,0 +1,177 @@
+"""Non-blocking access log writing."""
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional
+
+from .log import access_logger
+
+__all__ = ("AccessLogQueue",)
+
+
+class _QueueLogger(logging.Logger):
+    """Put records logged through it into the queue of the owner.
+
+    The logger is not registered in the logging module and has no
+    handlers of its own, the writer thread passes queued records to
+    handle() of the owner's logger.
+    """
+
+    def __init__(self, owner: "AccessLogQueue") -> None:
+        super().__init__(owner.logger.name)
+        self.parent = owner.logger
+        self._owner = owner
+
+    def isEnabledFor(self, level: int) -> bool:
+        # the level cache of a not registered logger is never cleared
+        return self._owner.logger.isEnabledFor(level)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        self._owner._put(record)
+
+
+# queue loggers of started queues by the queued loggers, access
+# loggers of new connections log through them
+_queue_loggers: Dict[logging.Logger, _QueueLogger] = {}
+
+
+def _queued(logger: logging.Logger) -> logging.Logger:
+    """Return the logger access log records of *logger* are sent to."""
+    return _queue_loggers.get(logger, logger)
+
+
+class AccessLogQueue:
+    """Emit access log records from a writer thread.
+
+    While the queue is started, access loggers of new connections put
+    records for *logger* into a queue of *maxsize* records instead of
+    passing them to handlers. Log lines are still formatted on the event
+    loop, the writer thread drains the queue in batches of up to
+    *batch_size* records and passes them to logger.handle(), so filters,
+    handlers and propagation of the logging configuration apply as usual.
+
+    A record is dropped if the queue is full, so slow handlers never
+    block the event loop.
+    """
+
+    __slots__ = (
+        "_logger",
+        "_batch_size",
+        "_queue",
+        "_queue_logger",
+        "_lock",
+        "_running",
+        "_thread",
+        "queued",
+        "written",
+        "dropped",
+        "batches",
+    )
+
+    def __init__(
+        self,
+        logger: logging.Logger = access_logger,
+        *,
+        maxsize: int = 10000,
+        batch_size: int = 256,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize should be positive")
+        if batch_size < 1:
+            raise ValueError("batch_size should be positive")
+        self._logger = logger
+        self._batch_size = batch_size
+        self._queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize)
+        self._queue_logger = _QueueLogger(self)
+        # guards the counters and the running flag, records are put
+        # from event loop threads and written from the writer thread
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def pending(self) -> int:
+        """Amount of records waiting in the queue."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Access log queue is already started")
+        if self._logger in _queue_loggers:
+            raise RuntimeError(
+                f"Access log records of {self._logger.name!r} logger "
+                "are queued already"
+            )
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._write, name="aiohttp-access-log", daemon=True
+        )
+        self._thread.start()
+        _queue_loggers[self._logger] = self._queue_logger
+
+    def stop(self) -> None:
+        """Write all queued records and stop the writer thread."""
+        if self._thread is None:
+            return
+        del _queue_loggers[self._logger]
+        with self._lock:
+            self._running = False
+        # no records are put after the flag is reset
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _put(self, record: logging.LogRecord) -> None:
+        with self._lock:
+            running = self._running
+            if running:
+                try:
+                    self._queue.put_nowait(record)
+                except queue.Full:
+                    self.dropped += 1
+                else:
+                    self.queued += 1
+        if not running:
+            # a connection outlived the queue
+            self._logger.handle(record)
+
+    def _write(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        batch_size = self._batch_size
+        while True:
+            record = get()
+            batch: List[logging.LogRecord] = []
+            # None is put last by stop()
+            while record is not None:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    break
+                try:
+                    record = get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._emit(batch)
+            if record is None:
+                return
+
+    def _emit(self, batch: List[logging.LogRecord]) -> None:
+        handle = self._logger.handle
+        for record in batch:
+            handle(record)
+        with self._lock:
+            self.written += len(batch)
+            self.batches += 1
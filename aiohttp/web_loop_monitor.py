@@ -0,0 +1,188 @@
+"""Event loop lag monitoring."""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from logging import Logger
+from types import FrameType
+from typing import Callable, List, Optional
+
+import attr
+
+from .log import server_logger
+from .web_metrics import ServerMetrics
+from .web_protocol import _handled_requests
+
+__all__ = ("LoopLagMonitor", "LoopStall")
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class LoopStall:
+    lag: float
+    route: Optional[str]
+    stack: List[str]
+
+
+class LoopLagMonitor:
+    """Measure event loop scheduling delay and report long stalls.
+
+    A callback is scheduled every *interval* seconds, the difference
+    between the planned and actual time of its run is the loop lag.
+
+    A watchdog thread takes a stack sample of the loop thread if the
+    callback is not run for *threshold* seconds, the sample is reported
+    with the route of the request being handled when the loop is alive
+    again.
+    """
+
+    __slots__ = (
+        "_interval",
+        "_threshold",
+        "_logger",
+        "_metrics",
+        "_on_stall",
+        "_loop",
+        "_handle",
+        "_expected",
+        "_beat",
+        "_thread",
+        "_thread_id",
+        "_stopped",
+        "_sample",
+        "lag",
+        "max_lag",
+        "stalls",
+    )
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.1,
+        threshold: float = 0.5,
+        logger: Logger = server_logger,
+        metrics: Optional[ServerMetrics] = None,
+        on_stall: Optional[Callable[[LoopStall], None]] = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval should be positive")
+        if threshold <= 0:
+            raise ValueError("threshold should be positive")
+        self._interval = interval
+        self._threshold = threshold
+        self._logger = logger
+        self._metrics = metrics
+        self._on_stall = on_stall
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+        self._beat = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._stopped = threading.Event()
+        self._sample: Optional[LoopStall] = None
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        if self._loop is not None:
+            raise RuntimeError("Loop monitor is already started")
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._beat = time.monotonic()
+        self._schedule()
+        self._thread = threading.Thread(
+            target=self._watch, name="aiohttp-loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stopped.set()
+        assert self._thread is not None
+        self._thread.join()
+        self._thread = None
+        self._loop = None
+
+    def _schedule(self) -> None:
+        assert self._loop is not None
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._probe)
+
+    def _probe(self) -> None:
+        assert self._loop is not None
+        lag = max(0.0, self._loop.time() - self._expected)
+        self._beat = time.monotonic()
+        self.lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if self._metrics is not None:
+            self._metrics.loop_lag = lag
+        if lag >= self._threshold:
+            self._report(lag)
+        self._schedule()
+
+    def _report(self, lag: float) -> None:
+        self.stalls += 1
+        sample = self._sample
+        self._sample = None
+        if sample is None:
+            stall = LoopStall(lag=lag, route=None, stack=[])
+        else:
+            stall = LoopStall(lag=lag, route=sample.route, stack=sample.stack)
+        self._logger.warning(
+            "Event loop was blocked for %.3f seconds, route: %s\n%s",
+            lag,
+            stall.route,
+            "".join(stall.stack),
+        )
+        if self._on_stall is not None:
+            self._on_stall(stall)
+
+    def _watch(self) -> None:
+        # the thread sleeps most of the time and wakes up
+        # for a cheap heartbeat check only
+        check_interval = self._threshold / 2
+        sampled = False
+        while not self._stopped.wait(check_interval):
+            stalled = time.monotonic() - self._beat > self._interval + self._threshold
+            if not stalled:
+                sampled = False
+            elif not sampled:
+                sampled = True
+                loop = self._loop
+                frame = sys._current_frames().get(self._thread_id)
+                if loop is not None and frame is not None:
+                    self._sample = self._take_sample(loop, frame)
+
+    @staticmethod
+    def _take_sample(loop: asyncio.AbstractEventLoop, frame: FrameType) -> LoopStall:
+        route = None
+        # the task blocking the loop is still registered as the current
+        # one, RequestHandler records the request its handler runs for
+        task = asyncio.current_task(loop)
+        if task is not None:
+            request = _handled_requests.get(task)
+            if request is not None:
+                route = _route_name(request)
+        stack = traceback.format_stack(frame)
+        return LoopStall(lag=0.0, route=route, stack=stack)
+
+
+def _route_name(request: object) -> str:
+    match_info = getattr(request, "_match_info", None)
+    if match_info is not None and match_info.http_exception is None:
+        resource = match_info.route.resource
+        if resource is not None:
+            return f"{match_info.route.method} {resource.canonical}"
+    return "{} {}".format(getattr(request, "method", ""), getattr(request, "path", ""))
@@ -0,0 +1,212 @@
+"""Low overhead metrics of the HTTP server."""
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
+
+from . import hdrs
+from .web_response import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_request import BaseRequest
+    from .web_response import StreamResponse
+    from .web_urldispatcher import AbstractRoute
+
+
+__all__ = ("ServerMetrics",)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _RouteStats:
+    __slots__ = ("labels", "statuses", "buckets", "duration_sum")
+
+    def __init__(self, labels: str, buckets_count: int) -> None:
+        self.labels = labels
+        # requests count per status class, 1xx..5xx
+        self.statuses = [0] * len(_STATUS_CLASSES)
+        # the last bucket is +Inf
+        self.buckets = [0] * (buckets_count + 1)
+        self.duration_sum = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class ServerMetrics:
+    """Counters and latency histograms of handled requests.
+
+    All storage for a route is allocated on the first request matched to
+    the route, recording of the next requests only increments
+    preallocated counters.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_namespace",
+        "_routes",
+        "_unmatched",
+        "inflight",
+        "bytes_received",
+        "bytes_sent",
+        "keepalive_reused",
+        "parse_errors",
+        "handler_exceptions",
+        "loop_lag",
+    )
+
+    def __init__(
+        self, *, buckets: Iterable[float] = DEFAULT_BUCKETS, namespace: str = "aiohttp"
+    ) -> None:
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds:
+            raise ValueError("At least one bucket is required")
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError("Buckets should be sorted and unique")
+        self._buckets = bounds
+        self._namespace = namespace
+        self._routes: Dict["AbstractRoute", _RouteStats] = {}
+        self._unmatched = _RouteStats('method="",route=""', len(bounds))
+        self.inflight = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.keepalive_reused = 0
+        self.parse_errors = 0
+        self.handler_exceptions = 0
+        self.loop_lag = 0.0
+
+    @property
+    def buckets(self) -> Sequence[float]:
+        return self._buckets
+
+    @property
+    def requests(self) -> int:
+        """Total amount of recorded requests."""
+        total = sum(self._unmatched.statuses)
+        for stats in self._routes.values():
+            total += sum(stats.statuses)
+        return total
+
+    def record(
+        self, request: "BaseRequest", response: "StreamResponse", duration: float
+    ) -> None:
+        """Account finished request."""
+        match_info = getattr(request, "_match_info", None)
+        if match_info is None or match_info.http_exception is not None:
+            stats = self._unmatched
+        else:
+            route = match_info.route
+            stats = self._routes.get(route)  # type: ignore
+            if stats is None:
+                stats = self._add_route(route)
+
+        status_class = response.status // 100 - 1
+        if 0 <= status_class < 5:
+            stats.statuses[status_class] += 1
+        stats.buckets[bisect_left(self._buckets, duration)] += 1
+        stats.duration_sum += duration
+
+        self.bytes_received += request._payload.total_bytes
+        self.bytes_sent += request._payload_writer.output_size
+
+    def _add_route(self, route: "AbstractRoute") -> _RouteStats:
+        resource = route.resource
+        path = resource.canonical if resource is not None else ""
+        labels = 'method="{}",route="{}"'.format(_escape(route.method), _escape(path))
+        stats = self._routes[route] = _RouteStats(labels, len(self._buckets))
+        return stats
+
+    def render(self) -> str:
+        """Render metrics in Prometheus text exposition format."""
+        ns = self._namespace
+        lines: List[str] = []
+        all_stats = [self._unmatched]
+        all_stats.extend(self._routes.values())
+
+        def header(name: str, kind: str, help: str) -> str:
+            lines.append(f"# HELP {ns}_{name} {help}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            return f"{ns}_{name}"
+
+        name = header("requests_total", "counter", "Handled requests.")
+        for stats in all_stats:
+            for status_class, count in zip(_STATUS_CLASSES, stats.statuses):
+                if count:
+                    lines.append(
+                        f'{name}{{{stats.labels},status="{status_class}"}} {count}'
+                    )
+
+        bounds = [_format_bound(bound) for bound in self._buckets] + ["+Inf"]
+        name = header(
+            "request_duration_seconds", "histogram", "Request handling duration."
+        )
+        for stats in all_stats:
+            total = sum(stats.buckets)
+            if not total:
+                continue
+            cumulative = 0
+            for bound, count in zip(bounds, stats.buckets):
+                cumulative += count
+                lines.append(
+                    f'{name}_bucket{{{stats.labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{name}_sum{{{stats.labels}}} {stats.duration_sum!r}")
+            lines.append(f"{name}_count{{{stats.labels}}} {total}")
+
+        for suffix, kind, help, value in (
+            ("requests_in_flight", "gauge", "Requests being handled.", self.inflight),
+            (
+                "request_bytes_total",
+                "counter",
+                "Received request body bytes.",
+                self.bytes_received,
+            ),
+            ("response_bytes_total", "counter", "Sent bytes.", self.bytes_sent),
+            (
+                "keepalive_reused_total",
+                "counter",
+                "Requests served on reused keep-alive connections.",
+                self.keepalive_reused,
+            ),
+            (
+                "parse_errors_total",
+                "counter",
+                "Malformed HTTP requests.",
+                self.parse_errors,
+            ),
+            (
+                "handler_exceptions_total",
+                "counter",
+                "Unhandled exceptions raised by request handlers.",
+                self.handler_exceptions,
+            ),
+            (
+                "loop_lag_seconds",
+                "gauge",
+                "Event loop scheduling delay.",
+                self.loop_lag,
+            ),
+        ):
+            name = header(suffix, kind, help)
+            lines.append(f"{name} {value}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+    async def handler(self, request: Any) -> Response:
+        """Web-handler exposing metrics for Prometheus scraper.
+
+        app.router.add_get('/metrics', metrics.handler)
+        """
+        return Response(
+            body=self.render().encode("utf-8"),
+            headers={hdrs.CONTENT_TYPE: _CONTENT_TYPE},
+        )
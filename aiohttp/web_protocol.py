@@ -1,5 +1,7 @@
 import asyncio
 import asyncio.streams
+import math
+import time
 import traceback
 from collections import deque
 from contextlib import suppress
@@ -12,6 +14,7 @@ from typing import (
     Awaitable,
     Callable,
     Deque,
+    Dict,
     Optional,
     Sequence,
     Tuple,
@@ -38,6 +41,7 @@ from .streams import EMPTY_PAYLOAD, StreamReader
 from .tcp_helpers import tcp_keepalive
 from .web_exceptions import HTTPException
 from .web_log import AccessLogger
+from .web_log_queue import _queued
 from .web_request import BaseRequest
 from .web_response import Response, StreamResponse
 
@@ -68,6 +72,10 @@ ERROR = RawRequestMessage(
     "UNKNOWN", "/", HttpVersion10, {}, {}, True, False, False, False, yarl.URL("/")
 )
 
+# requests by the tasks running their handlers, the loop monitor thread
+# looks up the current task of a blocked loop here
+_handled_requests: Dict["asyncio.Task[Any]", BaseRequest] = {}
+
 
 class RequestPayloadError(Exception):
     """Payload parsing error."""
@@ -138,6 +146,19 @@ class RequestHandler(BaseProtocol):
 
     max_headers -- Optional maximum header size
 
+    max_pipelined_requests -- Optional maximum number of parsed but
+                              not yet handled pipelined requests,
+                              reading is paused when it is reached
+
+    handler_timeout -- Optional timeout for request handler execution
+
+    deadline_header -- Optional name of request header with absolute
+                       UNIX timestamp after which the client is not
+                       interested in the response anymore
+
+    lazy_headers -- build request.headers multidict on first access only,
+                    default is off
+
     """
 
     KEEPALIVE_RESCHEDULE_DELAY = 1
@@ -155,6 +176,9 @@ class RequestHandler(BaseProtocol):
         "_lingering_time",
         "_messages",
         "_message_tail",
+        "_max_pipelined_requests",
+        "_pipelining_paused",
+        "_transport_paused",
         "_waiter",
         "_task_handler",
         "_upgrade",
@@ -167,6 +191,13 @@ class RequestHandler(BaseProtocol):
         "_close",
         "_force_close",
         "_current_request",
+        "_handler_timeout",
+        "_deadline_header",
+        "_handler_start",
+        "_client_deadline",
+        "_handler_timeout_handle",
+        "_handler_timed_out",
+        "_metrics",
     )
 
     def __init__(
@@ -185,6 +216,10 @@ class RequestHandler(BaseProtocol):
         max_field_size: int = 8190,
         lingering_time: float = 10.0,
         read_bufsize: int = 2 ** 16,
+        max_pipelined_requests: Optional[int] = None,
+        handler_timeout: Optional[float] = None,
+        deadline_header: Optional[str] = None,
+        lazy_headers: bool = False,
     ):
         super().__init__(loop)
 
@@ -204,6 +239,11 @@ class RequestHandler(BaseProtocol):
 
         self._messages: Deque[_MsgType] = deque()
         self._message_tail = b""
+        self._max_pipelined_requests = max_pipelined_requests
+        # reading is paused by the payload flow control (_reading_paused)
+        # and by the full pipelined requests queue independently
+        self._pipelining_paused = False
+        self._transport_paused = False
 
         self._waiter = None  # type: Optional[asyncio.Future[None]]
         self._task_handler = None  # type: Optional[asyncio.Task[None]]
@@ -218,6 +258,7 @@ class RequestHandler(BaseProtocol):
             max_field_size=max_field_size,
             max_headers=max_headers,
             payload_exception=RequestPayloadError,
+            lazy_headers=lazy_headers,
         )  # type: Optional[HttpRequestParser]
 
         self.logger = logger
@@ -228,7 +269,8 @@ class RequestHandler(BaseProtocol):
                     access_log_class()
                 )  # type: Optional[AbstractAsyncAccessLogger]
             else:
-                access_logger = access_log_class(access_log, access_log_format)
+                # records go to the access log queue if it is started
+                access_logger = access_log_class(_queued(access_log), access_log_format)
                 self.access_logger = AccessLoggerWrapper(
                     access_logger,
                     self._loop,
@@ -236,6 +278,14 @@ class RequestHandler(BaseProtocol):
         else:
             self.access_logger = None
 
+        self._handler_timeout = handler_timeout
+        self._deadline_header = deadline_header
+        self._handler_start = 0.0
+        self._client_deadline = None  # type: Optional[float]
+        self._handler_timeout_handle = None  # type: Optional[asyncio.TimerHandle]
+        self._handler_timed_out = False
+        self._metrics = manager.metrics
+
         self._close = False
         self._force_close = False
 
@@ -354,6 +404,11 @@ class RequestHandler(BaseProtocol):
                 self._request_count += 1
                 self._messages.append((msg, payload))
 
+            max_pipelined = self._max_pipelined_requests
+            if max_pipelined is not None and len(self._messages) >= max_pipelined:
+                self._pipelining_paused = True
+                self._update_reading()
+
             waiter = self._waiter
             if messages and waiter is not None and not waiter.done():
                 # don't set result twice
@@ -373,6 +428,30 @@ class RequestHandler(BaseProtocol):
             if eof:
                 self.close()
 
+    def pause_reading(self) -> None:
+        self._reading_paused = True
+        self._update_reading()
+
+    def resume_reading(self) -> None:
+        self._reading_paused = False
+        self._update_reading()
+
+    def _update_reading(self) -> None:
+        # the transport reads only if neither the payload
+        # nor the pipelined requests queue is full
+        paused = self._reading_paused or self._pipelining_paused
+        transport = self.transport
+        if paused == self._transport_paused or transport is None:
+            return
+        try:
+            if paused:
+                transport.pause_reading()
+            else:
+                transport.resume_reading()
+        except (AttributeError, NotImplementedError, RuntimeError):
+            pass
+        self._transport_paused = paused
+
     def keep_alive(self, val: bool) -> None:
         """Set keep-alive connection mode.
 
@@ -437,12 +516,31 @@ class RequestHandler(BaseProtocol):
         request_handler: Callable[[BaseRequest], Awaitable[StreamResponse]],
     ) -> Tuple[StreamResponse, bool]:
         assert self._request_handler is not None
+        self._handler_start = start_time
+        self._handler_timed_out = False
+        deadline = None
+        if self._handler_timeout is not None:
+            deadline = start_time + self._handler_timeout
+        self._client_deadline = None
+        if self._deadline_header is not None:
+            self._client_deadline = self._parse_deadline(request)
+            if self._client_deadline is not None:
+                if self._client_deadline <= self._loop.time():
+                    # the client has given up already
+                    resp = self.handle_error(request, 503)
+                    reset = await self.finish_response(request, resp, start_time)
+                    return resp, reset
+                if deadline is None or self._client_deadline < deadline:
+                    deadline = self._client_deadline
         try:
             try:
                 self._current_request = request
+                if deadline is not None:
+                    self._schedule_handler_timeout(deadline)
                 resp = await request_handler(request)
             finally:
                 self._current_request = None
+                timed_out = self._cancel_handler_timeout()
         except HTTPException as exc:
             resp = Response(
                 status=exc.status, reason=exc.reason, text=exc.text, headers=exc.headers
@@ -450,12 +548,18 @@ class RequestHandler(BaseProtocol):
             resp._cookies = exc._cookies
             reset = await self.finish_response(request, resp, start_time)
         except asyncio.CancelledError:
-            raise
+            if not timed_out:
+                raise
+            self.log_debug("Request handler cancelled by timeout.")
+            resp = self.handle_error(request, 504)
+            reset = await self.finish_response(request, resp, start_time)
         except asyncio.TimeoutError as exc:
             self.log_debug("Request handler timed out.", exc_info=exc)
             resp = self.handle_error(request, 504)
             reset = await self.finish_response(request, resp, start_time)
         except Exception as exc:
+            if self._metrics is not None:
+                self._metrics.handler_exceptions += 1
             resp = self.handle_error(request, 500, exc)
             reset = await self.finish_response(request, resp, start_time)
         else:
@@ -463,6 +567,64 @@ class RequestHandler(BaseProtocol):
 
         return resp, reset
 
+    def set_handler_timeout(self, timeout: float) -> None:
+        """Reset timeout of currently executed request handler.
+
+        The timeout is counted from the request start, the client's
+        deadline is never exceeded.
+        """
+        if self._current_request is None:
+            return
+        deadline = self._handler_start + timeout
+        if self._client_deadline is not None and self._client_deadline < deadline:
+            deadline = self._client_deadline
+        self._schedule_handler_timeout(deadline)
+
+    def _schedule_handler_timeout(self, deadline: float) -> None:
+        if self._handler_timeout_handle is not None:
+            self._handler_timeout_handle.cancel()
+        task = asyncio.current_task(loop=self._loop)
+        assert task is not None
+        self._handler_timeout_handle = self._loop.call_at(
+            deadline, self._on_handler_timeout, task
+        )
+
+    def _on_handler_timeout(self, task: "asyncio.Task[Any]") -> None:
+        self._handler_timeout_handle = None
+        if self._current_request is None or task.done():
+            # the handler has finished in the same loop iteration
+            return
+        self._handler_timed_out = True
+        task.cancel()
+
+    def _cancel_handler_timeout(self) -> bool:
+        # Return True if the running handler was cancelled by the timeout.
+        if self._handler_timeout_handle is not None:
+            self._handler_timeout_handle.cancel()
+            self._handler_timeout_handle = None
+        if not self._handler_timed_out:
+            return False
+        self._handler_timed_out = False
+        task = asyncio.current_task(loop=self._loop)
+        if task is not None and hasattr(task, "uncancel"):
+            # the handler may have swallowed the cancellation,
+            # don't leak it into the next request of the connection
+            task.uncancel()
+        return True
+
+    def _parse_deadline(self, request: BaseRequest) -> Optional[float]:
+        assert self._deadline_header is not None
+        value = request._peek_header(self._deadline_header)
+        if value is None:
+            return None
+        try:
+            timestamp = float(value)
+        except ValueError:
+            return None
+        if not math.isfinite(timestamp):
+            return None
+        return self._loop.time() + timestamp - time.time()
+
     async def start(self) -> None:
         """Process incoming request.
 
@@ -478,6 +640,11 @@ class RequestHandler(BaseProtocol):
         manager = self._manager
         assert manager is not None
         keepalive_timeout = self._keepalive_timeout
+        limiter = manager.limiter
+        metrics = self._metrics
+        handled = 0
+        acquired = False
+        acquired_at = 0.0
         resp = None
         assert self._request_factory is not None
         assert self._request_handler is not None
@@ -494,29 +661,69 @@ class RequestHandler(BaseProtocol):
                     self._waiter = None
 
             message, payload = self._messages.popleft()
+            if self._pipelining_paused:
+                if len(self._messages) < cast(int, self._max_pipelined_requests):
+                    self._pipelining_paused = False
+                    self._update_reading()
 
             start = loop.time()
 
             manager.requests_count += 1
+            if metrics is not None and handled:
+                metrics.keepalive_reused += 1
+            handled += 1
             writer = StreamWriter(self, loop)
             if isinstance(message, _ErrInfo):
+                if metrics is not None:
+                    metrics.parse_errors += 1
                 # make request_factory work
                 request_handler = self._make_error_handler(message)
                 message = ERROR
+            elif manager.is_overloaded():
+                manager.rejected_requests += 1
+                request_handler = manager._handle_overload
+            elif limiter is not None:
+                try:
+                    acquired = await limiter.acquire()
+                except asyncio.CancelledError:
+                    break
+                if acquired:
+                    acquired_at = loop.time()
+                    request_handler = self._request_handler
+                else:
+                    manager.rejected_requests += 1
+                    request_handler = manager._handle_overload
             else:
                 request_handler = self._request_handler
 
-            request = self._request_factory(message, payload, self, writer, handler)
             try:
-                # a new task is used for copy context vars (#3406)
-                task = self._loop.create_task(
-                    self._handle_request(request, start, request_handler)
-                )
+                manager.inflight_requests += 1
+                if metrics is not None:
+                    metrics.inflight += 1
                 try:
-                    resp, reset = await task
+                    request = self._request_factory(
+                        message, payload, self, writer, handler
+                    )
+                    # a new task is used for copy context vars (#3406)
+                    task = self._loop.create_task(
+                        self._handle_request(request, start, request_handler)
+                    )
+                    _handled_requests[task] = request
+                    try:
+                        resp, reset = await task
+                    finally:
+                        del _handled_requests[task]
                 except (asyncio.CancelledError, ConnectionError):
                     self.log_debug("Ignored premature client disconnection")
                     break
+                finally:
+                    manager.inflight_requests -= 1
+                    if metrics is not None:
+                        metrics.inflight -= 1
+                    if acquired:
+                        assert limiter is not None
+                        limiter.release(loop.time() - acquired_at)
+                        acquired = False
 
                 # Drop the processed task from asyncio.Task.all_tasks() early
                 del task
@@ -615,9 +822,13 @@ class RequestHandler(BaseProtocol):
             await prepare_meth(request)
             await resp.write_eof()
         except ConnectionError:
+            if self._metrics is not None:
+                self._metrics.record(request, resp, self._loop.time() - start_time)
             await self.log_access(request, resp, start_time)
             return True
         else:
+            if self._metrics is not None:
+                self._metrics.record(request, resp, self._loop.time() - start_time)
             await self.log_access(request, resp, start_time)
             return False
 
@@ -6,13 +6,20 @@ import re
 import socket
 import string
 import tempfile
+import threading
 import types
+import weakref
 from email.utils import parsedate
 from http.cookies import SimpleCookie
 from types import MappingProxyType
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     Iterator,
     Mapping,
@@ -36,17 +43,20 @@ from .helpers import (
     _SENTINEL,
     ChainMapProxy,
     HeadersMixin,
+    is_bytes_json_decoder,
     is_expected_content_type,
-    reify,
+    is_utf8,
+    reify_slot,
     sentinel,
     set_result,
 )
-from .http_parser import RawRequestMessage
+from .http_parser import RawRequestMessage, headers_from_raw
 from .http_writer import HttpVersion
 from .multipart import BodyPartReader, MultipartReader
 from .streams import EmptyStreamReader, StreamReader
 from .typedefs import (
     DEFAULT_JSON_DECODER,
+    JSONBytesDecoder,
     JSONDecoder,
     LooseHeaders,
     RawHeaders,
@@ -55,6 +65,7 @@ from .typedefs import (
 from .web_exceptions import (
     HTTPBadRequest,
     HTTPRequestEntityTooLarge,
+    HTTPServiceUnavailable,
     HTTPUnsupportedMediaType,
 )
 from .web_response import StreamResponse
@@ -77,6 +88,39 @@ class FileField:
     headers: "CIMultiDictProxy[str]"
 
 
+# the amount of uploaded data written to disk at once
+_SPOOL_BATCH_SIZE: Final[int] = 2 ** 20
+
+
+class _SpoolBudget:
+    """Total size of uploaded files spooled by requests of an application.
+
+    The size of a file is returned to the budget when the file object is
+    garbage collected. Requests can be handled by several threads, see
+    run_app(threads=...).
+    """
+
+    __slots__ = ("max_size", "size", "_lock")
+
+    def __init__(self, max_size: int = 0) -> None:
+        if max_size < 0:
+            raise ValueError("upload_spool_max_size should not be negative")
+        self.max_size = max_size
+        self.size = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int) -> bool:
+        with self._lock:
+            if 0 < self.max_size < self.size + size:
+                return False
+            self.size += size
+            return True
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self.size -= size
+
+
 _TCHAR: Final[str] = string.digits + string.ascii_letters + r"!#$%&'*+.^_`|~-"
 # '-' at the end to prevent interpretation as range in a char class
 
@@ -132,13 +176,27 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         "_post",
         "_read_bytes",
         "_state",
-        "_cache",
         "_task",
         "_client_max_size",
+        "_upload_spool_threshold",
+        "_upload_dir",
+        "_upload_spool_budget",
         "_loop",
         "_transport_sslcontext",
         "_transport_peername",
         "_disconnection_waiters",
+        # reify_slot storage
+        "_forwarded",
+        "_scheme",
+        "_host",
+        "_remote",
+        "_url",
+        "_path_qs",
+        "_if_modified_since",
+        "_if_unmodified_since",
+        "_if_range",
+        "_cookies",
+        "_http_range",
         "__weakref__",
     )
 
@@ -152,6 +210,9 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         loop: asyncio.AbstractEventLoop,
         *,
         client_max_size: int = 1024 ** 2,
+        upload_spool_threshold: int = 1024 ** 2,
+        upload_dir: Optional[str] = None,
+        upload_spool_budget: Optional[_SpoolBudget] = None,
         state: Optional[Dict[str, Any]] = None,
         scheme: Optional[str] = None,
         host: Optional[str] = None,
@@ -165,7 +226,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         self._payload_writer = payload_writer
 
         self._payload = payload
-        self._headers = message.headers
+        self._headers = message.headers  # type: Optional[CIMultiDictProxy[str]]
         self._method = message.method
         self._version = message.version
         self._rel_url = message.url
@@ -175,11 +236,18 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         self._read_bytes = None  # type: Optional[bytes]
 
         self._state = state
-        self._cache = {}  # type: Dict[str, Any]
         self._task = task
         self._client_max_size = client_max_size
+        if upload_spool_threshold < 0:
+            raise ValueError("upload_spool_threshold should not be negative")
+        self._upload_spool_threshold = upload_spool_threshold
+        self._upload_dir = upload_dir
+        if upload_spool_budget is None:
+            upload_spool_budget = _SpoolBudget()
+        self._upload_spool_budget = upload_spool_budget
         self._loop = loop
-        self._disconnection_waiters = set()  # type: Set[asyncio.Future[None]]
+        # created on the first wait_for_disconnection() call
+        self._disconnection_waiters = None  # type: Optional[Set[asyncio.Future[None]]]
 
         transport = self._protocol.transport
         assert transport is not None
@@ -187,11 +255,11 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         self._transport_peername = transport.get_extra_info("peername")
 
         if scheme is not None:
-            self._cache["scheme"] = scheme
+            self._scheme = scheme
         if host is not None:
-            self._cache["host"] = host
+            self._host = host
         if remote is not None:
-            self._cache["remote"] = remote
+            self._remote = remote
 
     def clone(
         self,
@@ -247,6 +315,9 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
             self._task,
             self._loop,
             client_max_size=self._client_max_size,
+            upload_spool_threshold=self._upload_spool_threshold,
+            upload_dir=self._upload_dir,
+            upload_spool_budget=self._upload_spool_budget,
             state=self._state.copy(),
             **kwargs,
         )
@@ -269,7 +340,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
     def writer(self) -> AbstractStreamWriter:
         return self._payload_writer
 
-    @reify
+    @property
     def rel_url(self) -> URL:
         return self._rel_url
 
@@ -292,12 +363,12 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
 
     ########
 
-    @reify
+    @property
     def secure(self) -> bool:
         """A bool indicating if the request is handled with SSL."""
         return self.scheme == "https"
 
-    @reify
+    @reify_slot
     def forwarded(self) -> Tuple[Mapping[str, str], ...]:
         """A tuple containing all parsed Forwarded header(s).
 
@@ -318,7 +389,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         Returns a tuple containing one or more immutable dicts
         """
         elems = []
-        for field_value in self._message.headers.getall(hdrs.FORWARDED, ()):
+        for field_value in self.headers.getall(hdrs.FORWARDED, ()):
             length = len(field_value)
             pos = 0
             need_separator = False
@@ -358,7 +429,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
                     pos = field_value.find(",", pos)
         return tuple(elems)
 
-    @reify
+    @reify_slot
     def scheme(self) -> str:
         """A string representing the scheme of the request.
 
@@ -374,7 +445,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         else:
             return "http"
 
-    @reify
+    @property
     def method(self) -> str:
         """Read only property for getting HTTP method.
 
@@ -382,7 +453,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return self._method
 
-    @reify
+    @property
     def version(self) -> HttpVersion:
         """Read only property for getting HTTP version of request.
 
@@ -390,7 +461,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return self._version
 
-    @reify
+    @reify_slot
     def host(self) -> str:
         """Hostname of the request.
 
@@ -400,13 +471,13 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         - HOST HTTP header
         - socket.getfqdn() value
         """
-        host = self._message.headers.get(hdrs.HOST)
+        host = self._peek_header(hdrs.HOST)
         if host is not None:
             return host
         else:
             return socket.getfqdn()
 
-    @reify
+    @reify_slot
     def remote(self) -> Optional[str]:
         """Remote IP of client initiated HTTP request.
 
@@ -420,12 +491,12 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         else:
             return self._transport_peername
 
-    @reify
+    @reify_slot
     def url(self) -> URL:
         url = URL.build(scheme=self.scheme, host=self.host)
         return url.join(self._rel_url)
 
-    @reify
+    @property
     def path(self) -> str:
         """The URL including *PATH INFO* without the host or scheme.
 
@@ -433,7 +504,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return self._rel_url.path
 
-    @reify
+    @reify_slot
     def path_qs(self) -> str:
         """The URL including PATH_INFO and the query string.
 
@@ -441,7 +512,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return str(self._rel_url)
 
-    @reify
+    @property
     def raw_path(self) -> str:
         """The URL including raw *PATH INFO* without the host or scheme.
         Warning, the path is unquoted and may contains non valid URL characters
@@ -450,12 +521,12 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return self._message.path
 
-    @reify
+    @property
     def query(self) -> "MultiDictProxy[str]":
         """A multidict with all the variables in the query string."""
         return self._rel_url.query
 
-    @reify
+    @property
     def query_string(self) -> str:
         """The query string in the URL.
 
@@ -463,16 +534,35 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """
         return self._rel_url.query_string
 
-    @reify
+    @property
     def headers(self) -> "CIMultiDictProxy[str]":
         """A case-insensitive multidict proxy with all headers."""
-        return self._headers
+        headers = self._headers
+        if headers is None:
+            # the parser runs in lazy headers mode
+            headers = self._headers = headers_from_raw(self._message.raw_headers)
+        return headers
 
-    @reify
+    @property
     def raw_headers(self) -> RawHeaders:
         """A sequence of pairs for all headers."""
         return self._message.raw_headers
 
+    def _peek_header(self, name: str) -> Optional[str]:
+        """Return the first value of header *name* or None.
+
+        Raw headers are scanned if the headers multidict is not built yet,
+        use it for single headers read on every request.
+        """
+        headers = self._headers
+        if headers is not None:
+            return headers.get(name)
+        bname = name.lower().encode("ascii")
+        for raw_name, raw_value in self._message.raw_headers:
+            if len(raw_name) == len(bname) and raw_name.lower() == bname:
+                return raw_value.decode("utf-8", "surrogateescape")
+        return None
+
     @staticmethod
     def _http_date(_date_str: Optional[str]) -> Optional[datetime.datetime]:
         """Process a date string, return a datetime object"""
@@ -482,53 +572,53 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
                 return datetime.datetime(*timetuple[:6], tzinfo=datetime.timezone.utc)
         return None
 
-    @reify
+    @reify_slot
     def if_modified_since(self) -> Optional[datetime.datetime]:
         """The value of If-Modified-Since HTTP header, or None.
 
         This header is represented as a `datetime` object.
         """
-        return self._http_date(self.headers.get(hdrs.IF_MODIFIED_SINCE))
+        return self._http_date(self._peek_header(hdrs.IF_MODIFIED_SINCE))
 
-    @reify
+    @reify_slot
     def if_unmodified_since(self) -> Optional[datetime.datetime]:
         """The value of If-Unmodified-Since HTTP header, or None.
 
         This header is represented as a `datetime` object.
         """
-        return self._http_date(self.headers.get(hdrs.IF_UNMODIFIED_SINCE))
+        return self._http_date(self._peek_header(hdrs.IF_UNMODIFIED_SINCE))
 
-    @reify
+    @reify_slot
     def if_range(self) -> Optional[datetime.datetime]:
         """The value of If-Range HTTP header, or None.
 
         This header is represented as a `datetime` object.
         """
-        return self._http_date(self.headers.get(hdrs.IF_RANGE))
+        return self._http_date(self._peek_header(hdrs.IF_RANGE))
 
-    @reify
+    @property
     def keep_alive(self) -> bool:
         """Is keepalive enabled by client?"""
         return not self._message.should_close
 
-    @reify
+    @reify_slot
     def cookies(self) -> Mapping[str, str]:
         """Return request cookies.
 
         A read-only dictionary-like object.
         """
-        raw = self.headers.get(hdrs.COOKIE, "")
+        raw = self._peek_header(hdrs.COOKIE) or ""
         parsed = SimpleCookie(raw)  # type: SimpleCookie[str]
         return MappingProxyType({key: val.value for key, val in parsed.items()})
 
-    @reify
+    @reify_slot
     def http_range(self) -> slice:
         """The content of Range HTTP header.
 
         Return a slice instance.
 
         """
-        rng = self._headers.get(hdrs.RANGE)
+        rng = self._peek_header(hdrs.RANGE)
         start, end = None, None
         if rng is not None:
             try:
@@ -557,7 +647,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
 
         return slice(start, end, 1)
 
-    @reify
+    @property
     def content(self) -> StreamReader:
         """Return raw payload stream."""
         return self._payload
@@ -567,7 +657,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         """Return True if request's HTTP BODY can be read, False otherwise."""
         return not self._payload.at_eof()
 
-    @reify
+    @property
     def body_exists(self) -> bool:
         """Return True if request has HTTP BODY, False otherwise."""
         return type(self._payload) is not EmptyStreamReader
@@ -615,11 +705,17 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         *,
         loads: JSONDecoder = DEFAULT_JSON_DECODER,
         content_type: Optional[str] = "application/json",
+        loads_bytes: Optional[bool] = None,
     ) -> Any:
-        """Return BODY as JSON."""
-        body = await self.text()
+        """Return BODY as JSON.
+
+        The body is passed to loads as bytes without decoding to str
+        if loads_bytes is True and the charset is UTF-8 or missing.
+        None means autodetection for json, orjson and ujson loads.
+        """
+        body = await self.read()
         if content_type:
-            ctype = self.headers.get(hdrs.CONTENT_TYPE, "").lower()
+            ctype = (self._peek_header(hdrs.CONTENT_TYPE) or "").lower()
             if not is_expected_content_type(ctype, content_type):
                 raise HTTPBadRequest(
                     text=(
@@ -627,11 +723,30 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
                     )
                 )
 
-        return loads(body)
+        if loads_bytes is None:
+            loads_bytes = is_bytes_json_decoder(loads)
+        charset = self.charset
+        if loads_bytes and (charset is None or is_utf8(charset)):
+            return cast(JSONBytesDecoder, loads)(body)
+        try:
+            text = body.decode(charset or "utf-8")
+        except LookupError:
+            raise HTTPUnsupportedMediaType()
+        return loads(text)
 
     async def multipart(self) -> MultipartReader:
         """Return async iterator to process BODY as multipart."""
-        return MultipartReader(self._headers, self._payload)
+        return MultipartReader(self.headers, self._payload)
+
+    def _form_reader(self) -> MultipartReader:
+        headers = self._headers
+        if headers is None:
+            # the reader needs Content-Type only,
+            # do not build all the headers in lazy headers mode
+            ctype = self._peek_header(hdrs.CONTENT_TYPE)
+            assert ctype is not None
+            headers = CIMultiDictProxy(CIMultiDict({hdrs.CONTENT_TYPE: ctype}))
+        return MultipartReader(headers, self._payload)
 
     async def post(self) -> "MultiDictProxy[Union[str, bytes, FileField]]":
         """Return POST parameters."""
@@ -653,12 +768,11 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
         out = MultiDict()  # type: MultiDict[Union[str, bytes, FileField]]
 
         if content_type == "multipart/form-data":
-            multipart = await self.multipart()
-            max_size = self._client_max_size
+            multipart = self._form_reader()
+            spooled = 0
 
             field = await multipart.next()
             while field is not None:
-                size = 0
                 field_ct = field.headers.get(hdrs.CONTENT_TYPE)
 
                 if isinstance(field, BodyPartReader):
@@ -669,19 +783,8 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
                     # present.
                     # https://tools.ietf.org/html/rfc7578#section-4.4
                     if field.filename:
-                        # store file in temp file
-                        tmp = tempfile.TemporaryFile()
-                        chunk = await field.read_chunk(size=2 ** 16)
-                        while chunk:
-                            chunk = field.decode(chunk)
-                            tmp.write(chunk)
-                            size += len(chunk)
-                            if 0 < max_size < size:
-                                raise HTTPRequestEntityTooLarge(
-                                    max_size=max_size, actual_size=size
-                                )
-                            chunk = await field.read_chunk(size=2 ** 16)
-                        tmp.seek(0)
+                        tmp, size = await self._spool_file(field, spooled)
+                        spooled += size
 
                         if field_ct is None:
                             field_ct = "application/octet-stream"
@@ -695,18 +798,7 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
                         )
                         out.add(field.name, ff)
                     else:
-                        # deal with ordinary data
-                        value = await field.read(decode=True)
-                        if field_ct is None or field_ct.startswith("text/"):
-                            charset = field.get_charset(default="utf-8")
-                            out.add(field.name, value.decode(charset))
-                        else:
-                            out.add(field.name, value)
-                        size += len(value)
-                        if 0 < max_size < size:
-                            raise HTTPRequestEntityTooLarge(
-                                max_size=max_size, actual_size=size
-                            )
+                        out.add(field.name, await self._read_form_value(field))
                 else:
                     raise ValueError(
                         "To decode nested multipart you need " "to use custom reader",
@@ -741,6 +833,126 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
 
         return transport.get_extra_info(name, default)
 
+    async def iter_form(
+        self,
+        *,
+        on_file: Callable[[BodyPartReader, AsyncIterator[bytes]], Awaitable[Any]],
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Iterate over form fields without buffering uploaded files.
+
+        Yield (name, value) pairs in order of arrival. Ordinary fields are
+        decoded as in post(). For file fields on_file(field, chunks) is
+        awaited, chunks is an async iterator of the decoded file content
+        that reads from the connection on demand; the result of the
+        callback is yielded as the field value.
+        """
+        if self.content_type != "multipart/form-data":
+            for item in (await self.post()).items():
+                yield item
+            return
+
+        multipart = self._form_reader()
+        field = await multipart.next()
+        while field is not None:
+            if not isinstance(field, BodyPartReader):
+                raise ValueError(
+                    "To decode nested multipart you need " "to use custom reader",
+                )
+            assert field.name is not None
+            if field.filename:
+                chunks = self._iter_file(field)
+                try:
+                    value = await on_file(field, chunks)
+                finally:
+                    await chunks.aclose()
+            else:
+                value = await self._read_form_value(field)
+            yield field.name, value
+            field = await multipart.next()
+
+    async def _iter_file(self, field: BodyPartReader) -> AsyncGenerator[bytes, None]:
+        max_size = self._client_max_size
+        size = 0
+        chunk = await field.read_chunk(size=2 ** 16, decode=True)
+        while chunk:
+            size += len(chunk)
+            if 0 < max_size < size:
+                raise HTTPRequestEntityTooLarge(max_size=max_size, actual_size=size)
+            yield chunk
+            chunk = await field.read_chunk(size=2 ** 16, decode=True)
+
+    async def _read_form_value(self, field: BodyPartReader) -> Union[str, bytes]:
+        max_size = self._client_max_size
+        value = await field.read(decode=True)
+        if 0 < max_size < len(value):
+            raise HTTPRequestEntityTooLarge(max_size=max_size, actual_size=len(value))
+        field_ct = field.headers.get(hdrs.CONTENT_TYPE)
+        if field_ct is None or field_ct.startswith("text/"):
+            charset = field.get_charset(default="utf-8")
+            return value.decode(charset)
+        return value
+
+    async def _spool_file(
+        self, field: BodyPartReader, spooled: int
+    ) -> Tuple[IO[bytes], int]:
+        """Store uploaded file, return the file and its size.
+
+        Files smaller than upload_spool_threshold are kept in memory,
+        bigger ones are moved to disk; disk writes are batched and
+        performed in the default executor not to block the event loop.
+        *spooled* is the size of files already stored by the request.
+        """
+        max_size = self._client_max_size
+        budget = self._upload_spool_budget
+        max_spooled = budget.max_size
+        threshold = self._upload_spool_threshold
+        loop = self._loop
+        tmp = tempfile.SpooledTemporaryFile(max_size=threshold, dir=self._upload_dir)
+        size = 0
+        try:
+            batch = bytearray()
+            on_disk = False
+            chunk = await field.read_chunk(size=2 ** 16, decode=True)
+            while chunk:
+                if 0 < max_size < size + len(chunk):
+                    raise HTTPRequestEntityTooLarge(
+                        max_size=max_size, actual_size=size + len(chunk)
+                    )
+                if 0 < max_spooled < spooled + size + len(chunk):
+                    raise HTTPRequestEntityTooLarge(
+                        max_size=max_spooled, actual_size=spooled + size + len(chunk)
+                    )
+                if not budget.acquire(len(chunk)):
+                    # the budget is taken by files of other requests
+                    raise HTTPServiceUnavailable()
+                size += len(chunk)
+                if on_disk:
+                    batch += chunk
+                    if len(batch) >= _SPOOL_BATCH_SIZE:
+                        await loop.run_in_executor(None, tmp.write, batch)
+                        batch = bytearray()
+                elif size > threshold:
+                    # the file doesn't fit into memory, move it to disk
+                    await loop.run_in_executor(None, tmp.rollover)
+                    on_disk = True
+                    batch += chunk
+                else:
+                    tmp.write(chunk)
+                chunk = await field.read_chunk(size=2 ** 16, decode=True)
+            if on_disk:
+                if batch:
+                    await loop.run_in_executor(None, tmp.write, batch)
+                # seek flushes the write buffer
+                await loop.run_in_executor(None, tmp.seek, 0)
+            else:
+                tmp.seek(0)
+        except BaseException:
+            tmp.close()
+            budget.release(size)
+            raise
+        weakref.finalize(tmp, budget.release, size)
+        return cast(IO[bytes], tmp), size
+
     def __repr__(self) -> str:
         ascii_encodable_path = self.path.encode("ascii", "backslashreplace").decode(
             "ascii"
@@ -760,21 +972,26 @@ class BaseRequest(MutableMapping[str, Any], HeadersMixin):
 
     def _cancel(self, exc: BaseException) -> None:
         self._payload.set_exception(exc)
-        for fut in self._disconnection_waiters:
-            set_result(fut, None)
+        if self._disconnection_waiters is not None:
+            for fut in self._disconnection_waiters:
+                set_result(fut, None)
 
     def _finish(self) -> None:
-        for fut in self._disconnection_waiters:
-            fut.cancel()
+        if self._disconnection_waiters is not None:
+            for fut in self._disconnection_waiters:
+                fut.cancel()
 
     async def wait_for_disconnection(self) -> None:
         loop = asyncio.get_event_loop()
         fut = loop.create_future()  # type: asyncio.Future[None]
-        self._disconnection_waiters.add(fut)
+        waiters = self._disconnection_waiters
+        if waiters is None:
+            waiters = self._disconnection_waiters = set()
+        waiters.add(fut)
         try:
             await fut
         finally:
-            self._disconnection_waiters.remove(fut)
+            waiters.remove(fut)
 
 
 class Request(BaseRequest):
@@ -812,7 +1029,7 @@ class Request(BaseRequest):
         new_ret._match_info = self._match_info
         return new_ret
 
-    @reify
+    @property
     def match_info(self) -> "UrlMappingMatchInfo":
         """Result of route resolving."""
         match_info = self._match_info
@@ -88,6 +88,7 @@ class StreamResponse(BaseClass, HeadersMixin, CookieMixin):
         "_headers",
         "_status",
         "_reason",
+        "_cookies",
         "__weakref__",
     )
 
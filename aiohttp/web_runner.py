@@ -11,6 +11,8 @@ from .http_parser import RawRequestMessage
 from .streams import StreamReader
 from .web_app import Application
 from .web_log import AccessLogger
+from .web_log_queue import AccessLogQueue
+from .web_loop_monitor import LoopLagMonitor
 from .web_protocol import RequestHandler
 from .web_request import Request
 from .web_server import Server
@@ -217,12 +219,7 @@ class SockSite(BaseSite):
         )
         self._sock = sock
         scheme = "https" if self._ssl_context else "http"
-        if hasattr(socket, "AF_UNIX") and sock.family == socket.AF_UNIX:
-            name = f"{scheme}://unix:{sock.getsockname()}:"
-        else:
-            host, port = sock.getsockname()[:2]
-            name = str(URL.build(scheme=scheme, host=host, port=port))
-        self._name = name
+        self._name = _sock_name(sock, scheme)
 
     @property
     def name(self) -> str:
@@ -238,11 +235,34 @@ class SockSite(BaseSite):
         )
 
 
+def _sock_name(sock: socket.socket, scheme: str) -> str:
+    if hasattr(socket, "AF_UNIX") and sock.family == socket.AF_UNIX:
+        return f"{scheme}://unix:{sock.getsockname()}:"
+    host, port = sock.getsockname()[:2]
+    return str(URL.build(scheme=scheme, host=host, port=port))
+
+
 class BaseRunner(ABC):
-    __slots__ = ("_handle_signals", "_kwargs", "_server", "_sites")
+    __slots__ = (
+        "_handle_signals",
+        "_kwargs",
+        "_server",
+        "_sites",
+        "_loop_monitor",
+        "_access_log_queue",
+    )
 
-    def __init__(self, *, handle_signals: bool = False, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        handle_signals: bool = False,
+        loop_monitor: Optional[LoopLagMonitor] = None,
+        access_log_queue: Optional[AccessLogQueue] = None,
+        **kwargs: Any,
+    ) -> None:
         self._handle_signals = handle_signals
+        self._loop_monitor = loop_monitor
+        self._access_log_queue = access_log_queue
         self._kwargs = kwargs
         self._server = None  # type: Optional[Server]
         self._sites = []  # type: List[BaseSite]
@@ -267,6 +287,14 @@ class BaseRunner(ABC):
     def sites(self) -> Set[BaseSite]:
         return set(self._sites)
 
+    @property
+    def loop_monitor(self) -> Optional[LoopLagMonitor]:
+        return self._loop_monitor
+
+    @property
+    def access_log_queue(self) -> Optional[AccessLogQueue]:
+        return self._access_log_queue
+
     async def setup(self) -> None:
         loop = asyncio.get_event_loop()
 
@@ -278,8 +306,14 @@ class BaseRunner(ABC):
                 # add_signal_handler is not implemented on Windows
                 pass
 
+        if self._access_log_queue is not None:
+            self._access_log_queue.start()
+
         self._server = await self._make_server()
 
+        if self._loop_monitor is not None:
+            self._loop_monitor.start()
+
     @abstractmethod
     async def shutdown(self) -> None:
         pass  # pragma: no cover
@@ -293,8 +327,12 @@ class BaseRunner(ABC):
         # still present on failure
         for site in list(self._sites):
             await site.stop()
+        if self._loop_monitor is not None:
+            self._loop_monitor.stop()
         await self._cleanup_server()
         self._server = None
+        if self._access_log_queue is not None:
+            self._access_log_queue.stop()
         if self._handle_signals:
             try:
                 loop.remove_signal_handler(signal.SIGINT)
@@ -332,9 +370,20 @@ class ServerRunner(BaseRunner):
     __slots__ = ("_web_server",)
 
     def __init__(
-        self, web_server: Server, *, handle_signals: bool = False, **kwargs: Any
+        self,
+        web_server: Server,
+        *,
+        handle_signals: bool = False,
+        loop_monitor: Optional[LoopLagMonitor] = None,
+        access_log_queue: Optional[AccessLogQueue] = None,
+        **kwargs: Any,
     ) -> None:
-        super().__init__(handle_signals=handle_signals, **kwargs)
+        super().__init__(
+            handle_signals=handle_signals,
+            loop_monitor=loop_monitor,
+            access_log_queue=access_log_queue,
+            **kwargs,
+        )
         self._web_server = web_server
 
     async def shutdown(self) -> None:
@@ -357,6 +406,8 @@ class AppRunner(BaseRunner):
         app: Application,
         *,
         handle_signals: bool = False,
+        loop_monitor: Optional[LoopLagMonitor] = None,
+        access_log_queue: Optional[AccessLogQueue] = None,
         access_log_class: Type[AbstractAccessLogger] = AccessLogger,
         **kwargs: Any,
     ) -> None:
@@ -380,7 +431,12 @@ class AppRunner(BaseRunner):
                 )
             )
 
-        super().__init__(handle_signals=handle_signals, **kwargs)
+        super().__init__(
+            handle_signals=handle_signals,
+            loop_monitor=loop_monitor,
+            access_log_queue=access_log_queue,
+            **kwargs,
+        )
         self._app = app
 
     @property
@@ -419,6 +475,9 @@ class AppRunner(BaseRunner):
             task,
             loop,
             client_max_size=self.app._client_max_size,
+            upload_spool_threshold=self.app._upload_spool_threshold,
+            upload_dir=self.app._upload_dir,
+            upload_spool_budget=self.app._upload_spool_budget,
         )
 
     async def _cleanup_server(self) -> None:
@@ -3,11 +3,17 @@ import asyncio
 import warnings
 from typing import Any, Awaitable, Callable, Dict, List, Optional  # noqa
 
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from . import hdrs
 from .abc import AbstractStreamWriter
 from .http_parser import RawRequestMessage
 from .streams import StreamReader
+from .web_limiter import AIMDLimiter
+from .web_metrics import ServerMetrics
 from .web_protocol import RequestHandler, _RequestFactory, _RequestHandler
 from .web_request import BaseRequest
+from .web_response import Response, StreamResponse
 
 __all__ = ("Server",)
 
@@ -19,6 +25,12 @@ class Server:
         *,
         request_factory: Optional[_RequestFactory] = None,
         debug: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_inflight_requests: Optional[int] = None,
+        pause_on_max_connections: bool = False,
+        retry_after: int = 1,
+        limiter: Optional[AIMDLimiter] = None,
+        metrics: Optional[ServerMetrics] = None,
         **kwargs: Any,
     ) -> None:
         if debug is not None:
@@ -27,20 +39,88 @@ class Server:
                 DeprecationWarning,
                 stacklevel=2,
             )
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections should be positive or None")
+        if max_inflight_requests is not None and max_inflight_requests < 1:
+            raise ValueError("max_inflight_requests should be positive or None")
         self._loop = asyncio.get_running_loop()
         self._connections = {}  # type: Dict[RequestHandler, asyncio.Transport]
+        # connections accepted over max_connections with reading paused,
+        # in arrival order
+        self._paused = {}  # type: Dict[RequestHandler, asyncio.Transport]
         self._kwargs = kwargs
+        self._max_connections = max_connections
+        self._max_inflight_requests = max_inflight_requests
+        self._pause_on_max_connections = pause_on_max_connections
+        self._retry_after = retry_after
+        self._limiter = limiter
+        self._metrics = metrics
+        self._overload_body = b"503 Service Unavailable\n\nServer is overloaded"
+        # requests over the limits get a response built from these
+        self._overload_headers = CIMultiDictProxy(
+            CIMultiDict(
+                {
+                    hdrs.CONTENT_TYPE: "text/plain; charset=utf-8",
+                    hdrs.RETRY_AFTER: str(retry_after),
+                }
+            )
+        )
+        self._overload_response = (
+            b"HTTP/1.1 503 Service Unavailable\r\n"
+            b"Content-Type: text/plain; charset=utf-8\r\n"
+            b"Content-Length: %d\r\n"
+            b"Retry-After: %d\r\n"
+            b"Connection: close\r\n"
+            b"\r\n%s" % (len(self._overload_body), retry_after, self._overload_body)
+        )
         self.requests_count = 0
+        self.inflight_requests = 0
+        self.rejected_connections = 0
+        self.rejected_requests = 0
         self.request_handler = handler
         self.request_factory = request_factory or self._make_request
 
     @property
     def connections(self) -> List[RequestHandler]:
-        return list(self._connections.keys())
+        return list(self._connections.keys()) + list(self._paused.keys())
+
+    @property
+    def paused_connections(self) -> int:
+        return len(self._paused)
+
+    @property
+    def max_connections(self) -> Optional[int]:
+        return self._max_connections
+
+    @property
+    def max_inflight_requests(self) -> Optional[int]:
+        return self._max_inflight_requests
+
+    @property
+    def limiter(self) -> Optional[AIMDLimiter]:
+        return self._limiter
+
+    @property
+    def metrics(self) -> Optional[ServerMetrics]:
+        return self._metrics
+
+    @property
+    def retry_after(self) -> int:
+        return self._retry_after
 
     def connection_made(
         self, handler: RequestHandler, transport: asyncio.Transport
     ) -> None:
+        max_connections = self._max_connections
+        if max_connections is not None and len(self._connections) >= max_connections:
+            if self._pause_on_max_connections:
+                handler.pause_reading()
+                self._paused[handler] = transport
+            else:
+                self.rejected_connections += 1
+                transport.write(self._overload_response)
+                transport.close()
+            return
         self._connections[handler] = transport
 
     def connection_lost(
@@ -48,6 +128,18 @@ class Server:
     ) -> None:
         if handler in self._connections:
             del self._connections[handler]
+            if self._paused:
+                # admit the oldest waiting connection
+                waiting = next(iter(self._paused))
+                self._connections[waiting] = self._paused.pop(waiting)
+                waiting.resume_reading()
+        elif handler in self._paused:
+            del self._paused[handler]
+
+    def is_overloaded(self) -> bool:
+        """Return True if a new request should be rejected."""
+        max_inflight = self._max_inflight_requests
+        return max_inflight is not None and self.inflight_requests >= max_inflight
 
     def _make_request(
         self,
@@ -59,10 +151,16 @@ class Server:
     ) -> BaseRequest:
         return BaseRequest(message, payload, protocol, writer, task, self._loop)
 
+    async def _handle_overload(self, request: BaseRequest) -> StreamResponse:
+        return Response(
+            status=503, body=self._overload_body, headers=self._overload_headers
+        )
+
     async def shutdown(self, timeout: Optional[float] = None) -> None:
-        coros = [conn.shutdown(timeout) for conn in self._connections]
+        coros = [conn.shutdown(timeout) for conn in self.connections]
         await asyncio.gather(*coros)
         self._connections.clear()
+        self._paused.clear()
 
     def __call__(self) -> RequestHandler:
         return RequestHandler(self, loop=self._loop, **self._kwargs)
@@ -160,6 +160,7 @@ class AbstractRoute(abc.ABC):
         *,
         expect_handler: Optional[_ExpectHandler] = None,
         resource: Optional[AbstractResource] = None,
+        handler_timeout: Optional[float] = None,
     ) -> None:
 
         if expect_handler is None:
@@ -187,6 +188,7 @@ class AbstractRoute(abc.ABC):
         self._handler = handler
         self._expect_handler = expect_handler
         self._resource = resource
+        self._handler_timeout = handler_timeout
 
     @property
     def method(self) -> str:
@@ -196,6 +198,11 @@ class AbstractRoute(abc.ABC):
     def handler(self) -> _WebHandler:
         return self._handler
 
+    @property
+    def handler_timeout(self) -> Optional[float]:
+        """Timeout for handler execution, overrides app's one."""
+        return self._handler_timeout
+
     @property
     @abc.abstractmethod
     def name(self) -> Optional[str]:
@@ -324,6 +331,7 @@ class Resource(AbstractResource):
         handler: Union[Type[AbstractView], _WebHandler],
         *,
         expect_handler: Optional[_ExpectHandler] = None,
+        handler_timeout: Optional[float] = None,
     ) -> "ResourceRoute":
 
         for route_obj in self._routes:
@@ -334,7 +342,13 @@ class Resource(AbstractResource):
                     "registered".format(route=route_obj)
                 )
 
-        route_obj = ResourceRoute(method, handler, self, expect_handler=expect_handler)
+        route_obj = ResourceRoute(
+            method,
+            handler,
+            self,
+            expect_handler=expect_handler,
+            handler_timeout=handler_timeout,
+        )
         self.register_route(route_obj)
         return route_obj
 
@@ -867,9 +881,14 @@ class ResourceRoute(AbstractRoute):
         resource: AbstractResource,
         *,
         expect_handler: Optional[_ExpectHandler] = None,
+        handler_timeout: Optional[float] = None,
     ) -> None:
         super().__init__(
-            method, handler, expect_handler=expect_handler, resource=resource
+            method,
+            handler,
+            expect_handler=expect_handler,
+            resource=resource,
+            handler_timeout=handler_timeout,
         )
 
     def __repr__(self) -> str:
@@ -1075,9 +1094,15 @@ class UrlDispatcher(AbstractRouter, Mapping[str, AbstractResource]):
         *,
         name: Optional[str] = None,
         expect_handler: Optional[_ExpectHandler] = None,
+        handler_timeout: Optional[float] = None,
     ) -> AbstractRoute:
         resource = self.add_resource(path, name=name)
-        return resource.add_route(method, handler, expect_handler=expect_handler)
+        return resource.add_route(
+            method,
+            handler,
+            expect_handler=expect_handler,
+            handler_timeout=handler_timeout,
+        )
 
     def add_static(
         self,
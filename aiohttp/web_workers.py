@@ -0,0 +1,476 @@
+"""Multi-process and multi-thread serving used by run_app()."""
+import asyncio
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+import time
+from logging import Logger
+from types import FrameType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .log import web_logger
+from .web_app import Application
+from .web_runner import AppRunner, BaseRunner, SockSite
+from .web_server import Server
+
+try:
+    from ssl import SSLContext
+except ImportError:  # pragma: no cover
+    SSLContext = object  # type: ignore
+
+__all__ = ("WorkerSupervisor", "LoopThread")
+
+
+HAS_REUSE_PORT = hasattr(socket, "SO_REUSEPORT")
+
+
+def bind_tcp(
+    host: Optional[str],
+    port: int,
+    *,
+    backlog: int = 128,
+    reuse_address: Optional[bool] = None,
+    reuse_port: bool = False,
+) -> List[socket.socket]:
+    """Bind listening sockets for all addresses of *host*.
+
+    Options follow loop.create_server(): *reuse_address* is enabled on
+    UNIX by default, IPv6 sockets are IPv6 only.
+    """
+    if reuse_address is None:
+        reuse_address = os.name == "posix" and sys.platform != "cygwin"
+    infos = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+    )
+    sockets: List[socket.socket] = []
+    seen = set()
+    try:
+        for family, type_, proto, _, sockaddr in infos:
+            if (family, sockaddr) in seen:
+                continue
+            seen.add((family, sockaddr))
+            sockets.append(
+                _bind(
+                    family,
+                    type_,
+                    proto,
+                    sockaddr,
+                    backlog=backlog,
+                    reuse_address=reuse_address,
+                    reuse_port=reuse_port,
+                )
+            )
+    except BaseException:
+        for sock in sockets:
+            sock.close()
+        raise
+    return sockets
+
+
+def bind_same(
+    sockets: Iterable[socket.socket],
+    *,
+    backlog: int = 128,
+    reuse_address: Optional[bool] = None,
+) -> List[socket.socket]:
+    """Bind new SO_REUSEPORT sockets to addresses of *sockets*.
+
+    The kernel balances incoming connections between sockets of
+    the same reuse port group.
+    """
+    if reuse_address is None:
+        reuse_address = os.name == "posix" and sys.platform != "cygwin"
+    ret: List[socket.socket] = []
+    try:
+        for sock in sockets:
+            ret.append(
+                _bind(
+                    sock.family,
+                    sock.type,
+                    sock.proto,
+                    sock.getsockname(),
+                    backlog=backlog,
+                    reuse_address=reuse_address,
+                    reuse_port=True,
+                )
+            )
+    except BaseException:
+        for sock in ret:
+            sock.close()
+        raise
+    return ret
+
+
+def bind_unix(path: str, *, backlog: int = 128) -> socket.socket:
+    """Bind listening UNIX socket, a stale socket file is removed."""
+    if path[0] not in (0, "\x00"):
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        sock.listen(backlog)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _bind(
+    family: int,
+    type_: int,
+    proto: int,
+    sockaddr: Any,
+    *,
+    backlog: int,
+    reuse_address: bool,
+    reuse_port: bool,
+) -> socket.socket:
+    sock = socket.socket(family, type_, proto)
+    try:
+        if reuse_address:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, True)
+        if family == socket.AF_INET6 and hasattr(socket, "IPPROTO_IPV6"):
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, True)
+        sock.bind(sockaddr)
+        sock.listen(backlog)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _exit_code(status: int) -> int:
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+class WorkerSupervisor:
+    """Run *target* in *workers* forked processes and keep them running.
+
+    ``target(index)`` serves requests in the worker process until
+    SIGTERM, SIGINT is ignored by workers. A worker exited unexpectedly
+    is restarted, a worker crashed sooner than *restart_delay* seconds
+    after start is restarted after the delay.
+
+    SIGINT or SIGTERM sent to the supervisor is passed to workers as
+    SIGTERM for graceful shutdown, the second signal kills them.
+
+    With *cpu_affinity* worker processes are pinned to available CPUs
+    in round-robin order.
+    """
+
+    __slots__ = (
+        "_target",
+        "_workers",
+        "_cpus",
+        "_logger",
+        "_restart_delay",
+        "_pids",
+        "_stopping",
+        "restarts",
+    )
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        workers: int,
+        *,
+        cpu_affinity: bool = False,
+        logger: Logger = web_logger,
+        restart_delay: float = 1.0,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers should be positive")
+        if not hasattr(os, "fork"):  # pragma: no cover
+            raise RuntimeError("Multiple workers are not supported on this platform")
+        self._cpus: Optional[List[int]] = None
+        if cpu_affinity:
+            if not hasattr(os, "sched_setaffinity"):  # pragma: no cover
+                raise RuntimeError("CPU affinity is not supported on this platform")
+            self._cpus = sorted(os.sched_getaffinity(0))
+        self._target = target
+        self._workers = workers
+        self._logger = logger
+        self._restart_delay = restart_delay
+        # pid -> (worker index, start time)
+        self._pids: Dict[int, Tuple[int, float]] = {}
+        self._stopping = False
+        self.restarts = 0
+
+    @property
+    def pids(self) -> List[int]:
+        return list(self._pids)
+
+    def run(self) -> None:
+        """Start workers and supervise them until all are stopped."""
+        handlers: Dict[int, Any] = {}
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            handlers[signum] = signal.signal(signum, self._on_signal)
+        try:
+            for index in range(self._workers):
+                self._spawn(index)
+            while self._pids:
+                try:
+                    pid, status = os.waitpid(-1, 0)
+                except ChildProcessError:  # pragma: no cover
+                    break
+                if pid not in self._pids:  # pragma: no cover
+                    continue
+                index, started = self._pids.pop(pid)
+                if self._stopping:
+                    continue
+                self._logger.warning(
+                    "Worker %d (pid %d) exited with code %d, restarting",
+                    index,
+                    pid,
+                    _exit_code(status),
+                )
+                if time.monotonic() - started < self._restart_delay:
+                    # do not restart crashing on startup worker in a busy loop
+                    time.sleep(self._restart_delay)
+                if not self._stopping:
+                    self.restarts += 1
+                    self._spawn(index)
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+    def stop(self) -> None:
+        """Shut workers down gracefully, kill them on the second call."""
+        signum = signal.SIGKILL if self._stopping else signal.SIGTERM
+        self._stopping = True
+        for pid in self._pids:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:  # pragma: no cover
+                pass
+
+    def _on_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        self.stop()
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            self._run_worker(index)
+        self._pids[pid] = (index, time.monotonic())
+        if self._stopping:
+            # a signal came in between fork() and registration of the pid
+            os.kill(pid, signal.SIGTERM)
+
+    def _run_worker(self, index: int) -> None:  # pragma: no cover
+        code = 0
+        try:
+            # workers are shut down by the supervisor only,
+            # CTRL+C is sent to the whole process group
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            if self._cpus is not None:
+                os.sched_setaffinity(0, {self._cpus[index % len(self._cpus)]})
+            self._target(index)
+        except BaseException:
+            self._logger.exception("Worker %d failed", index)
+            code = 1
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:
+                    pass
+            os._exit(code)
+
+
+def clone_listening(
+    sockets: Iterable[Any], *, backlog: int = 128
+) -> List[socket.socket]:
+    """Make listening sockets for another event loop.
+
+    TCP sockets with SO_REUSEPORT enabled get new sockets of the same
+    reuse port group, other sockets are duplicated.
+    """
+    ret: List[socket.socket] = []
+    try:
+        for sock in sockets:
+            if (
+                HAS_REUSE_PORT
+                and sock.family in (socket.AF_INET, socket.AF_INET6)
+                and sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+            ):
+                ret.extend(bind_same([sock], backlog=backlog))
+            else:
+                ret.append(socket.fromfd(sock.fileno(), sock.family, sock.type))
+    except BaseException:
+        for sock in ret:
+            sock.close()
+        raise
+    return ret
+
+
+def _has_cleanup_ctx(app: Application) -> bool:
+    if app.cleanup_ctx:
+        return True
+    return any(_has_cleanup_ctx(subapp) for subapp in app._subapps)
+
+
+class _ThreadRunner(BaseRunner):
+    """Serve the application of a started AppRunner on another loop.
+
+    Startup, shutdown and cleanup signals are handled by the main
+    runner only. The loop gets own copy of the main runner's limiter.
+    """
+
+    __slots__ = ("_main",)
+
+    def __init__(self, main: AppRunner) -> None:
+        kwargs = dict(main._kwargs)
+        limiter = kwargs.get("limiter")
+        if limiter is not None:
+            kwargs["limiter"] = limiter._copy()
+        super().__init__(**kwargs)
+        self._main = main
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def _make_server(self) -> Server:
+        return Server(
+            self._main.app._handle,  # type: ignore
+            request_factory=self._main._make_request,
+            **self._kwargs,
+        )
+
+    async def _cleanup_server(self) -> None:
+        pass
+
+
+class LoopThread:
+    """Serve *runner*'s application on own event loop in a thread.
+
+    *runner* should be set up, the thread accepts connections on
+    *sockets*, which are closed on stop.
+
+    The application's cleanup contexts are run on the runner's loop
+    only, so they are not supported. Server metrics can not be shared
+    between loops either.
+    """
+
+    __slots__ = (
+        "_runner",
+        "_sockets",
+        "_shutdown_timeout",
+        "_ssl_context",
+        "_backlog",
+        "_thread",
+        "_loop",
+        "_stopping",
+        "_started",
+        "_error",
+    )
+
+    def __init__(
+        self,
+        runner: AppRunner,
+        sockets: List[socket.socket],
+        *,
+        shutdown_timeout: float = 60.0,
+        ssl_context: Optional[SSLContext] = None,
+        backlog: int = 128,
+    ) -> None:
+        if runner.server is None:
+            raise RuntimeError("Call runner.setup() before making a loop thread")
+        if _has_cleanup_ctx(runner.app):
+            raise RuntimeError("Loop threads do not support cleanup contexts")
+        if runner.server.metrics is not None:
+            raise RuntimeError("Loop threads do not support server metrics")
+        self._runner = runner
+        self._sockets = sockets
+        self._shutdown_timeout = shutdown_timeout
+        self._ssl_context = ssl_context
+        self._backlog = backlog
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._started = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    def start(self) -> None:
+        """Start the thread and wait until it is serving.
+
+        An error raised on startup is re-raised.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Loop thread is already started")
+        self._thread = threading.Thread(
+            target=self._run, name="aiohttp-loop", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+
+    async def stop(self) -> None:
+        """Shut the thread's server down gracefully and wait for the thread."""
+        if self._thread is None:
+            return
+        loop = self._loop
+        stopping = self._stopping
+        if loop is not None and stopping is not None:
+            try:
+                loop.call_soon_threadsafe(stopping.set)
+            except RuntimeError:  # pragma: no cover
+                pass  # the loop is closed already
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._serve())
+        except BaseException as exc:
+            if not self._started.is_set():
+                self._error = exc
+            else:  # pragma: no cover
+                web_logger.exception("Error in loop thread")
+        finally:
+            self._started.set()
+            for sock in self._sockets:
+                sock.close()
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+                asyncio.set_event_loop(None)
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        runner = _ThreadRunner(self._runner)
+        await runner.setup()
+        try:
+            for sock in self._sockets:
+                site = SockSite(
+                    runner,
+                    sock,
+                    shutdown_timeout=self._shutdown_timeout,
+                    ssl_context=self._ssl_context,
+                    backlog=self._backlog,
+                )
+                await site.start()
+            self._started.set()
+            await self._stopping.wait()
+        finally:
+            await runner.cleanup()
@@ -51,6 +51,57 @@ async def test_keepalive_two_requests_success(aiohttp_client: Any) -> None:
     assert 1 == len(client._session.connector._conns)
 
 
+async def test_prewarm(aiohttp_client: Any) -> None:
+    peers = set()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.Response(body=b"OK")
+
+    app = web.Application()
+    app.router.add_route("GET", "/", handler)
+
+    connector = aiohttp.TCPConnector(limit=3)
+    client = await aiohttp_client(app, connector=connector)
+
+    assert await client.session.prewarm(client.make_url("/"), 5) == 3
+    (conns,) = connector._conns.values()
+    assert len(conns) == 3
+    socknames = {proto.transport.get_extra_info("sockname") for proto, t in conns}
+    assert await client.session.prewarm(client.make_url("/"), 3, top_up=True) == 0
+
+    async def get():
+        async with client.get("/") as resp:
+            assert await resp.read() == b"OK"
+
+    await asyncio.gather(get(), get(), get())
+    # all requests are served by prewarmed connections
+    assert peers == socknames
+
+
+async def test_prewarm_default_headers(aiohttp_client: Any) -> None:
+    peers = []
+
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(body=b"OK")
+
+    app = web.Application()
+    app.router.add_route("GET", "/", handler)
+
+    connector = aiohttp.TCPConnector()
+    client = await aiohttp_client(app, connector=connector, headers={"X-Test": "1"})
+
+    # the session default headers are a part of the connections pool key
+    assert await client.session.prewarm(client.make_url("/"), 1) == 1
+    ((proto, t),) = next(iter(connector._conns.values()))
+    sockname = proto.transport.get_extra_info("sockname")
+
+    async with client.get("/") as resp:
+        assert await resp.read() == b"OK"
+    assert peers == [sockname]
+
+
 async def test_keepalive_after_head_requests_success(aiohttp_client: Any) -> None:
     async def handler(request):
         body = await request.read()
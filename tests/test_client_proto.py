@@ -136,3 +136,23 @@ async def test_eof_received(loop: Any) -> None:
     assert proto._read_timeout_handle is not None
     proto.eof_received()
     assert proto._read_timeout_handle is None
+
+
+async def test_limit_lifetime_requests(loop: Any) -> None:
+    proto = ResponseHandler(loop=loop)
+    assert not proto.expired
+    proto.limit_lifetime(max_requests=2)
+    proto.start_request()
+    assert not proto.expired
+    proto.start_request()
+    assert proto.expired
+
+
+async def test_limit_lifetime_age(loop: Any) -> None:
+    proto = ResponseHandler(loop=loop)
+    with mock.patch.object(loop, "time", return_value=100.0):
+        proto.limit_lifetime(max_age=10)
+    with mock.patch.object(loop, "time", return_value=109.0):
+        assert not proto.expired
+    with mock.patch.object(loop, "time", return_value=110.0):
+        assert proto.expired
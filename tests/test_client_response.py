@@ -714,6 +714,49 @@ async def test_json_override_encoding(loop: Any, session: Any) -> None:
     assert not response.get_encoding.called
 
 
+async def test_json_loads_bytes(loop: Any, session: Any) -> None:
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=mock.Mock(),
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    response._headers = {"Content-Type": "application/problem+json"}
+    response._body = b"data"
+    loads = mock.Mock(return_value="result")
+
+    with mock.patch("aiohttp.client_reqrep.chardet") as m_chardet:
+        res = await response.json(loads=loads, loads_bytes=True)
+    assert res == "result"
+    loads.assert_called_once_with(b"data")
+    assert not m_chardet.detect.called
+
+
+async def test_json_loads_bytes_non_utf8(loop: Any, session: Any) -> None:
+    response = ClientResponse(
+        "get",
+        URL("http://def-cl-resp.org"),
+        request_info=mock.Mock(),
+        writer=mock.Mock(),
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=session,
+    )
+    response._headers = {"Content-Type": "application/json;charset=cp1251"}
+    response._body = '"тест"'.encode("cp1251")
+    loads = mock.Mock(return_value="result")
+
+    await response.json(loads=loads, loads_bytes=True)
+    loads.assert_called_once_with('"тест"')
+
+
 def test_get_encoding_unknown(loop: Any, session: Any) -> None:
     response = ClientResponse(
         "get",
@@ -689,3 +689,19 @@ async def test_requote_redirect_url_default() -> None:
 async def test_requote_redirect_url_default_disable() -> None:
     session = ClientSession(requote_redirect_url=False)
     assert not session.requote_redirect_url
+
+
+async def test_prewarm_request_parameters(create_session: Any) -> None:
+    connector = TCPConnector()
+    connector.prewarm = make_mocked_coro(2)
+    session = await create_session(connector=connector, headers={"X-Default": "1"})
+
+    assert await session.prewarm("http://example.com", 2, proxy="http://proxy") == 2
+    (url, n), kwargs = connector.prewarm.call_args
+    assert url == URL("http://example.com")
+    assert n == 2
+    assert kwargs["proxy"] == URL("http://proxy")
+    assert kwargs["ssl"] is None
+    # the proxy headers are merged with the default ones like request() does
+    assert kwargs["proxy_headers"] == CIMultiDict({"X-Default": "1"})
+    assert kwargs["timeout"] is session.timeout
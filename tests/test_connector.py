@@ -20,8 +20,14 @@ from yarl import URL
 import aiohttp
 from aiohttp import client, web
 from aiohttp.client import ClientRequest, ClientTimeout
+from aiohttp.client_proto import ResponseHandler
 from aiohttp.client_reqrep import ConnectionKey
-from aiohttp.connector import Connection, TCPConnector, _DNSCacheTable
+from aiohttp.connector import (
+    Connection,
+    TCPConnector,
+    _DNSCacheTable,
+    _interleave_hosts,
+)
 from aiohttp.locks import EventResultOrError
 from aiohttp.test_utils import make_mocked_coro, unused_port
 from aiohttp.tracing import Trace
@@ -88,6 +94,11 @@ def create_mocked_conn(conn_closing_result: Optional[Any] = None, **kwargs: Any)
     return proto
 
 
+def add_idle(conn: Any, key: Any, proto: Any, use_time: float) -> None:
+    conn._conns.setdefault(key, deque()).append((proto, use_time))
+    conn._conns_order[proto] = (key, use_time)
+
+
 def test_connection_del(loop: Any) -> None:
     connector = mock.Mock()
     key = mock.Mock()
@@ -273,6 +284,33 @@ async def test_get(loop: Any) -> None:
     await conn.close()
 
 
+async def test_get_lifo(loop: Any, key: Any) -> None:
+    conn = aiohttp.BaseConnector()
+    assert conn.reuse_policy == "lifo"
+    proto1, proto2 = create_mocked_conn(loop), create_mocked_conn(loop)
+    add_idle(conn, key, proto1, loop.time())
+    add_idle(conn, key, proto2, loop.time())
+    assert conn._get(key) is proto2
+    assert list(conn._conns_order) == [proto1]
+    await conn.close()
+
+
+async def test_get_fifo(loop: Any, key: Any) -> None:
+    conn = aiohttp.BaseConnector(reuse_policy="fifo")
+    assert conn.reuse_policy == "fifo"
+    proto1, proto2 = create_mocked_conn(loop), create_mocked_conn(loop)
+    add_idle(conn, key, proto1, loop.time())
+    add_idle(conn, key, proto2, loop.time())
+    assert conn._get(key) is proto1
+    assert list(conn._conns_order) == [proto2]
+    await conn.close()
+
+
+async def test_invalid_reuse_policy(loop: Any) -> None:
+    with pytest.raises(ValueError):
+        aiohttp.BaseConnector(reuse_policy="random")
+
+
 async def test_get_unconnected_proto(loop: Any) -> None:
     conn = aiohttp.BaseConnector()
     key = ConnectionKey("localhost", 80, False, None, None, None, None)
@@ -489,11 +527,55 @@ async def test_release_waiter_no_available(loop: Any, key: Any, key2: Any) -> No
     conn._waiters[key].append(w)
     conn._available_connections = mock.Mock(return_value=0)
     conn._release_waiter()
-    assert len(conn._waiters) == 1
+    assert not conn._waiters
+    assert list(conn._waiters_parked[key]) == [w]
     assert not w.done.called
     await conn.close()
 
 
+async def test_release_waiter_round_robin(loop: Any, key: Any) -> None:
+    key2 = ConnectionKey("otherhost", 80, False, None, None, None, None)
+    conn = aiohttp.BaseConnector(limit=0)
+    w1, w2, w3 = mock.Mock(), mock.Mock(), mock.Mock()
+    for w in (w1, w2, w3):
+        w.done.return_value = False
+    conn._waiters[key] = deque([w1, w2])
+    conn._waiters[key2] = deque([w3])
+    conn._release_waiter()
+    assert w1.set_result.called
+    # the served key is moved to the end of the ring
+    assert list(conn._waiters) == [key2, key]
+    conn._release_waiter()
+    assert w3.set_result.called
+    assert not w2.set_result.called
+    assert list(conn._waiters) == [key]
+    await conn.close()
+
+
+async def test_release_waiter_unpark(loop: Any, key: Any) -> None:
+    key2 = ConnectionKey("otherhost", 80, False, None, None, None, None)
+    conn = aiohttp.BaseConnector(limit=0, limit_per_host=1)
+    proto = create_mocked_conn()
+    conn._acquired.add(proto)
+    conn._acquired_per_host[key].add(proto)
+    w1, w2 = mock.Mock(), mock.Mock()
+    w1.done.return_value = False
+    w2.done.return_value = False
+    conn._waiters[key] = deque([w1])
+    conn._waiters[key2] = deque([w2])
+
+    conn._release_waiter()
+    assert not w1.set_result.called
+    assert w2.set_result.called
+    assert list(conn._waiters_parked) == [key]
+    assert not conn._waiters
+
+    conn._release_acquired(key, proto)
+    assert w1.set_result.called
+    assert not conn._waiters_parked
+    await conn.close()
+
+
 async def test_release_close(key: Any) -> None:
     conn = aiohttp.BaseConnector()
     proto = create_mocked_conn(should_close=True)
@@ -656,6 +738,245 @@ async def test_tcp_connector_multiple_hosts_errors(loop: Any) -> None:
     assert connected
 
 
+def make_hinfo(host: str, family: int = socket.AF_INET) -> Any:
+    return {
+        "hostname": "mocked.host",
+        "host": host,
+        "port": 80,
+        "family": family,
+        "proto": 0,
+        "flags": socket.AI_NUMERICHOST,
+    }
+
+
+async def test_tcp_connector_happy_eyeballs(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0.01)
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("::1", socket.AF_INET6), make_hinfo("127.0.0.1")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    blackhole = loop.create_future()
+    tr, pr = create_mocked_conn(), create_mocked_conn()
+
+    async def create_connection(*args, **kwargs):
+        if args[1] == "::1":
+            # the connection attempt hangs
+            await blackhole
+        return tr, pr
+
+    conn._loop.create_connection = create_connection
+
+    start = loop.time()
+    assert await conn._create_direct_connection(req, [], ClientTimeout()) == (tr, pr)
+    assert loop.time() - start < 1
+    await asyncio.sleep(0)
+    assert blackhole.cancelled()
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_next_on_error(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=10)
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("127.0.0.1"), make_hinfo("127.0.0.2")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    tr, pr = create_mocked_conn(), create_mocked_conn()
+
+    async def create_connection(*args, **kwargs):
+        if args[1] == "127.0.0.1":
+            raise OSError
+        return tr, pr
+
+    conn._loop.create_connection = create_connection
+
+    start = loop.time()
+    assert await conn._create_direct_connection(req, [], ClientTimeout()) == (tr, pr)
+    # the next host is tried without waiting for the delay
+    assert loop.time() - start < 1
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_extra_connection(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0)
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("127.0.0.1"), make_hinfo("127.0.0.2")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    connections = {
+        h["host"]: (create_mocked_conn(), create_mocked_conn()) for h in hosts
+    }
+
+    gate = loop.create_future()
+
+    async def create_connection(*args, **kwargs):
+        # both attempts are established at once
+        await gate
+        return connections[args[1]]
+
+    conn._loop.create_connection = create_connection
+
+    loop.call_later(0.01, gate.set_result, None)
+    result = await conn._create_direct_connection(req, [], ClientTimeout())
+    assert result == connections["127.0.0.1"]
+    assert not connections["127.0.0.1"][0].close.called
+    assert connections["127.0.0.2"][0].close.called
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_drops_ssl_connection(
+    loop: Any,
+) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0, enable_cleanup_closed=True)
+    req = ClientRequest("GET", URL("https://mocked.host"), loop=loop)
+    hosts = [make_hinfo("127.0.0.1"), make_hinfo("127.0.0.2")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    connections = {
+        h["host"]: (create_mocked_conn(), create_mocked_conn()) for h in hosts
+    }
+
+    gate = loop.create_future()
+
+    async def create_connection(*args, **kwargs):
+        # both attempts are established at once
+        if args[1] == hosts[-1]["host"]:
+            gate.set_result(None)
+        await gate
+        return connections[args[1]]
+
+    conn._loop.create_connection = create_connection
+
+    result = await conn._create_direct_connection(req, [], ClientTimeout())
+    assert result == connections["127.0.0.1"]
+    dropped = connections["127.0.0.2"][0]
+    assert dropped.close.called
+    # the dropped transport is aborted if the server doesn't close it
+    assert conn._cleanup_closed_transports == [dropped]
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_sibling_error(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0)
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("127.0.0.1"), make_hinfo("127.0.0.2")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    tr, pr = create_mocked_conn(), create_mocked_conn()
+
+    gate = loop.create_future()
+
+    async def create_connection(*args, **kwargs):
+        # both attempts complete at once
+        if args[1] == "127.0.0.2":
+            gate.set_result(None)
+        await gate
+        if args[1] == "127.0.0.1":
+            raise RuntimeError("unexpected")
+        return tr, pr
+
+    conn._loop.create_connection = create_connection
+
+    result = await conn._create_direct_connection(req, [], ClientTimeout())
+    assert result == (tr, pr)
+    assert not tr.close.called
+    await conn.close()
+
+
+async def test_tcp_connector_sequential_connect(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=None)
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("::1", socket.AF_INET6), make_hinfo("127.0.0.1")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    events = []
+    tr, pr = create_mocked_conn(), create_mocked_conn()
+
+    async def create_connection(*args, **kwargs):
+        events.append(("start", args[1]))
+        await asyncio.sleep(0.01)
+        if args[1] == "::1":
+            events.append(("fail", args[1]))
+            raise OSError
+        return tr, pr
+
+    conn._loop.create_connection = create_connection
+
+    assert await conn._create_direct_connection(req, [], ClientTimeout()) == (tr, pr)
+    assert events == [("start", "::1"), ("fail", "::1"), ("start", "127.0.0.1")]
+    await conn.close()
+
+
+async def test_tcp_connector_all_hosts_fail(loop: Any) -> None:
+    conn = aiohttp.TCPConnector()
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    hosts = [make_hinfo("127.0.0.1"), make_hinfo("127.0.0.2")]
+    conn._resolve_host = make_mocked_coro(hosts)
+    errors = {"127.0.0.1": OSError(1, "first"), "127.0.0.2": OSError(2, "last")}
+
+    async def create_connection(*args, **kwargs):
+        raise errors[args[1]]
+
+    conn._loop.create_connection = create_connection
+
+    with pytest.raises(aiohttp.ClientConnectorError) as ctx:
+        await conn._create_direct_connection(req, [], ClientTimeout())
+    assert ctx.value.os_error is errors["127.0.0.2"]
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_attempt_timeout(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0.01)
+    hosts = [make_hinfo("::1", socket.AF_INET6), make_hinfo("127.0.0.1")]
+    tr, pr = create_mocked_conn(), create_mocked_conn()
+
+    async def connect(hinfo):
+        if hinfo["host"] == "::1":
+            # sock_connect timeout of a blackholed address
+            await asyncio.sleep(0.02)
+            raise asyncio.TimeoutError
+        await asyncio.sleep(0.05)
+        return tr, pr
+
+    assert await conn._race_connections(hosts, connect) == (tr, pr)
+    await conn.close()
+
+
+async def test_tcp_connector_happy_eyeballs_all_attempts_timeout(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=0)
+    hosts = [make_hinfo("::1", socket.AF_INET6), make_hinfo("127.0.0.1")]
+
+    async def connect(hinfo):
+        raise asyncio.TimeoutError
+
+    with pytest.raises(asyncio.TimeoutError):
+        await conn._race_connections(hosts, connect)
+    await conn.close()
+
+
+async def test_tcp_connector_no_hosts_resolved(loop: Any) -> None:
+    conn = aiohttp.TCPConnector()
+    req = ClientRequest("GET", URL("http://mocked.host"), loop=loop)
+    conn._resolve_host = make_mocked_coro([])
+
+    with pytest.raises(aiohttp.ClientConnectorError):
+        await conn._create_direct_connection(req, [], ClientTimeout())
+    await conn.close()
+
+
+def test_interleave_hosts() -> None:
+    v6 = [make_hinfo(f"::{i}", socket.AF_INET6) for i in range(3)]
+    v4 = [make_hinfo(f"127.0.0.{i}") for i in range(2)]
+    hosts = v6 + v4
+    assert _interleave_hosts(hosts, 1) == [v6[0], v4[0], v6[1], v4[1], v6[2]]
+    assert _interleave_hosts(hosts, 2) == [v6[0], v6[1], v4[0], v6[2], v4[1]]
+    assert _interleave_hosts(v4, 1) == v4
+
+
+async def test_tcp_connector_interleave(loop: Any) -> None:
+    conn = aiohttp.TCPConnector(happy_eyeballs_delay=None)
+    assert conn._interleave == 0
+    conn = aiohttp.TCPConnector()
+    assert conn._interleave == 1
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(happy_eyeballs_delay=-1)
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(interleave=-1)
+
+
 async def test_tcp_connector_resolve_host(loop: Any) -> None:
     conn = aiohttp.TCPConnector(use_dns_cache=True)
 
@@ -762,6 +1083,178 @@ async def test_tcp_connector_dns_throttle_requests_cancelled_when_close(
             await f
 
 
+async def test_tcp_connector_dns_refresh_window(loop: Any) -> None:
+    now = 1000.0
+    with mock.patch("aiohttp.connector.monotonic", lambda: now), mock.patch(
+        "aiohttp.connector.DefaultResolver"
+    ) as m_resolver:
+        conn = aiohttp.TCPConnector(ttl_dns_cache=10, dns_refresh_window=2)
+        m_resolver().resolve = make_mocked_coro(["127.0.0.1"])
+        assert await conn._resolve_host("localhost", 8080) == ["127.0.0.1"]
+        assert m_resolver().resolve.call_count == 1
+
+        now += 5
+        await conn._resolve_host("localhost", 8080)
+        assert not conn._dns_refresh_tasks
+
+        # close to expiry the cached entry is returned and resolved again
+        now += 4
+        m_resolver().resolve = make_mocked_coro(["127.0.0.2"])
+        assert await conn._resolve_host("localhost", 8080) == ["127.0.0.1"]
+        assert len(conn._dns_refresh_tasks) == 1
+        # a single refresh is running
+        await conn._resolve_host("localhost", 8080)
+        assert len(conn._dns_refresh_tasks) == 1
+        await asyncio.gather(*conn._dns_refresh_tasks)
+
+        assert m_resolver().resolve.call_count == 1
+        assert await conn._resolve_host("localhost", 8080) == ["127.0.0.2"]
+        assert not conn._dns_refresh_tasks
+        await conn.close()
+
+
+async def test_tcp_connector_dns_stale_grace(loop: Any) -> None:
+    now = 1000.0
+    session = mock.Mock()
+    trace_config_ctx = mock.Mock()
+    on_dns_cache_hit = mock.Mock(side_effect=make_mocked_coro(mock.Mock()))
+    trace_config = aiohttp.TraceConfig(
+        trace_config_ctx_factory=mock.Mock(return_value=trace_config_ctx)
+    )
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace_config.freeze()
+    traces = [Trace(session, trace_config, trace_config.trace_config_ctx())]
+
+    with mock.patch("aiohttp.connector.monotonic", lambda: now), mock.patch(
+        "aiohttp.connector.DefaultResolver"
+    ) as m_resolver:
+        conn = aiohttp.TCPConnector(ttl_dns_cache=10, dns_stale_grace=5)
+        m_resolver().resolve = make_mocked_coro(["127.0.0.1"])
+        await conn._resolve_host("localhost", 8080)
+
+        # the refresh of an expired entry fails, the entry is still used
+        now += 12
+        m_resolver().resolve = make_mocked_coro(
+            raise_exception=socket.gaierror(-3, "Temporary failure")
+        )
+        res = await conn._resolve_host("localhost", 8080, traces=traces)
+        assert res == ["127.0.0.1"]
+        on_dns_cache_hit.assert_called_once_with(
+            session,
+            trace_config_ctx,
+            aiohttp.TraceDnsCacheHitParams("localhost", stale=True),
+        )
+        await asyncio.gather(*conn._dns_refresh_tasks)
+        assert m_resolver().resolve.call_count == 1
+        assert ("localhost", 8080) in conn._cached_hosts
+
+        # a failed refresh is not retried on every lookup
+        await conn._resolve_host("localhost", 8080)
+        assert not conn._dns_refresh_tasks
+        now += 1
+        await conn._resolve_host("localhost", 8080)
+        assert len(conn._dns_refresh_tasks) == 1
+        await asyncio.gather(*conn._dns_refresh_tasks)
+        assert m_resolver().resolve.call_count == 2
+
+        # after the grace period the host is resolved before connecting
+        now += 3
+        with pytest.raises(socket.gaierror):
+            await conn._resolve_host("localhost", 8080)
+        assert not conn._dns_refresh_tasks
+
+        m_resolver().resolve = make_mocked_coro(["127.0.0.2"])
+        assert await conn._resolve_host("localhost", 8080) == ["127.0.0.2"]
+        assert not conn._dns_refresh_failures
+        await conn.close()
+
+
+async def test_tcp_connector_dns_negative_cache(loop: Any) -> None:
+    now = 1000.0
+    error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    with mock.patch("aiohttp.connector.monotonic", lambda: now), mock.patch(
+        "aiohttp.connector.DefaultResolver"
+    ) as m_resolver:
+        conn = aiohttp.TCPConnector(ttl_dns_negative=5)
+        m_resolver().resolve = make_mocked_coro(raise_exception=error)
+        with pytest.raises(socket.gaierror):
+            await conn._resolve_host("nowhere", 80)
+        with pytest.raises(socket.gaierror) as ctx:
+            await conn._resolve_host("nowhere", 80)
+        assert ctx.value is error
+        assert m_resolver().resolve.call_count == 1
+
+        now += 6
+        m_resolver().resolve = make_mocked_coro(["127.0.0.1"])
+        assert await conn._resolve_host("nowhere", 80) == ["127.0.0.1"]
+        await conn.close()
+
+
+async def test_tcp_connector_dns_negative_cache_other_errors(loop: Any) -> None:
+    with mock.patch("aiohttp.connector.DefaultResolver") as m_resolver:
+        conn = aiohttp.TCPConnector(ttl_dns_negative=5)
+        m_resolver().resolve = make_mocked_coro(
+            raise_exception=socket.gaierror(-3, "Temporary failure")
+        )
+        with pytest.raises(socket.gaierror):
+            await conn._resolve_host("localhost", 80)
+        with pytest.raises(socket.gaierror):
+            await conn._resolve_host("localhost", 80)
+        assert m_resolver().resolve.call_count == 2
+
+        m_resolver().resolve = make_mocked_coro(
+            raise_exception=socket.gaierror(socket.EAI_NONAME, "Not known")
+        )
+        with pytest.raises(socket.gaierror):
+            await conn._resolve_host("localhost", 80)
+        conn.clear_dns_cache()
+        m_resolver().resolve = make_mocked_coro(["127.0.0.1"])
+        assert await conn._resolve_host("localhost", 80) == ["127.0.0.1"]
+        await conn.close()
+
+
+async def test_tcp_connector_dns_record_ttl(loop: Any) -> None:
+    now = 1000.0
+    addrs = [
+        {"host": "127.0.0.1", "ttl": 30},
+        {"host": "127.0.0.2", "ttl": 20},
+    ]
+    with mock.patch("aiohttp.connector.monotonic", lambda: now), mock.patch(
+        "aiohttp.connector.DefaultResolver"
+    ) as m_resolver:
+        conn = aiohttp.TCPConnector(ttl_dns_cache=60)
+        m_resolver().resolve = make_mocked_coro(addrs)
+        await conn._resolve_host("localhost", 8080)
+        assert conn._cached_hosts.ttl_left(("localhost", 8080)) == 20
+
+        now += 21
+        await conn._resolve_host("localhost", 8080)
+        assert m_resolver().resolve.call_count == 2
+        await conn.close()
+
+
+async def test_tcp_connector_dns_cache_size(loop: Any) -> None:
+    with mock.patch("aiohttp.connector.DefaultResolver") as m_resolver:
+        conn = aiohttp.TCPConnector(dns_cache_size=2)
+        m_resolver().resolve = make_mocked_coro(["127.0.0.1"])
+        for host in ("a", "b", "c", "a"):
+            await conn._resolve_host(host, 80)
+        assert m_resolver().resolve.call_count == 4
+        assert conn.dns_cache_evictions == 2
+        await conn.close()
+
+
+async def test_tcp_connector_invalid_dns_cache_args(loop: Any) -> None:
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(dns_refresh_window=-1)
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(dns_stale_grace=-1)
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(ttl_dns_min=-1)
+    with pytest.raises(ValueError):
+        aiohttp.TCPConnector(dns_cache_size=0)
+
+
 @pytest.fixture
 def dns_response_error(loop: Any):
     async def coro():
@@ -992,6 +1485,7 @@ async def test_release_not_started(loop: Any) -> None:
     rec = conn._conns[1]
     assert rec[0][0] == proto
     assert rec[0][1] == pytest.approx(loop.time(), abs=0.05)
+    assert conn._conns_order[proto] == (1, rec[0][1])
     assert not proto.close.called
     await conn.close()
 
@@ -1005,6 +1499,146 @@ async def test_release_not_opened(loop: Any, key: Any) -> None:
     assert proto.close.called
 
 
+def create_connected_proto(loop: Any) -> ResponseHandler:
+    proto = ResponseHandler(loop=loop)
+    transport = mock.Mock()
+    transport.is_closing.return_value = False
+    proto.connection_made(transport)
+    return proto
+
+
+async def test_max_requests_per_connection(loop: Any) -> None:
+    conn = aiohttp.BaseConnector(max_requests_per_connection=2, lifetime_jitter=0)
+    assert conn.max_requests_per_connection == 2
+    proto = create_connected_proto(loop)
+    transport = proto.transport
+    conn._create_connection = make_mocked_coro(proto)
+    req = ClientRequest("GET", URL("http://localhost:80"), loop=loop)
+
+    connection = await conn.connect(req, [], ClientTimeout())
+    connection.release()
+    assert proto in conn._conns_order
+
+    connection = await conn.connect(req, [], ClientTimeout())
+    assert conn._create_connection.call_count == 1
+    connection.release()
+    assert transport.close.called
+    assert not conn._conns
+    await conn.close()
+
+
+async def test_max_connection_age(loop: Any) -> None:
+    conn = aiohttp.BaseConnector(max_connection_age=10, lifetime_jitter=0)
+    assert conn.max_connection_age == 10
+    proto = create_connected_proto(loop)
+    transport = proto.transport
+    conn._create_connection = make_mocked_coro(proto)
+    req = ClientRequest("GET", URL("http://localhost:80"), loop=loop)
+
+    connection = await conn.connect(req, [], ClientTimeout())
+    with mock.patch.object(loop, "time", return_value=loop.time() + 5):
+        connection.release()
+    assert proto in conn._conns_order
+
+    connection = await conn.connect(req, [], ClientTimeout())
+    assert connection.protocol is proto
+    with mock.patch.object(loop, "time", return_value=loop.time() + 11):
+        connection.release()
+    assert transport.close.called
+    assert not conn._conns
+    await conn.close()
+
+
+async def test_lifetime_jitter(loop: Any) -> None:
+    conn = aiohttp.BaseConnector(
+        max_connection_age=100, max_requests_per_connection=100, lifetime_jitter=0.5
+    )
+    proto = create_connected_proto(loop)
+    with mock.patch("aiohttp.connector.random.random", return_value=0.5):
+        conn._setup_lifetime(proto)
+    assert proto._requests_left == 75
+    assert proto._expires_at == pytest.approx(loop.time() + 75, abs=1)
+    await conn.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_connection_age": 0},
+        {"max_requests_per_connection": 0},
+        {"lifetime_jitter": 1},
+        {"lifetime_jitter": -0.1},
+    ],
+)
+async def test_invalid_lifetime_limits(loop: Any, kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        aiohttp.BaseConnector(**kwargs)
+
+
+async def test_prewarm(loop: Any) -> None:
+    conn = aiohttp.BaseConnector(limit_per_host=3)
+    protos = [create_mocked_conn(should_close=False) for i in range(4)]
+    conn._create_connection = mock.Mock(
+        side_effect=[make_mocked_coro(proto)() for proto in protos[:3]]
+    )
+
+    assert await conn.prewarm("http://localhost", 5) == 3
+    assert conn._create_connection.call_count == 3
+    (key,) = conn._conns
+    assert [proto for proto, t in conn._conns[key]] == protos[:3]
+    assert not conn._acquired
+    assert not conn._acquired_per_host
+    await conn.close()
+
+
+async def test_prewarm_top_up(loop: Any) -> None:
+    conn = aiohttp.BaseConnector()
+    protos = [create_mocked_conn(should_close=False) for i in range(3)]
+    conn._create_connection = mock.Mock(
+        side_effect=[make_mocked_coro(proto)() for proto in protos]
+    )
+
+    assert await conn.prewarm("http://localhost", 2, top_up=True) == 2
+    assert await conn.prewarm("http://localhost", 2, top_up=True) == 0
+    assert await conn.prewarm("http://localhost", 3, top_up=True) == 1
+    (conns,) = conn._conns.values()
+    assert len(conns) == 3
+    await conn.close()
+
+
+async def test_prewarm_waiters(loop: Any, key: Any) -> None:
+    conn = aiohttp.BaseConnector(limit=1)
+    conn._create_connection = mock.Mock()
+    req = ClientRequest("GET", URL("http://localhost:80"), loop=loop)
+    conn._waiters[req.connection_key].append(loop.create_future())
+
+    assert await conn.prewarm("http://localhost", 2) == 0
+    assert not conn._create_connection.called
+    conn._waiters.clear()
+    await conn.close()
+
+
+async def test_prewarm_errors(loop: Any) -> None:
+    conn = aiohttp.BaseConnector()
+    proto = create_mocked_conn(should_close=False)
+    conn._create_connection = mock.Mock(
+        side_effect=[
+            make_mocked_coro(raise_exception=OSError())(),
+            make_mocked_coro(proto)(),
+        ]
+    )
+    assert await conn.prewarm("http://localhost", 2) == 1
+
+    conn._create_connection = make_mocked_coro(raise_exception=OSError())
+    with pytest.raises(OSError):
+        await conn.prewarm("http://localhost", 2)
+    assert not conn._acquired
+    await conn.close()
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await conn.prewarm("http://localhost", 2)
+
+
 async def test_connect(loop: Any, key: Any) -> None:
     proto = create_mocked_conn(loop)
     proto.is_connected.return_value = True
@@ -1091,34 +1725,60 @@ async def test_ctor_cleanup() -> None:
 
 
 async def test_cleanup(key: Any) -> None:
-    testset = {
-        key: [(mock.Mock(), 10), (mock.Mock(), 300)],
-    }
-    testset[key][0][0].is_connected.return_value = True
-    testset[key][1][0].is_connected.return_value = False
+    proto1, proto2 = mock.Mock(), mock.Mock()
+    proto1.is_connected.return_value = True
+    proto2.is_connected.return_value = False
 
-    loop = mock.Mock()
-    loop.time.return_value = 300
     conn = aiohttp.BaseConnector()
-    conn._conns = testset
+    conn._loop = mock.Mock()
+    conn._loop.time.return_value = 300
+    add_idle(conn, key, proto1, 10)
+    add_idle(conn, key, proto2, 200)
     existing_handle = conn._cleanup_handle = mock.Mock()
 
     conn._cleanup()
     assert existing_handle.cancel.called
+    assert proto1.close.called
+    assert proto2.close.called
     assert conn._conns == {}
+    assert not conn._conns_order
     assert conn._cleanup_handle is None
 
 
+async def test_cleanup_only_expired(loop: Any, key: Any) -> None:
+    key2 = ConnectionKey("otherhost", 80, False, None, None, None, None)
+    protos = [create_mocked_conn() for i in range(4)]
+
+    conn = aiohttp.BaseConnector(keepalive_timeout=10)
+    conn._loop = mock.Mock()
+    conn._loop.time.return_value = 300
+    add_idle(conn, key, protos[0], 280)
+    add_idle(conn, key2, protos[1], 285)
+    add_idle(conn, key, protos[2], 295)
+    add_idle(conn, key2, protos[3], 296)
+    # entries after the first alive connection are never visited
+    for i in range(5):
+        conn._conns_order[mock.Mock()] = (key, 299)
+
+    conn._cleanup()
+    assert [p.close.called for p in protos] == [True, True, False, False]
+    assert conn._conns == {
+        key: deque([(protos[2], 295)]),
+        key2: deque([(protos[3], 296)]),
+    }
+    assert list(conn._conns_order)[:2] == [protos[2], protos[3]]
+    await conn.close()
+
+
 async def test_cleanup_close_ssl_transport(loop: Any, ssl_key: Any) -> None:
     proto = create_mocked_conn(loop)
     transport = proto.transport
-    testset = {ssl_key: [(proto, 10)]}
 
     loop = mock.Mock()
     loop.time.return_value = asyncio.get_event_loop().time() + 300
     conn = aiohttp.BaseConnector(enable_cleanup_closed=True)
     conn._loop = loop
-    conn._conns = testset
+    add_idle(conn, ssl_key, proto, 10)
     existing_handle = conn._cleanup_handle = mock.Mock()
 
     conn._cleanup()
@@ -1144,18 +1804,17 @@ async def test_cleanup2(loop: Any) -> None:
 
 
 async def test_cleanup3(loop: Any, key: Any) -> None:
-    testset = {
-        key: [(create_mocked_conn(loop), 290.1), (create_mocked_conn(loop), 305.1)]
-    }
-    testset[key][0][0].is_connected.return_value = True
+    proto1, proto2 = create_mocked_conn(loop), create_mocked_conn(loop)
+    proto1.is_connected.return_value = True
 
     conn = aiohttp.BaseConnector(keepalive_timeout=10)
     conn._loop = mock.Mock()
     conn._loop.time.return_value = 308.5
-    conn._conns = testset
+    add_idle(conn, key, proto1, 290.1)
+    add_idle(conn, key, proto2, 305.1)
 
     conn._cleanup()
-    assert conn._conns == {key: [testset[key][1]]}
+    assert conn._conns == {key: deque([(proto2, 305.1)])}
 
     assert conn._cleanup_handle is not None
     conn._loop.call_at.assert_called_with(319, mock.ANY, mock.ANY)
@@ -1719,6 +2378,44 @@ async def test_connect_waiters_cleanup_key_error(loop: Any) -> None:
     assert not conn._waiters.keys() == []
 
 
+async def test_connect_does_not_take_slot_of_woken_waiter(loop: Any) -> None:
+    req = ClientRequest("GET", URL("http://host:80"), loop=loop)
+
+    conn = aiohttp.BaseConnector(limit=1)
+
+    async def create_connection(req, traces, timeout):
+        proto = create_mocked_conn(loop, should_close=False)
+        proto.is_connected.return_value = True
+        return proto
+
+    conn._create_connection = create_connection
+
+    connection = await conn.connect(req, [], ClientTimeout())
+    waiter = loop.create_task(conn.connect(req, [], ClientTimeout()))
+    await asyncio.sleep(0)
+    assert conn._waiters
+
+    # wakes the waiter up, the connection goes to the pool
+    connection.release()
+    assert not conn._waiters
+
+    # a new request comes before the woken waiter resumes
+    coro = conn.connect(req, [], ClientTimeout())
+    try:
+        coro.send(None)
+    except StopIteration:  # pragma: no cover
+        pytest.fail("the slot of the woken waiter is taken")
+    assert list(conn._waiters) == [req.connection_key]
+
+    connection2 = await waiter
+    assert len(conn._acquired) == 1
+    assert not conn._waiters_woken
+
+    coro.close()
+    connection2.close()
+    await conn.close()
+
+
 async def test_close_with_acquired_connection(loop: Any) -> None:
     proto = create_mocked_conn(loop)
     proto.is_connected.return_value = True
@@ -2169,6 +2866,45 @@ class TestDNSCacheTable:
         await asyncio.sleep(0.02)
         assert dns_cache_table.expired("localhost")
 
+    def test_record_ttl(self) -> None:
+        dns_cache_table = _DNSCacheTable(ttl=60, min_ttl=5)
+        with mock.patch("aiohttp.connector.monotonic", return_value=100):
+            dns_cache_table.add("short", ["127.0.0.1"], 1)
+            dns_cache_table.add("record", ["127.0.0.1"], 30)
+            dns_cache_table.add("long", ["127.0.0.1"], 3600)
+            dns_cache_table.add("default", ["127.0.0.1"])
+            assert dns_cache_table.ttl_left("short") == 5
+            assert dns_cache_table.ttl_left("record") == 30
+            assert dns_cache_table.ttl_left("long") == 60
+            assert dns_cache_table.ttl_left("default") == 60
+
+    def test_record_ttl_no_max(self) -> None:
+        dns_cache_table = _DNSCacheTable()
+        with mock.patch("aiohttp.connector.monotonic", return_value=100):
+            dns_cache_table.add("record", ["127.0.0.1"], 3600)
+            dns_cache_table.add("default", ["127.0.0.1"])
+            assert dns_cache_table.ttl_left("record") == 3600
+            assert not dns_cache_table.expired("default")
+
+    def test_max_size(self) -> None:
+        dns_cache_table = _DNSCacheTable(ttl=10, max_size=2)
+        dns_cache_table.add("a", ["127.0.0.1"])
+        dns_cache_table.add("b", ["127.0.0.2"])
+        # "a" is used recently, "b" is evicted
+        dns_cache_table.next_addrs("a")
+        dns_cache_table.add("c", ["127.0.0.3"])
+        assert "a" in dns_cache_table
+        assert "b" not in dns_cache_table
+        assert "c" in dns_cache_table
+        assert len(dns_cache_table) == 2
+        assert dns_cache_table.evictions == 1
+        assert dns_cache_table._expires.keys() == {"a", "c"}
+
+        # replacing an entry does not evict
+        dns_cache_table.add("a", ["127.0.0.4"])
+        assert len(dns_cache_table) == 2
+        assert dns_cache_table.evictions == 1
+
     def test_next_addrs(self, dns_cache_table: Any) -> None:
         dns_cache_table.add("foo", ["127.0.0.1", "127.0.0.2", "127.0.0.3"])
 
@@ -1,7 +1,9 @@
 # type: ignore
 import asyncio
 import base64
+import functools
 import gc
+import json
 import os
 import platform
 from math import isclose, modf
@@ -241,6 +243,45 @@ if not helpers.NO_EXTENSIONS and not IS_PYPY and hasattr(helpers, "reify_c"):
         reify = helpers.reify_c
 
 
+def test_reify_slot() -> None:
+    calls = []
+
+    class A:
+        __slots__ = ("_prop",)
+
+        @helpers.reify_slot
+        def prop(self):
+            """Docstring."""
+            calls.append(1)
+            return None
+
+    a = A()
+    assert a.prop is None
+    assert a.prop is None
+    assert calls == [1]
+    assert a._prop is None
+    assert isinstance(A.prop, helpers.reify_slot)
+    assert "Docstring." == A.prop.__doc__
+    with pytest.raises(AttributeError):
+        a.prop = 123
+
+
+def test_reify_slot_missing_slot() -> None:
+    # Python < 3.12 wraps errors of __set_name__ into RuntimeError
+    with pytest.raises((TypeError, RuntimeError)) as ctx:
+
+        class A:
+            __slots__ = ()
+
+            @helpers.reify_slot
+            def prop(self):
+                return 1
+
+    exc = ctx.value.__cause__ or ctx.value
+    assert isinstance(exc, TypeError)
+    assert "'_prop'" in str(exc)
+
+
 # ----------------------------------- is_ip_address() ----------------------
 
 
@@ -655,8 +696,27 @@ def test_is_expected_content_type_non_json_not_match():
     )
 
 
+def test_is_bytes_json_decoder() -> None:
+    assert helpers.is_bytes_json_decoder(json.loads)
+    assert not helpers.is_bytes_json_decoder(functools.partial(json.loads))
+    assert not helpers.is_bytes_json_decoder(lambda data: data)
+
+
+@pytest.mark.parametrize(
+    ("encoding", "expected"),
+    [("utf-8", True), ("UTF8", True), ("cp1251", False), ("unknown", False)],
+)
+def test_is_utf8(encoding, expected) -> None:
+    assert helpers.is_utf8(encoding) is expected
+
+
+class CookieHolder(helpers.CookieMixin):
+    # CookieMixin is slotted, the storage is provided by subclasses
+    pass
+
+
 def test_cookies_mixin():
-    sut = helpers.CookieMixin()
+    sut = CookieHolder()
 
     assert sut.cookies == {}
     assert str(sut.cookies) == ""
@@ -685,7 +745,7 @@ def test_cookies_mixin():
 
 
 def test_cookies_mixin_path():
-    sut = helpers.CookieMixin()
+    sut = CookieHolder()
 
     assert sut.cookies == {}
 
@@ -719,7 +779,7 @@ def test_cookies_mixin_path():
 
 
 def test_sutonse_cookie__issue_del_cookie():
-    sut = helpers.CookieMixin()
+    sut = CookieHolder()
 
     assert sut.cookies == {}
     assert str(sut.cookies) == ""
@@ -733,7 +793,7 @@ def test_sutonse_cookie__issue_del_cookie():
 
 
 def test_cookie_set_after_del():
-    sut = helpers.CookieMixin()
+    sut = CookieHolder()
 
     sut.del_cookie("name")
     sut.set_cookie("name", "val")
@@ -743,7 +803,7 @@ def test_cookie_set_after_del():
 
 
 def test_populate_with_cookies():
-    cookies_mixin = helpers.CookieMixin()
+    cookies_mixin = CookieHolder()
     cookies_mixin.set_cookie("name", "value")
     headers = CIMultiDict()
 
@@ -340,6 +340,67 @@ def test_headers_old_websocket_key1(parser: Any) -> None:
         parser.feed_data(text)
 
 
+@pytest.fixture(params=REQUEST_PARSERS)
+def lazy_parser(loop: Any, protocol: Any, request: Any):
+    return request.param(protocol, loop, 2 ** 16, lazy_headers=True)
+
+
+def test_lazy_headers(lazy_parser: Any) -> None:
+    text = (
+        b"POST /test HTTP/1.1\r\n"
+        b"X-Forwarded-For: 10.0.0.1\r\n"
+        b"CONNECTION: close\r\n"
+        b"Content-Encoding: deflate\r\n"
+        b"content-length: 4\r\n\r\n"
+    )
+    messages, upgrade, tail = lazy_parser.feed_data(text)
+    msg, payload = messages[0]
+    assert msg.headers is None
+    assert msg.raw_headers == (
+        (b"X-Forwarded-For", b"10.0.0.1"),
+        (b"CONNECTION", b"close"),
+        (b"Content-Encoding", b"deflate"),
+        (b"content-length", b"4"),
+    )
+    assert msg.should_close
+    assert msg.compression == "deflate"
+    assert not msg.chunked
+    assert isinstance(payload, streams.StreamReader)
+
+
+def test_lazy_headers_chunked_upgrade(lazy_parser: Any) -> None:
+    text = b"GET /test HTTP/1.1\r\n" b"Transfer-Encoding: chunked\r\n\r\n"
+    messages, upgrade, tail = lazy_parser.feed_data(text)
+    msg, payload = messages[0]
+    assert msg.chunked
+    assert isinstance(payload, streams.StreamReader)
+
+    lazy_parser.feed_data(b"0\r\n\r\n")
+    text = (
+        b"GET /test HTTP/1.1\r\n"
+        b"connection: upgrade\r\n"
+        b"upgrade: websocket\r\n\r\n"
+    )
+    messages, upgrade, tail = lazy_parser.feed_data(text)
+    msg = messages[0][0]
+    assert msg.upgrade
+    assert upgrade
+
+
+def test_lazy_headers_old_websocket_key1(lazy_parser: Any) -> None:
+    text = b"GET /test HTTP/1.1\r\n" b"SEC-WEBSOCKET-KEY1: line\r\n\r\n"
+
+    with pytest.raises(http_exceptions.BadHttpMessage):
+        lazy_parser.feed_data(text)
+
+
+def test_lazy_headers_content_length_err(lazy_parser: Any) -> None:
+    text = b"GET /test HTTP/1.1\r\n" b"content-length: line\r\n\r\n"
+
+    with pytest.raises(http_exceptions.BadHttpMessage):
+        lazy_parser.feed_data(text)
+
+
 def test_headers_content_length_err_1(parser: Any) -> None:
     text = b"GET /test HTTP/1.1\r\n" b"content-length: line\r\n\r\n"
 
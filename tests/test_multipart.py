@@ -1,5 +1,6 @@
 # type: ignore
 import asyncio
+import base64
 import io
 import json
 import pathlib
@@ -240,6 +241,22 @@ class TestPartReader:
             c3 = await obj.read_chunk(8)
             assert c3 == b""
 
+    @pytest.mark.parametrize("piece", [1, 2, 3, 5, 7])
+    async def test_read_chunk_boundary_split_between_reads(
+        self, newline: Any, piece: int
+    ) -> None:
+        class SlowStream(Stream):
+            async def read(self, size=None):
+                return self.content.read(min(size, piece))
+
+        body = b"Hello, World! -- : --:x"
+        data = body + newline + b"--:--"
+        obj = aiohttp.BodyPartReader(BOUNDARY, {}, SlowStream(data), _newline=newline)
+        result = b""
+        while not obj.at_eof():
+            result += await obj.read_chunk(8)
+        assert result == body
+
     async def test_multi_read_chunk(self, newline: Any) -> None:
         data = b"Hello,%s--:%s%sworld!%s--:--" % ((newline,) * 4)
         obj = aiohttp.BodyPartReader(BOUNDARY, {}, Stream(data), _newline=newline)
@@ -405,6 +422,93 @@ class TestPartReader:
         )
         assert result == expected
 
+    @pytest.mark.parametrize("size", [5, 6, 7, 8, 13])
+    async def test_read_chunk_decode_base64(self, newline: Any, size: int) -> None:
+        data = b"Time to Relax! " * 10
+        encoded = base64.encodebytes(data)
+        obj = aiohttp.BodyPartReader(
+            BOUNDARY,
+            {CONTENT_TRANSFER_ENCODING: "base64"},
+            Stream(encoded + b"%s--:--" % newline),
+            _newline=newline,
+        )
+        result = b""
+        while True:
+            chunk = await obj.read_chunk(size, decode=True)
+            if not chunk:
+                break
+            result += chunk
+        assert result == data
+        assert obj.at_eof()
+
+    @pytest.mark.parametrize("size", [5, 6, 7])
+    async def test_read_chunk_decode_quoted_printable(
+        self, newline: Any, size: int
+    ) -> None:
+        obj = aiohttp.BodyPartReader(
+            BOUNDARY,
+            {CONTENT_TRANSFER_ENCODING: "quoted-printable"},
+            Stream(
+                b"=D0=9F=D1=80=D0=B8=D0=B2=D0=B5=D1=82,=\r\n"
+                b" =D0=BC=D0=B8=D1=80!%s--:--" % newline
+            ),
+            _newline=newline,
+        )
+        result = b"".join(
+            [chunk async for chunk in obj.iter_chunked(size, decode=True)]
+        )
+        expected = (
+            b"\xd0\x9f\xd1\x80\xd0\xb8\xd0\xb2\xd0\xb5\xd1\x82,"
+            b" \xd0\xbc\xd0\xb8\xd1\x80!"
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    async def test_read_chunk_decode_content_encoding(
+        self, newline: Any, encoding: str
+    ) -> None:
+        data = b"Time to Relax! " * 1000
+        wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else -zlib.MAX_WBITS
+        compressor = zlib.compressobj(wbits=wbits)
+        compressed = compressor.compress(data) + compressor.flush()
+        obj = aiohttp.BodyPartReader(
+            BOUNDARY,
+            {CONTENT_ENCODING: encoding, CONTENT_TRANSFER_ENCODING: "base64"},
+            Stream(base64.b64encode(compressed) + b"%s--:--" % newline),
+            _newline=newline,
+        )
+        chunks = [chunk async for chunk in obj.iter_chunked(8, decode=True)]
+        assert all(chunks)
+        assert b"".join(chunks) == data
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    async def test_read_chunk_decode_content_encoding_bounded(
+        self, newline: Any, encoding: str
+    ) -> None:
+        data = b"\0" * 2 ** 20
+        wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else -zlib.MAX_WBITS
+        compressor = zlib.compressobj(wbits=wbits)
+        compressed = compressor.compress(data) + compressor.flush()
+        # the whole part is a single chunk of about 1 KiB
+        assert len(compressed) < 2048
+        obj = aiohttp.BodyPartReader(
+            BOUNDARY,
+            {CONTENT_ENCODING: encoding},
+            Stream(compressed + b"%s--:--" % newline),
+            _newline=newline,
+        )
+        chunks = [chunk async for chunk in obj.iter_chunked(4096, decode=True)]
+        assert max(len(chunk) for chunk in chunks) <= 4096
+        assert b"".join(chunks) == data
+
+    async def test_iter_chunked(self, newline: Any) -> None:
+        obj = aiohttp.BodyPartReader(
+            BOUNDARY, {}, Stream(b"Hello, World!%s--:--" % newline), _newline=newline
+        )
+        chunks = [chunk async for chunk in obj.iter_chunked(8)]
+        assert b"".join(chunks) == b"Hello, World!"
+        assert obj.at_eof()
+
     @pytest.mark.parametrize("encoding", ("binary", "8bit", "7bit"))
     async def test_read_with_content_transfer_encoding_binary(
         self, encoding: Any, newline: Any
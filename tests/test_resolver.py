@@ -1,12 +1,21 @@
 import asyncio
 import ipaddress
+import os
+import signal
 import socket
-from typing import Any, Awaitable, Callable, List
+import threading
+import time
+from typing import Any, Callable, Dict, List
 from unittest.mock import Mock, patch
 
 import pytest
 
-from aiohttp.resolver import AsyncResolver, DefaultResolver, ThreadedResolver
+from aiohttp.resolver import (
+    AsyncResolver,
+    DefaultResolver,
+    ThreadedResolver,
+    aiodns_getaddrinfo,
+)
 
 try:
     import aiodns
@@ -39,8 +48,26 @@ async def fake_query_result(result: Any) -> List[FakeQueryResult]:
     return [FakeQueryResult(host=h) for h in result]
 
 
-def fake_addrinfo(hosts: Any) -> Callable[..., Awaitable[Any]]:
-    async def fake(*args: Any, **kwargs: Any) -> List[Any]:
+class FakeAddrInfoNode:
+    def __init__(self, family: int, addr: Any, ttl: int) -> None:
+        self.family = family
+        self.protocol = socket.IPPROTO_TCP
+        self.addr = addr
+        self.ttl = ttl
+
+
+async def fake_aiodns_addrinfo(nodes: Any) -> Any:
+    return Mock(nodes=nodes)
+
+
+@pytest.fixture
+def gethostbyname_only(monkeypatch: Any) -> None:
+    # aiodns < 3.2 without getaddrinfo()
+    monkeypatch.setattr("aiohttp.resolver.aiodns_getaddrinfo", False)
+
+
+def fake_addrinfo(hosts: Any) -> Callable[..., Any]:
+    def fake(*args: Any, **kwargs: Any) -> List[Any]:
         if not hosts:
             raise socket.gaierror
 
@@ -50,7 +77,9 @@ def fake_addrinfo(hosts: Any) -> Callable[..., Awaitable[Any]]:
 
 
 @pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
-async def test_async_resolver_positive_lookup(loop: Any) -> None:
+async def test_async_resolver_positive_lookup(
+    loop: Any, gethostbyname_only: None
+) -> None:
     with patch("aiodns.DNSResolver") as mock:
         mock().gethostbyname.return_value = fake_result(["127.0.0.1"])
         resolver = AsyncResolver()
@@ -60,7 +89,9 @@ async def test_async_resolver_positive_lookup(loop: Any) -> None:
 
 
 @pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
-async def test_async_resolver_multiple_replies(loop: Any) -> None:
+async def test_async_resolver_multiple_replies(
+    loop: Any, gethostbyname_only: None
+) -> None:
     with patch("aiodns.DNSResolver") as mock:
         ips = ["127.0.0.1", "127.0.0.2", "127.0.0.3", "127.0.0.4"]
         mock().gethostbyname.return_value = fake_result(ips)
@@ -71,7 +102,9 @@ async def test_async_resolver_multiple_replies(loop: Any) -> None:
 
 
 @pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
-async def test_async_resolver_negative_lookup(loop: Any) -> None:
+async def test_async_resolver_negative_lookup(
+    loop: Any, gethostbyname_only: None
+) -> None:
     with patch("aiodns.DNSResolver") as mock:
         mock().gethostbyname.side_effect = aiodns.error.DNSError()
         resolver = AsyncResolver()
@@ -80,7 +113,23 @@ async def test_async_resolver_negative_lookup(loop: Any) -> None:
 
 
 @pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
-async def test_async_resolver_no_hosts_in_gethostbyname(loop: Any) -> None:
+async def test_async_resolver_host_not_found(
+    loop: Any, gethostbyname_only: None
+) -> None:
+    with patch("aiodns.DNSResolver") as mock:
+        mock().gethostbyname.side_effect = aiodns.error.DNSError(
+            aiodns.error.ARES_ENOTFOUND, "Domain name not found"
+        )
+        resolver = AsyncResolver()
+        with pytest.raises(socket.gaierror) as ctx:
+            await resolver.resolve("doesnotexist.bla")
+        assert ctx.value.errno == socket.EAI_NONAME
+
+
+@pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
+async def test_async_resolver_no_hosts_in_gethostbyname(
+    loop: Any, gethostbyname_only: None
+) -> None:
     with patch("aiodns.DNSResolver") as mock:
         mock().gethostbyname.return_value = fake_result([])
         resolver = AsyncResolver()
@@ -88,37 +137,204 @@ async def test_async_resolver_no_hosts_in_gethostbyname(loop: Any) -> None:
             await resolver.resolve("doesnotexist.bla")
 
 
+@pytest.mark.skipif(not aiodns_getaddrinfo, reason="aiodns 3.2 required")
+async def test_async_resolver_getaddrinfo(loop: Any) -> None:
+    with patch("aiodns.DNSResolver") as mock:
+        mock().getaddrinfo.return_value = fake_aiodns_addrinfo(
+            [
+                FakeAddrInfoNode(socket.AF_INET, (b"127.0.0.1", 80), 300),
+                FakeAddrInfoNode(socket.AF_INET6, (b"::1", 80, 0, 0), 60),
+            ]
+        )
+        resolver = AsyncResolver()
+        real = await resolver.resolve("www.python.org", 80, family=socket.AF_UNSPEC)
+        mock().getaddrinfo.assert_called_with(
+            "www.python.org",
+            family=socket.AF_UNSPEC,
+            port=80,
+            type=socket.SOCK_STREAM,
+            flags=socket.AI_ADDRCONFIG,
+        )
+    assert [(r["host"], r["port"], r["family"], r["ttl"]) for r in real] == [
+        ("127.0.0.1", 80, socket.AF_INET, 300),
+        ("::1", 80, socket.AF_INET6, 60),
+    ]
+
+
+@pytest.mark.skipif(not aiodns_getaddrinfo, reason="aiodns 3.2 required")
+async def test_async_resolver_getaddrinfo_not_found(loop: Any) -> None:
+    with patch("aiodns.DNSResolver") as mock:
+        mock().getaddrinfo.side_effect = aiodns.error.DNSError(
+            aiodns.error.ARES_ENOTFOUND, "Domain name not found"
+        )
+        resolver = AsyncResolver()
+        with pytest.raises(socket.gaierror):
+            await resolver.resolve("doesnotexist.bla")
+
+
 async def test_threaded_resolver_positive_lookup() -> None:
-    loop = Mock()
-    loop.getaddrinfo = fake_addrinfo(["127.0.0.1"])
     resolver = ThreadedResolver()
-    resolver._loop = loop
-    real = await resolver.resolve("www.python.org")
+    with patch("socket.getaddrinfo", fake_addrinfo(["127.0.0.1"])):
+        real = await resolver.resolve("www.python.org")
     assert real[0]["hostname"] == "www.python.org"
     ipaddress.ip_address(real[0]["host"])
 
 
 async def test_threaded_resolver_multiple_replies() -> None:
-    loop = Mock()
     ips = ["127.0.0.1", "127.0.0.2", "127.0.0.3", "127.0.0.4"]
-    loop.getaddrinfo = fake_addrinfo(ips)
     resolver = ThreadedResolver()
-    resolver._loop = loop
-    real = await resolver.resolve("www.google.com")
+    with patch("socket.getaddrinfo", fake_addrinfo(ips)):
+        real = await resolver.resolve("www.google.com")
     ips = [ipaddress.ip_address(x["host"]) for x in real]
     assert len(ips) > 3, "Expecting multiple addresses"
 
 
 async def test_threaded_negative_lookup() -> None:
-    loop = Mock()
     ips: List[Any] = []
-    loop.getaddrinfo = fake_addrinfo(ips)
     resolver = ThreadedResolver()
-    resolver._loop = loop
-    with pytest.raises(socket.gaierror):
+    with patch("socket.getaddrinfo", fake_addrinfo(ips)), pytest.raises(
+        socket.gaierror
+    ):
         await resolver.resolve("doesnotexist.bla")
 
 
+@pytest.fixture
+def pools(monkeypatch: Any) -> Any:
+    pools: Dict[int, Any] = {}
+    monkeypatch.setattr("aiohttp.resolver._pools", pools)
+    yield pools
+    for pool in pools.values():
+        pool._executor.shutdown()
+
+
+class BlockingAddrinfo:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+        self.unblock = threading.Event()
+
+    def __call__(self, host: str, *args: Any) -> List[Any]:
+        self.calls.append(host)
+        self.unblock.wait(5)
+        return [(socket.AF_INET, None, 6, None, ["127.0.0.1", 0])]
+
+
+async def wait_for(predicate: Callable[[], bool]) -> None:
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+async def test_threaded_resolver_invalid_max_workers(loop: Any) -> None:
+    with pytest.raises(ValueError):
+        ThreadedResolver(max_workers=0)
+
+
+async def test_threaded_resolver_pools(pools: Any) -> None:
+    assert ThreadedResolver()._pool is ThreadedResolver()._pool
+    assert ThreadedResolver(2)._pool is ThreadedResolver(2)._pool
+    assert ThreadedResolver(2)._pool is not ThreadedResolver()._pool
+
+
+async def test_threaded_resolver_coalesce(pools: Any) -> None:
+    getaddrinfo = BlockingAddrinfo()
+    resolvers = [ThreadedResolver(), ThreadedResolver()]
+    with patch("socket.getaddrinfo", getaddrinfo):
+        tasks = [asyncio.ensure_future(r.resolve("example.com")) for r in resolvers]
+        await wait_for(lambda: resolvers[0].active == 1)
+        getaddrinfo.unblock.set()
+        results = await asyncio.gather(*tasks)
+
+    assert getaddrinfo.calls == ["example.com"]
+    assert results[0] == results[1]
+    resolver = resolvers[1]
+    assert resolver.coalesced == 1
+    assert resolver.lookups == 1
+    assert resolver.lookup_time > 0
+    assert resolver.active == resolver.queued == 0
+    assert not resolver._pool._lookups
+
+
+async def test_threaded_resolver_cancel_coalesced(pools: Any) -> None:
+    getaddrinfo = BlockingAddrinfo()
+    resolver = ThreadedResolver()
+    with patch("socket.getaddrinfo", getaddrinfo):
+        t1 = asyncio.ensure_future(resolver.resolve("example.com"))
+        t2 = asyncio.ensure_future(resolver.resolve("example.com"))
+        await wait_for(lambda: resolver.active == 1)
+        t1.cancel()
+        getaddrinfo.unblock.set()
+        res = await t2
+
+    assert t1.cancelled()
+    assert res[0]["host"] == "127.0.0.1"
+
+
+async def test_threaded_resolver_queue(pools: Any) -> None:
+    getaddrinfo = BlockingAddrinfo()
+    resolver = ThreadedResolver(max_workers=1)
+    with patch("socket.getaddrinfo", getaddrinfo):
+        t1 = asyncio.ensure_future(resolver.resolve("one.example.com"))
+        await wait_for(lambda: resolver.active == 1)
+        t2 = asyncio.ensure_future(resolver.resolve("two.example.com"))
+        await asyncio.sleep(0)
+        assert resolver.queued == 1
+
+        # the queued lookup is dropped without running
+        t2.cancel()
+        await wait_for(lambda: resolver.queued == 0)
+        getaddrinfo.unblock.set()
+        await t1
+
+    assert getaddrinfo.calls == ["one.example.com"]
+    assert resolver.lookups == 1
+    assert not resolver._pool._lookups
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() required")
+def test_threaded_resolver_after_fork(pools: Any) -> None:
+    async def resolve(resolver: Any) -> Any:
+        return await asyncio.wait_for(resolver.resolve("127.0.0.1"), 5)
+
+    async def make() -> Any:
+        resolver = ThreadedResolver()
+        # start a thread of the pool
+        await resolve(resolver)
+        return resolver
+
+    loop = asyncio.new_event_loop()
+    try:
+        resolver = loop.run_until_complete(make())
+    finally:
+        loop.close()
+
+    # another thread holds the lock of the pool at fork() time
+    with resolver._pool._lock:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            code = 1
+            try:
+                loop = asyncio.new_event_loop()
+                hosts = loop.run_until_complete(resolve(resolver))
+                if hosts[0]["host"] == "127.0.0.1":
+                    code = 0
+            finally:
+                os._exit(code)
+
+    for _ in range(500):
+        wpid, status = os.waitpid(pid, os.WNOHANG)
+        if wpid:
+            break
+        time.sleep(0.01)
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        pytest.fail("Lookup in the forked process hangs")
+    assert os.WIFEXITED(status)
+    assert os.WEXITSTATUS(status) == 0
+
+
 async def test_close_for_threaded_resolver(loop: Any) -> None:
     resolver = ThreadedResolver()
     await resolver.close()
@@ -144,7 +360,9 @@ async def test_default_loop_for_async_resolver(loop: Any) -> None:
 
 
 @pytest.mark.skipif(not gethostbyname, reason="aiodns 1.1 required")
-async def test_async_resolver_ipv6_positive_lookup(loop: Any) -> None:
+async def test_async_resolver_ipv6_positive_lookup(
+    loop: Any, gethostbyname_only: None
+) -> None:
     with patch("aiodns.DNSResolver") as mock:
         mock().gethostbyname.return_value = fake_result(["::1"])
         resolver = AsyncResolver()
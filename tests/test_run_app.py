@@ -659,6 +659,123 @@ def test_sigterm() -> None:
     assert proc.wait() == 0
 
 
+_script_test_workers = """
+import os
+import sys
+
+from aiohttp import web
+
+
+async def handler(request):
+    return web.Response(text=str(os.getpid()))
+
+app = web.Application()
+app.router.add_get("/", handler)
+web.run_app(app, host="127.0.0.1", port=int(sys.argv[1]), workers=2)
+"""
+
+
+def test_run_app_workers(aiohttp_unused_port: Any) -> None:
+    skip_if_on_windows()
+    from urllib.request import urlopen
+
+    port = aiohttp_unused_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "-c", _script_test_workers, str(port)],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        for line in proc.stdout:
+            if line.startswith(b"======== Running on"):
+                break
+        assert b"(2 workers)" in line
+
+        def get_pid() -> int:
+            with urlopen(f"http://127.0.0.1:{port}/", timeout=10) as resp:
+                return int(resp.read())
+
+        pids = {get_pid() for _ in range(50)}
+        assert len(pids) == 2
+        assert proc.pid not in pids
+
+        # a killed worker is replaced by a new one
+        killed = pids.pop()
+        os.kill(killed, signal.SIGKILL)
+        for _ in range(100):
+            try:
+                pid = get_pid()
+            except OSError:  # pragma: no cover
+                pid = 0
+            if pid not in (0, killed) and pid not in pids:
+                break
+        else:  # pragma: no cover
+            pytest.fail("worker was not restarted")
+    finally:
+        proc.terminate()
+        assert proc.wait(timeout=30) == 0
+
+
+_script_test_threads = """
+import sys
+import threading
+
+from aiohttp import web
+
+
+async def handler(request):
+    return web.Response(text=str(threading.get_ident()))
+
+app = web.Application()
+app.router.add_get("/", handler)
+web.run_app(app, host="127.0.0.1", port=int(sys.argv[1]), threads=2)
+"""
+
+
+def test_run_app_threads(aiohttp_unused_port: Any) -> None:
+    skip_if_on_windows()
+    from urllib.request import urlopen
+
+    port = aiohttp_unused_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "-c", _script_test_threads, str(port)],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        for line in proc.stdout:
+            if line.startswith(b"======== Running on"):
+                break
+        assert b"(2 threads)" in line
+
+        idents = set()
+        for _ in range(50):
+            with urlopen(f"http://127.0.0.1:{port}/", timeout=10) as resp:
+                idents.add(resp.read())
+        assert len(idents) == 2
+    finally:
+        proc.terminate()
+        assert proc.wait(timeout=30) == 0
+
+
+def test_run_app_invalid_threads() -> None:
+    with pytest.raises(ValueError):
+        web.run_app(web.Application(), threads=0)
+
+
+def test_run_app_threads_cleanup_ctx(patched_loop: Any) -> None:
+    async def ctx(app: web.Application) -> Any:
+        yield
+
+    app = web.Application()
+    app.cleanup_ctx.append(ctx)
+    with pytest.raises(RuntimeError):
+        web.run_app(app, threads=2, print=stopper(patched_loop))
+
+
+def test_run_app_invalid_workers() -> None:
+    with pytest.raises(ValueError):
+        web.run_app(web.Application(), workers=0)
+
+
 def test_startup_cleanup_signals_even_on_failure(patched_loop: Any) -> None:
     patched_loop.create_server = mock.Mock(side_effect=RuntimeError())
 
@@ -483,3 +483,96 @@ def test_forbid_changing_frozen_app() -> None:
 def test_app_boolean() -> None:
     app = web.Application()
     assert app
+
+
+def test_app_invalid_upload_spool() -> None:
+    with pytest.raises(ValueError):
+        web.Application(upload_spool_threshold=-1)
+    with pytest.raises(ValueError):
+        web.Application(upload_spool_max_size=-1)
+
+
+async def test_app_max_inflight_requests(aiohttp_client: Any) -> None:
+    event = asyncio.Event()
+
+    async def handler(request):
+        await event.wait()
+        return web.Response(text="OK")
+
+    async def free(request):
+        return web.Response(text="free")
+
+    app = web.Application(handler_args={"retry_after": 5})
+    subapp = web.Application(max_inflight_requests=1)
+    subapp.router.add_get("/", handler)
+    app.router.add_get("/free", free)
+    app.add_subapp("/sub", subapp)
+    client = await aiohttp_client(app)
+
+    task = asyncio.ensure_future(client.get("/sub/"))
+    while subapp.inflight_requests == 0:
+        await asyncio.sleep(0.01)
+
+    resp = await client.get("/sub/")
+    assert resp.status == 503
+    assert resp.headers["Retry-After"] == "5"
+    assert subapp.rejected_requests == 1
+    await resp.release()
+
+    resp = await client.get("/free")
+    assert resp.status == 200
+    await resp.release()
+
+    event.set()
+    resp = await task
+    assert resp.status == 200
+    assert subapp.inflight_requests == 0
+
+
+async def test_app_handler_timeout(aiohttp_client: Any) -> None:
+    async def slow(request):
+        await asyncio.sleep(10)
+        return web.Response(text="OK")
+
+    async def fast(request):
+        await asyncio.sleep(0.1)
+        return web.Response(text="OK")
+
+    app = web.Application(handler_timeout=0.05)
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/fast", fast, handler_timeout=1)
+    app.add_routes([web.get("/fast2", fast, handler_timeout=1)])
+    client = await aiohttp_client(app, server_kwargs={"handler_timeout": 10})
+
+    resp = await client.get("/slow")
+    assert resp.status == 504
+    await resp.release()
+
+    resp = await client.get("/fast")
+    assert resp.status == 200
+    await resp.release()
+
+    resp = await client.get("/fast2")
+    assert resp.status == 200
+    await resp.release()
+
+
+async def test_subapp_handler_timeout(aiohttp_client: Any) -> None:
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return web.Response(text="OK")
+
+    app = web.Application(handler_timeout=1)
+    subapp = web.Application(handler_timeout=0.01)
+    subapp.router.add_get("/", handler)
+    app.router.add_get("/", handler)
+    app.add_subapp("/sub", subapp)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/")
+    assert resp.status == 200
+    await resp.release()
+
+    resp = await client.get("/sub/")
+    assert resp.status == 504
+    await resp.release()
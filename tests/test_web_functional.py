@@ -1,5 +1,7 @@
 # type: ignore
 import asyncio
+import gc
+import hashlib
 import io
 import json
 import pathlib
@@ -1506,6 +1508,166 @@ async def test_post_max_client_size_for_file(aiohttp_client: Any) -> None:
     assert 413 == resp.status
 
 
+async def test_post_file_spooling(aiohttp_client: Any, tmp_path: Any) -> None:
+    files = {}
+
+    async def handler(request):
+        data = await request.post()
+        for name in ("small", "large"):
+            field = data[name]
+            files[name] = (field.file._rolled, field.file.read())
+        return web.Response()
+
+    app = web.Application(
+        client_max_size=2 ** 22, upload_spool_threshold=10, upload_dir=str(tmp_path)
+    )
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    large = b"x" * (2 ** 20 + 2 ** 17)
+    data = {"small": io.BytesIO(b"test"), "large": io.BytesIO(large)}
+    resp = await client.post("/", data=data)
+
+    assert 200 == resp.status
+    assert files["small"] == (False, b"test")
+    assert files["large"] == (True, large)
+
+
+async def test_post_upload_spool_max_size(aiohttp_client: Any) -> None:
+    async def handler(request):
+        await request.post()
+        return web.Response()
+
+    app = web.Application(upload_spool_max_size=6)
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    data = {"file1": io.BytesIO(b"test"), "file2": io.BytesIO(b"test")}
+    resp = await client.post("/", data=data)
+
+    assert 413 == resp.status
+    resp_text = await resp.text()
+    assert "Maximum request body size 6 exceeded, actual body size 8" in resp_text
+
+
+async def test_post_upload_spool_max_size_shared(aiohttp_client: Any) -> None:
+    kept = []
+
+    async def keep(request):
+        kept.append(await request.post())
+        return web.Response()
+
+    async def handler(request):
+        data = await request.post()
+        return web.Response(body=data["file"].file.read())
+
+    app = web.Application(upload_spool_max_size=6)
+    app.router.add_post("/keep", keep)
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.post("/keep", data={"file": io.BytesIO(b"test")})
+    assert 200 == resp.status
+    # the kept file takes 4 bytes of the budget
+    resp = await client.post("/", data={"file": io.BytesIO(b"test")})
+    assert 503 == resp.status
+
+    kept.clear()
+    resp = await client.post("/", data={"file": io.BytesIO(b"test")})
+    assert 200 == resp.status
+    assert b"test" == await resp.read()
+    await client.close()
+    gc.collect()
+    assert app._upload_spool_budget.size == 0
+
+
+async def test_iter_form(aiohttp_client: Any) -> None:
+    async def on_file(field, chunks):
+        digest = hashlib.sha256()
+        async for chunk in chunks:
+            digest.update(chunk)
+        return (field.filename, digest.hexdigest())
+
+    async def handler(request):
+        fields = [item async for item in request.iter_form(on_file=on_file)]
+        return web.json_response(fields)
+
+    app = web.Application(client_max_size=2 ** 20)
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    large = b"x" * (2 ** 20)
+    form = aiohttp.FormData()
+    form.add_field("name", "value")
+    form.add_field("file", io.BytesIO(large), filename="large.bin")
+    form.add_field("file", io.BytesIO(b"small"), filename="small.bin")
+    resp = await client.post("/", data=form)
+
+    assert 200 == resp.status
+    assert await resp.json() == [
+        ["name", "value"],
+        ["file", ["large.bin", hashlib.sha256(large).hexdigest()]],
+        ["file", ["small.bin", hashlib.sha256(b"small").hexdigest()]],
+    ]
+
+
+async def test_iter_form_skip_file(aiohttp_client: Any) -> None:
+    async def on_file(field, chunks):
+        return None
+
+    async def handler(request):
+        fields = [item async for item in request.iter_form(on_file=on_file)]
+        return web.json_response(fields)
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    form = aiohttp.FormData()
+    form.add_field("file", io.BytesIO(b"data"), filename="file.bin")
+    form.add_field("name", "value")
+    resp = await client.post("/", data=form)
+
+    assert 200 == resp.status
+    assert await resp.json() == [["file", None], ["name", "value"]]
+
+
+async def test_iter_form_urlencoded(aiohttp_client: Any) -> None:
+    async def handler(request):
+        fields = [item async for item in request.iter_form(on_file=mock.Mock())]
+        return web.json_response(fields)
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.post("/", data={"a": "b"})
+
+    assert 200 == resp.status
+    assert await resp.json() == [["a", "b"]]
+
+
+async def test_iter_form_max_client_size(aiohttp_client: Any) -> None:
+    async def on_file(field, chunks):
+        async for chunk in chunks:
+            pass
+
+    async def handler(request):
+        async for item in request.iter_form(on_file=on_file):
+            pass
+        return web.Response()
+
+    app = web.Application(client_max_size=10)
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    form = aiohttp.FormData()
+    form.add_field("file", io.BytesIO(b"x" * 20), filename="file.bin")
+    resp = await client.post("/", data=form)
+
+    assert 413 == resp.status
+
+
 async def test_response_with_bodypart(aiohttp_client: Any) -> None:
     async def handler(request):
         reader = await request.multipart()
@@ -1912,3 +2074,100 @@ async def test_httpfound_cookies_302(aiohttp_client: Any) -> None:
     client = await aiohttp_client(app)
     resp = await client.get("/", allow_redirects=False)
     assert "my-cookie" in resp.cookies
+
+
+async def test_lazy_headers(aiohttp_server: Any, aiohttp_client: Any) -> None:
+    async def handler(request):
+        assert request._headers is None
+        headers = request.headers
+        assert request.headers is headers
+        return web.json_response(
+            {
+                "host": request.host,
+                "custom": headers.getall("X-Custom"),
+                "raw": len(request.raw_headers),
+                "body": await request.text(),
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    server = await aiohttp_server(app, lazy_headers=True)
+    client = await aiohttp_client(server)
+
+    resp = await client.post(
+        "/",
+        data="payload",
+        headers=[("Host", "example.com"), ("X-Custom", "a"), ("X-Custom", "b")],
+    )
+    assert 200 == resp.status
+    data = await resp.json()
+    assert data["host"] == "example.com"
+    assert data["custom"] == ["a", "b"]
+    assert data["raw"] >= 4
+    assert data["body"] == "payload"
+
+
+async def test_lazy_headers_content(aiohttp_server: Any, aiohttp_client: Any) -> None:
+    async def handler(request):
+        assert request._headers is None
+        data = await request.post()
+        return web.json_response(
+            {
+                "content_type": request.content_type,
+                "charset": request.charset,
+                "content_length": request.content_length,
+                "form": dict(data),
+                "built": request._headers is not None,
+            }
+        )
+
+    async def multipart_handler(request):
+        data = await request.post()
+        with data["f"].file as f:
+            content = f.read().decode()
+        return web.json_response(
+            {
+                "form": {"a": data["a"], "f": content},
+                "built": request._headers is not None,
+            }
+        )
+
+    async def json_handler(request):
+        data = await request.json()
+        return web.json_response({"json": data, "built": request._headers is not None})
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    app.router.add_post("/multipart", multipart_handler)
+    app.router.add_post("/json", json_handler)
+    server = await aiohttp_server(app, lazy_headers=True)
+    client = await aiohttp_client(server)
+
+    resp = await client.post(
+        "/",
+        data=b"a=1&b=2",
+        headers={"Content-Type": "application/x-www-form-urlencoded; charset=utf-8"},
+    )
+    assert 200 == resp.status
+    assert await resp.json() == {
+        "content_type": "application/x-www-form-urlencoded",
+        "charset": "utf-8",
+        "content_length": 7,
+        "form": {"a": "1", "b": "2"},
+        "built": False,
+    }
+
+    form = aiohttp.FormData()
+    form.add_field("a", "1")
+    form.add_field("f", b"file data", filename="f.txt")
+    resp = await client.post("/multipart", data=form)
+    assert 200 == resp.status
+    assert await resp.json() == {
+        "form": {"a": "1", "f": "file data"},
+        "built": False,
+    }
+
+    resp = await client.post("/json", json={"a": [1, 2]})
+    assert 200 == resp.status
+    assert await resp.json() == {"json": {"a": [1, 2]}, "built": False}
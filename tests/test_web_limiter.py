@@ -0,0 +1,213 @@
+# type: ignore
+import asyncio
+from typing import Any
+
+import pytest
+
+import aiohttp
+from aiohttp import web
+from aiohttp.web_limiter import AIMDLimiter
+
+
+async def test_repr() -> None:
+    limiter = AIMDLimiter(initial_limit=5)
+    assert repr(limiter) == "<AIMDLimiter limit=5 inflight=0 queued=0>"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_limit": 0},
+        {"initial_limit": 10, "max_limit": 5},
+        {"backoff_ratio": 1},
+        {"queue_size": -1},
+        {"queue_timeout": 0},
+    ],
+)
+async def test_invalid_params(kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        AIMDLimiter(**kwargs)
+
+
+async def test_acquire_release() -> None:
+    limiter = AIMDLimiter(initial_limit=2)
+    assert await limiter.acquire()
+    assert await limiter.acquire()
+    assert limiter.inflight == 2
+    assert not await limiter.acquire()
+    assert limiter.rejected == 1
+
+    limiter.release(0.1)
+    assert limiter.inflight == 1
+    assert limiter.limit == 3
+
+
+async def test_increase_requires_utilization() -> None:
+    limiter = AIMDLimiter(initial_limit=10)
+    assert await limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 10
+
+
+async def test_increase_capped() -> None:
+    limiter = AIMDLimiter(initial_limit=2, max_limit=2)
+    assert await limiter.acquire()
+    assert await limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 2
+
+
+async def test_decrease_on_slow_request() -> None:
+    limiter = AIMDLimiter(initial_limit=10, latency_threshold=0.5, backoff_ratio=0.5)
+    assert await limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.limit == 5
+
+
+async def test_decrease_capped() -> None:
+    limiter = AIMDLimiter(initial_limit=2, min_limit=2, latency_threshold=0.5)
+    assert await limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.limit == 2
+
+
+async def test_queue_wakeup() -> None:
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1, queue_size=1)
+    assert await limiter.acquire()
+
+    task = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+    assert not await limiter.acquire()
+
+    limiter.release(0.1)
+    assert await task
+    assert limiter.inflight == 1
+    assert limiter.queued == 0
+
+
+async def test_queue_timeout() -> None:
+    limiter = AIMDLimiter(initial_limit=1, queue_size=1, queue_timeout=0.01)
+    assert await limiter.acquire()
+    assert not await limiter.acquire()
+    assert limiter.queued == 0
+    assert limiter.rejected == 1
+    assert limiter.inflight == 1
+
+
+async def test_queue_timeout_default() -> None:
+    limiter = AIMDLimiter(initial_limit=1, queue_size=1)
+    assert await limiter.acquire()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert not await limiter.acquire()
+    assert loop.time() - start >= 0.9
+    assert limiter.queued == 0
+    assert limiter.rejected == 1
+
+
+async def test_queue_cancel() -> None:
+    limiter = AIMDLimiter(initial_limit=1, queue_size=1)
+    assert await limiter.acquire()
+
+    task = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.queued == 0
+    assert limiter.inflight == 1
+
+
+async def test_queue_cancel_after_handover() -> None:
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1, queue_size=2)
+    assert await limiter.acquire()
+
+    task1 = asyncio.ensure_future(limiter.acquire())
+    task2 = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release(0.1)
+    task1.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task1
+    assert await task2
+    assert limiter.inflight == 1
+
+
+async def test_server_sheds_requests(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    event = asyncio.Event()
+
+    async def handler(request):
+        await event.wait()
+        return web.Response(text="OK")
+
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+    server = await aiohttp_raw_server(handler, limiter=limiter)
+    cli = await aiohttp_client(server)
+
+    task = asyncio.ensure_future(cli.get("/"))
+    while limiter.inflight == 0:
+        await asyncio.sleep(0.01)
+
+    resp = await cli.get("/")
+    assert resp.status == 503
+    assert limiter.rejected == 1
+    assert server.runner.server.rejected_requests == 1
+    await resp.release()
+
+    event.set()
+    resp = await task
+    assert resp.status == 200
+    assert limiter.inflight == 0
+
+
+async def test_server_queues_requests(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return web.Response(text="OK")
+
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1, queue_size=10)
+    server = await aiohttp_raw_server(handler, limiter=limiter)
+    cli = await aiohttp_client(server)
+
+    resps = await asyncio.gather(*(cli.get("/") for i in range(5)))
+    assert [resp.status for resp in resps] == [200] * 5
+    assert limiter.rejected == 0
+    assert limiter.inflight == 0
+
+
+async def test_server_releases_slot_on_request_factory_error(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    calls = 0
+
+    def request_factory(message, payload, protocol, writer, task):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("factory failed")
+        loop = asyncio.get_running_loop()
+        return web.BaseRequest(message, payload, protocol, writer, task, loop)
+
+    limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+    server = await aiohttp_raw_server(
+        handler, limiter=limiter, request_factory=request_factory
+    )
+    cli = await aiohttp_client(server)
+
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await cli.get("/")
+    assert limiter.inflight == 0
+    assert server.runner.server.inflight_requests == 0
+
+    resp = await cli.get("/")
+    assert resp.status == 200
+    assert limiter.inflight == 0
@@ -1,6 +1,8 @@
 # type: ignore
 import datetime
-import platform
+import io
+import json
+import logging
 import sys
 from typing import Any
 from unittest import mock
@@ -8,7 +10,7 @@ from unittest import mock
 import pytest
 
 import aiohttp
-from aiohttp import web
+from aiohttp import web, web_log
 from aiohttp.abc import AbstractAccessLogger, AbstractAsyncAccessLogger
 from aiohttp.web_log import AccessLogger
 from aiohttp.web_response import Response
@@ -18,8 +20,6 @@ try:
 except ImportError:
     ContextVar = None
 
-IS_PYPY: Any = platform.python_implementation() == "PyPy"
-
 
 def test_access_logger_format() -> None:
     log_format = '%T "%{ETag}o" %X {X} %%P'
@@ -29,29 +29,6 @@ def test_access_logger_format() -> None:
     assert expected == access_logger._log_format
 
 
-@pytest.mark.skipif(
-    IS_PYPY,
-    reason="""
-    Because of patching :py:class:`datetime.datetime`, under PyPy it
-    fails in :py:func:`isinstance` call in
-    :py:meth:`datetime.datetime.__sub__` (called from
-    :py:meth:`aiohttp.AccessLogger._format_t`):
-
-    *** TypeError: isinstance() arg 2 must be a class, type, or tuple of classes and types
-
-    (Pdb) from datetime import datetime
-    (Pdb) isinstance(now, datetime)
-    *** TypeError: isinstance() arg 2 must be a class, type, or tuple of classes and types
-    (Pdb) datetime.__class__
-    <class 'unittest.mock.MagicMock'>
-    (Pdb) isinstance(now, datetime.__class__)
-    False
-
-    Ref: https://bitbucket.org/pypy/pypy/issues/1187/call-to-isinstance-in-__sub__-self-other
-    Ref: https://github.com/celery/celery/issues/811
-    Ref: https://stackoverflow.com/a/46102240/595220
-    """,  # noqa: E501
-)
 @pytest.mark.parametrize(
     "log_format,expected,extra",
     [
@@ -84,12 +61,9 @@ def test_access_logger_format() -> None:
 def test_access_logger_atoms(
     monkeypatch: Any, log_format: Any, expected: Any, extra: Any
 ) -> None:
-    class PatchedDatetime(datetime.datetime):
-        @staticmethod
-        def now(tz):
-            return datetime.datetime(1843, 1, 1, 0, 30, tzinfo=tz)
-
-    monkeypatch.setattr("datetime.datetime", PatchedDatetime)
+    tz = datetime.timezone(datetime.timedelta(hours=8))
+    now = datetime.datetime(1843, 1, 1, 0, 30, tzinfo=tz).timestamp()
+    monkeypatch.setattr("time.time", lambda: now)
     monkeypatch.setattr("time.timezone", -28800)
     monkeypatch.setattr("os.getpid", lambda: 42)
     mock_logger = mock.Mock()
@@ -165,6 +139,156 @@ def test_logger_no_transport() -> None:
     mock_logger.info.assert_called_with("-", extra={"remote_address": "-"})
 
 
+def test_logger_disabled() -> None:
+    logger = logging.getLogger("aiohttp.test.access_disabled")
+    logger.setLevel(logging.WARNING)
+    access_logger = AccessLogger(logger, "%D")
+    with mock.patch.object(logger, "exception") as exception:
+        # the line is not formatted at all
+        access_logger.log(None, None, "invalid")
+    assert not exception.called
+
+
+@pytest.mark.parametrize(
+    "fmt,uses_extra",
+    [
+        (None, False),
+        ("%(asctime)s %(message)s", False),
+        ("%(remote_address)s %(message)s", True),
+    ],
+)
+def test_logger_extra_only_if_used(fmt: Any, uses_extra: Any) -> None:
+    logger = logging.getLogger("aiohttp.test.access_extra")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    records = []
+    try:
+        access_logger = AccessLogger(logger, "%a %s")
+        request = mock.Mock(remote="127.0.0.2")
+        response = mock.Mock(status=200)
+        with mock.patch.object(handler, "emit", side_effect=records.append):
+            access_logger.log(request, response, 0.0)
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+    assert records[0].getMessage() == "127.0.0.2 200"
+    assert hasattr(records[0], "remote_address") is uses_extra
+
+
+def test_logger_extra_with_filter() -> None:
+    logger = logging.getLogger("aiohttp.test.access_filter")
+    logger.setLevel(logging.INFO)
+    records = []
+
+    def log_filter(record: logging.LogRecord) -> bool:
+        records.append(record)
+        return False
+
+    logger.addFilter(log_filter)
+    try:
+        AccessLogger(logger, "%s").log(None, mock.Mock(status=200), 0.0)
+    finally:
+        logger.removeFilter(log_filter)
+    assert records[0].response_status == 200
+
+
+def test_start_time_cached(monkeypatch: Any) -> None:
+    monkeypatch.setattr("time.time", lambda: 1600000000.5)
+    first = web_log._start_time(0.2)
+    with mock.patch("datetime.datetime") as dt:
+        assert web_log._start_time(0.3) is first
+    assert not dt.fromtimestamp.called
+    assert web_log._start_time(0.6) != first
+
+
+@pytest.mark.parametrize(
+    "status,random_value,logged",
+    [
+        (200, 0.005, True),
+        (204, 0.5, False),
+        (404, 0.99, True),
+        (500, 0.5, True),
+        (503, 0.99, False),
+    ],
+)
+def test_logger_sample_rates(status: Any, random_value: Any, logged: Any) -> None:
+    class SampledLogger(AccessLogger):
+        sample_rates = {2: 0.01, 5: 0.9}
+
+    mock_logger = mock.Mock()
+    access_logger = SampledLogger(mock_logger, "%s")
+    with mock.patch("random.random", return_value=random_value):
+        access_logger.log(None, mock.Mock(status=status), 0.0)
+    assert mock_logger.info.called is logged
+
+
+def test_logger_sample_rates_argument() -> None:
+    mock_logger = mock.Mock()
+    access_logger = AccessLogger(mock_logger, "%s", sample_rates={2: 0.0})
+    assert access_logger.sample_rates == {2: 0.0}
+    assert AccessLogger.sample_rates is None
+    access_logger.log(None, mock.Mock(status=200), 0.0)
+    assert not mock_logger.info.called
+    access_logger.log(None, mock.Mock(status=404), 0.0)
+    assert mock_logger.info.called
+
+
+def test_logger_sampled_out_not_formatted() -> None:
+    class SampledLogger(AccessLogger):
+        sample_rates = {2: 0.0}
+
+    mock_logger = mock.Mock()
+    access_logger = SampledLogger(mock_logger, "%D")
+    access_logger.log(None, mock.Mock(status=200), "invalid")
+    assert not mock_logger.info.called
+    assert not mock_logger.exception.called
+
+
+def test_json_logger() -> None:
+    mock_logger = mock.Mock()
+    access_logger = web.JSONAccessLogger(
+        mock_logger, '%a "%r" %s %b %Tf %{User-Agent}i %{X-Id}o'
+    )
+    request = mock.Mock(
+        headers={"User-Agent": 'Mock "1.0" \u00e9'},
+        method="GET",
+        path_qs="/path",
+        version=aiohttp.HttpVersion(1, 1),
+        remote="127.0.0.2",
+    )
+    response = mock.Mock(headers={"X-Id": 42}, body_length=42, status=200)
+    access_logger.log(request, response, 0.5)
+    assert not mock_logger.exception.called
+    message = mock_logger.info.call_args[0][0]
+    expected = {
+        "remote_address": "127.0.0.2",
+        "first_request_line": "GET /path HTTP/1.1",
+        "response_status": 200,
+        "response_size": 42,
+        "request_time_frac": "0.500000",
+        "request_header": {"User-Agent": 'Mock "1.0" \u00e9'},
+        "response_header": {"X-Id": 42},
+    }
+    assert json.loads(message) == expected
+    assert message.isascii()
+    assert mock_logger.info.call_args[1]["extra"]["remote_address"] == "127.0.0.2"
+
+
+def test_json_logger_format_cache() -> None:
+    access_logger = AccessLogger(mock.Mock(), "%s")
+    json_logger = web.JSONAccessLogger(mock.Mock(), "%s")
+    assert access_logger._format_line is not json_logger._format_line
+    response = mock.Mock(status=200)
+    json_logger.log(None, response, 0.0)
+    json_logger.logger.info.assert_called_with(
+        '{"response_status": 200}', extra={"response_status": 200}
+    )
+
+
 def test_logger_abc() -> None:
     class Logger(AbstractAccessLogger):
         def log(self, request, response, time):
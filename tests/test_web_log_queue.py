@@ -0,0 +1,241 @@
+import logging
+import threading
+from typing import Any, List
+
+import pytest
+
+from aiohttp import web
+from aiohttp.web_log_queue import _queued
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+        self.threads: List[threading.Thread] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.append(threading.current_thread())
+
+
+class BlockingHandler(ListHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.unblock = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.unblock.wait()
+        super().emit(record)
+
+
+@pytest.fixture
+def logger() -> Any:
+    logger = logging.getLogger("aiohttp.test.access_queue")
+    logger.setLevel(logging.INFO)
+    yield logger
+    logger.handlers = []
+    logger.propagate = True
+
+
+def test_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        web.AccessLogQueue(maxsize=0)
+
+
+def test_invalid_batch_size() -> None:
+    with pytest.raises(ValueError):
+        web.AccessLogQueue(batch_size=0)
+
+
+def test_start_stop(logger: Any) -> None:
+    handler = ListHandler()
+    logger.addHandler(handler)
+    log_queue = web.AccessLogQueue(logger)
+    assert log_queue.logger is logger
+    assert not log_queue.running
+
+    assert _queued(logger) is logger
+
+    log_queue.start()
+    assert log_queue.running
+    # the logging configuration is not changed
+    assert logger.handlers == [handler]
+    assert logger.propagate
+    with pytest.raises(RuntimeError):
+        log_queue.start()
+
+    queued = _queued(logger)
+    assert queued is not logger
+    queued.info("message %s", 1)
+    log_queue.stop()
+    assert not log_queue.running
+    assert _queued(logger) is logger
+    # idempotent
+    log_queue.stop()
+
+    assert [r.getMessage() for r in handler.records] == ["message 1"]
+    assert handler.threads[0] is not threading.current_thread()
+    assert log_queue.queued == log_queue.written == 1
+    assert log_queue.dropped == 0
+
+
+def test_parent_handlers(logger: Any) -> None:
+    handler = ListHandler()
+    parent = logging.getLogger("aiohttp.test")
+    parent.addHandler(handler)
+    try:
+        log_queue = web.AccessLogQueue(logger)
+        log_queue.start()
+        _queued(logger).info("message")
+        log_queue.stop()
+    finally:
+        parent.removeHandler(handler)
+    assert len(handler.records) == 1
+
+
+def test_handlers_added_after_start(logger: Any) -> None:
+    log_queue = web.AccessLogQueue(logger)
+    log_queue.start()
+    handler = ListHandler()
+    root = logging.getLogger()
+    root.addHandler(handler)
+    try:
+        _queued(logger).info("message")
+        log_queue.stop()
+    finally:
+        root.removeHandler(handler)
+    assert [r.getMessage() for r in handler.records] == ["message"]
+
+
+def test_logger_filters_and_level(logger: Any) -> None:
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.addFilter(lambda record: record.getMessage() != "filtered")
+    log_queue = web.AccessLogQueue(logger)
+    log_queue.start()
+    queued = _queued(logger)
+    try:
+        queued.info("filtered")
+        queued.info("passed")
+        logger.setLevel(logging.WARNING)
+        queued.info("below level")
+        log_queue.stop()
+    finally:
+        logger.filters = []
+    assert [r.getMessage() for r in handler.records] == ["passed"]
+    assert log_queue.queued == 2
+
+
+def test_log_after_stop(logger: Any) -> None:
+    handler = ListHandler()
+    logger.addHandler(handler)
+    log_queue = web.AccessLogQueue(logger)
+    log_queue.start()
+    queued = _queued(logger)
+    log_queue.stop()
+    # an access logger of a connection opened before stop()
+    queued.info("message")
+    assert [r.getMessage() for r in handler.records] == ["message"]
+    assert handler.threads == [threading.current_thread()]
+    assert log_queue.queued == 0
+
+
+def test_one_queue_per_logger(logger: Any) -> None:
+    log_queue = web.AccessLogQueue(logger)
+    log_queue.start()
+    try:
+        with pytest.raises(RuntimeError):
+            web.AccessLogQueue(logger).start()
+    finally:
+        log_queue.stop()
+
+
+def test_handler_level(logger: Any) -> None:
+    handler = ListHandler()
+    handler.setLevel(logging.WARNING)
+    logger.addHandler(handler)
+    log_queue = web.AccessLogQueue(logger)
+    log_queue.start()
+    _queued(logger).info("info")
+    _queued(logger).warning("warning")
+    log_queue.stop()
+    assert [r.getMessage() for r in handler.records] == ["warning"]
+    assert log_queue.written == 2
+
+
+def test_drop_on_overflow(logger: Any) -> None:
+    handler = BlockingHandler()
+    logger.addHandler(handler)
+    log_queue = web.AccessLogQueue(logger, maxsize=2, batch_size=1)
+    log_queue.start()
+    queued = _queued(logger)
+    try:
+        queued.info("first")
+        # the writer thread is blocked in the handler, the queue is empty
+        assert handler.entered.wait(5)
+        for i in range(5):
+            queued.info("queued %d", i)
+        assert log_queue.pending == 2
+    finally:
+        handler.unblock.set()
+        log_queue.stop()
+
+    assert log_queue.queued == 3
+    assert log_queue.dropped == 3
+    assert log_queue.written == 3
+    assert log_queue.batches == 3
+    assert [r.getMessage() for r in handler.records] == [
+        "first",
+        "queued 0",
+        "queued 1",
+    ]
+
+
+def test_batches(logger: Any) -> None:
+    handler = BlockingHandler()
+    logger.addHandler(handler)
+    log_queue = web.AccessLogQueue(logger, batch_size=10)
+    log_queue.start()
+    queued = _queued(logger)
+    try:
+        queued.info("first")
+        assert handler.entered.wait(5)
+        for i in range(25):
+            queued.info("queued %d", i)
+    finally:
+        handler.unblock.set()
+        log_queue.stop()
+    assert log_queue.written == 26
+    # 1 + 10 + 10 + 5
+    assert log_queue.batches == 4
+
+
+async def test_runner_access_log_queue(
+    aiohttp_server: Any, aiohttp_client: Any, logger: Any
+) -> None:
+    handler = ListHandler()
+    logger.addHandler(handler)
+
+    async def index(request: web.Request) -> web.Response:
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/", index)
+    log_queue = web.AccessLogQueue(logger)
+    server = await aiohttp_server(
+        app, access_log=logger, access_log_queue=log_queue, access_log_format="%r %s"
+    )
+    assert server.runner.access_log_queue is log_queue
+    assert log_queue.running
+    client = await aiohttp_client(server)
+
+    resp = await client.get("/")
+    assert resp.status == 200
+    await client.close()
+
+    assert not log_queue.running
+    assert [r.getMessage() for r in handler.records] == ["GET / HTTP/1.1 200"]
+    assert handler.threads[0] is not threading.current_thread()
@@ -0,0 +1,138 @@
+import asyncio
+import time
+from typing import Any, List
+from unittest import mock
+
+import pytest
+
+from aiohttp import web
+
+
+def test_invalid_interval() -> None:
+    with pytest.raises(ValueError):
+        web.LoopLagMonitor(interval=0)
+
+
+def test_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        web.LoopLagMonitor(threshold=-1)
+
+
+async def test_start_stop() -> None:
+    monitor = web.LoopLagMonitor(interval=0.01)
+    assert not monitor.running
+    monitor.start()
+    assert monitor.running
+    with pytest.raises(RuntimeError):
+        monitor.start()
+    monitor.stop()
+    assert not monitor.running
+    # idempotent
+    monitor.stop()
+
+
+async def test_lag_is_measured() -> None:
+    metrics = web.ServerMetrics()
+    monitor = web.LoopLagMonitor(interval=0.01, threshold=10, metrics=metrics)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+    finally:
+        monitor.stop()
+    assert monitor.max_lag >= 0.03
+    assert metrics.loop_lag == monitor.lag
+    assert monitor.stalls == 0
+    assert "aiohttp_loop_lag_seconds" in metrics.render()
+
+
+async def test_stall_reported_with_route(
+    aiohttp_server: Any, aiohttp_client: Any
+) -> None:
+    stalls: List[web.LoopStall] = []
+    logger = mock.Mock()
+
+    def blocking_function() -> None:
+        time.sleep(0.4)
+
+    async def handler(request: web.Request) -> web.Response:
+        blocking_function()
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/block/{name}", handler)
+    monitor = web.LoopLagMonitor(
+        interval=0.01, threshold=0.1, logger=logger, on_stall=stalls.append
+    )
+    server = await aiohttp_server(app, loop_monitor=monitor)
+    client = await aiohttp_client(server)
+    assert monitor.running
+
+    resp = await client.get("/block/x")
+    assert resp.status == 200
+    await asyncio.sleep(0.05)
+
+    assert monitor.stalls >= 1
+    stall = stalls[0]
+    assert stall.lag >= 0.1
+    assert stall.route == "GET /block/{name}"
+    assert any("blocking_function" in line for line in stall.stack)
+    logger.warning.assert_called()
+
+    await client.close()
+    assert not monitor.running
+
+
+async def test_stall_route_of_blocking_request(
+    aiohttp_server: Any, aiohttp_client: Any
+) -> None:
+    stalls: List[web.LoopStall] = []
+    event = asyncio.Event()
+
+    async def waiting(request: web.Request) -> web.Response:
+        await event.wait()
+        return web.Response()
+
+    async def blocking(request: web.Request) -> web.Response:
+        time.sleep(0.4)
+        event.set()
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/waiting", waiting)
+    app.router.add_get("/blocking", blocking)
+    monitor = web.LoopLagMonitor(
+        interval=0.01, threshold=0.1, logger=mock.Mock(), on_stall=stalls.append
+    )
+    server = await aiohttp_server(app, loop_monitor=monitor)
+    client = await aiohttp_client(server)
+
+    task = asyncio.ensure_future(client.get("/waiting"))
+    await asyncio.sleep(0.05)
+    resp = await client.get("/blocking")
+    assert resp.status == 200
+    resp = await task
+    assert resp.status == 200
+    await asyncio.sleep(0.05)
+
+    assert stalls
+    assert stalls[0].route == "GET /blocking"
+
+    await client.close()
+
+
+async def test_stall_outside_request() -> None:
+    stalls: List[web.LoopStall] = []
+    monitor = web.LoopLagMonitor(
+        interval=0.01, threshold=0.1, logger=mock.Mock(), on_stall=stalls.append
+    )
+    monitor.start()
+    try:
+        time.sleep(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+    assert stalls
+    assert stalls[0].route is None
+    assert stalls[0].stack
@@ -0,0 +1,128 @@
+# type: ignore
+import asyncio
+from typing import Any
+
+import pytest
+
+from aiohttp import web
+from aiohttp.web_metrics import ServerMetrics
+
+
+def test_invalid_buckets() -> None:
+    with pytest.raises(ValueError):
+        ServerMetrics(buckets=())
+    with pytest.raises(ValueError):
+        ServerMetrics(buckets=(1, 0.5))
+    with pytest.raises(ValueError):
+        ServerMetrics(buckets=(1, 1))
+
+
+def test_render_empty() -> None:
+    metrics = ServerMetrics(buckets=(0.1, 1))
+    text = metrics.render()
+    assert "# TYPE aiohttp_requests_total counter\n" in text
+    assert "# TYPE aiohttp_request_duration_seconds histogram\n" in text
+    assert "aiohttp_requests_in_flight 0\n" in text
+    assert "aiohttp_request_bytes_total 0\n" in text
+    assert "aiohttp_parse_errors_total 0\n" in text
+    assert "aiohttp_handler_exceptions_total 0\n" in text
+    assert "_bucket" not in text
+    assert metrics.requests == 0
+
+
+def test_namespace() -> None:
+    metrics = ServerMetrics(namespace="myapp")
+    assert "myapp_requests_in_flight 0\n" in metrics.render()
+
+
+async def test_routes(aiohttp_client: Any, aiohttp_server: Any) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    async def fail(request):
+        raise RuntimeError("boom")
+
+    metrics = ServerMetrics(buckets=(10, 20))
+    app = web.Application()
+    app.router.add_get("/user/{name}", handler)
+    app.router.add_get("/fail", fail)
+    app.router.add_get("/metrics", metrics.handler)
+    server = await aiohttp_server(app, metrics=metrics)
+    client = await aiohttp_client(server)
+
+    for name in ("a", "b"):
+        resp = await client.get(f"/user/{name}")
+        assert resp.status == 200
+        await resp.release()
+    resp = await client.post("/user/a", data=b"12345")
+    assert resp.status == 405
+    await resp.release()
+    resp = await client.get("/not-found")
+    assert resp.status == 404
+    await resp.release()
+    resp = await client.get("/fail")
+    assert resp.status == 500
+    await resp.release()
+
+    resp = await client.get("/metrics")
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "text/plain; version=0.0.4; charset=utf-8"
+    text = await resp.text()
+
+    assert (
+        'aiohttp_requests_total{method="GET",route="/user/{name}",status="2xx"} 2\n'
+        in text
+    )
+    assert 'aiohttp_requests_total{method="",route="",status="4xx"} 2\n' in text
+    assert 'aiohttp_requests_total{method="GET",route="/fail",status="5xx"} 1\n' in text
+    assert (
+        'aiohttp_request_duration_seconds_bucket{method="GET",route="/user/{name}",'
+        'le="10.0"} 2\n' in text
+    )
+    assert (
+        'aiohttp_request_duration_seconds_bucket{method="GET",route="/user/{name}",'
+        'le="+Inf"} 2\n' in text
+    )
+    assert (
+        'aiohttp_request_duration_seconds_count{method="GET",route="/user/{name}"} 2\n'
+        in text
+    )
+    assert "aiohttp_requests_in_flight 1\n" in text
+    assert "aiohttp_handler_exceptions_total 1\n" in text
+    assert metrics.handler_exceptions == 1
+    assert metrics.requests >= 5
+    assert metrics.bytes_sent > 0
+    assert metrics.keepalive_reused >= 4
+
+
+async def test_bytes_received(aiohttp_client: Any, aiohttp_server: Any) -> None:
+    async def handler(request):
+        await request.read()
+        return web.Response()
+
+    metrics = ServerMetrics()
+    app = web.Application()
+    app.router.add_post("/", handler)
+    server = await aiohttp_server(app, metrics=metrics)
+    client = await aiohttp_client(server)
+
+    resp = await client.post("/", data=b"x" * 100)
+    assert resp.status == 200
+    await resp.release()
+    assert metrics.bytes_received == 100
+    assert metrics.inflight == 0
+
+
+async def test_parse_errors(aiohttp_raw_server: Any) -> None:
+    async def handler(request):
+        return web.Response()
+
+    metrics = ServerMetrics()
+    server = await aiohttp_raw_server(handler, metrics=metrics)
+
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    writer.write(b"GARBAGE\r\n\r\n")
+    data = await reader.read()
+    assert b" 400 Bad Request\r\n" in data
+    writer.close()
+    assert metrics.parse_errors == 1
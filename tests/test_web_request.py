@@ -1,5 +1,6 @@
 # type: ignore
 import asyncio
+import json
 import socket
 import weakref
 from collections.abc import MutableMapping
@@ -497,6 +498,26 @@ def test_url_url() -> None:
     assert URL("http://example.com/path") == req.url
 
 
+def test_lazy_headers() -> None:
+    req = make_mocked_request(
+        "GET", "/path", headers=[("Expect", "100-continue"), ("X-A", "1"), ("x-a", "2")]
+    )
+    lazy_req = web.Request(
+        req._message._replace(headers=None),
+        req._payload,
+        req._protocol,
+        req._payload_writer,
+        req._task,
+        req._loop,
+    )
+    assert lazy_req._peek_header("EXPECT") == "100-continue"
+    assert lazy_req._peek_header("X-B") is None
+    assert lazy_req._headers is None
+    assert lazy_req.headers.getall("X-A") == ["1", "2"]
+    assert lazy_req.headers is lazy_req._headers
+    assert lazy_req._peek_header("x-a") == "1"
+
+
 def test_clone() -> None:
     req = make_mocked_request("GET", "/path")
     req2 = req.clone()
@@ -504,6 +525,12 @@ def test_clone() -> None:
     assert req2.rel_url == URL("/path")
 
 
+def test_clone_upload_spool_budget() -> None:
+    req = make_mocked_request("GET", "/path")
+    req2 = req.clone()
+    assert req2._upload_spool_budget is req._upload_spool_budget
+
+
 def test_clone_client_max_size() -> None:
     req = make_mocked_request("GET", "/path", client_max_size=1024)
     req2 = req.clone()
@@ -779,6 +806,34 @@ async def test_json(aiohttp_client: Any) -> None:
         assert 200 == resp.status
 
 
+async def test_json_loads_bytes(aiohttp_client: Any) -> None:
+    bodies = []
+
+    def loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    async def handler(request):
+        body_json = await request.json(loads=loads, loads_bytes=True)
+        assert body_json == {"some": "данные"}
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    client = await aiohttp_client(app)
+
+    json_data = {"some": "данные"}
+    async with client.post("/", json=json_data) as resp:
+        assert 200 == resp.status
+    assert bodies == [json.dumps(json_data).encode()]
+
+    headers = {"Content-Type": "application/json; charset=cp1251"}
+    data = json.dumps(json_data, ensure_ascii=False).encode("cp1251")
+    async with client.post("/", data=data, headers=headers) as resp:
+        assert 200 == resp.status
+    assert bodies[1] == json.dumps(json_data, ensure_ascii=False)
+
+
 async def test_json_invalid_content_type(aiohttp_client: Any) -> None:
     async def handler(request):
         body_text = await request.text()
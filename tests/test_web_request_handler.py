@@ -61,3 +61,37 @@ async def test_shutdown_timeout() -> None:
     manager.connection_lost(handler, None)
     assert manager.connections == []
     handler.shutdown.assert_called_with(0.1)
+
+
+async def test_pipelining_pause_outlives_payload_resume() -> None:
+    manager = web.Server(serve, max_pipelined_requests=1)
+    handler = manager()
+    transport = mock.Mock()
+    handler.transport = transport
+
+    handler.data_received(b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n")
+    assert transport.pause_reading.call_count == 1
+
+    # payload flow control pauses and resumes on its own
+    handler.pause_reading()
+    handler.resume_reading()
+    assert transport.pause_reading.call_count == 1
+    assert not transport.resume_reading.called
+
+
+async def test_payload_pause_outlives_pipelining_resume() -> None:
+    manager = web.Server(serve, max_pipelined_requests=1)
+    handler = manager()
+    transport = mock.Mock()
+    handler.transport = transport
+
+    handler.pause_reading()
+    handler.data_received(b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n")
+    assert transport.pause_reading.call_count == 1
+
+    handler._pipelining_paused = False
+    handler._update_reading()
+    assert not transport.resume_reading.called
+
+    handler.resume_reading()
+    transport.resume_reading.assert_called_once_with()
@@ -1,5 +1,6 @@
 # type: ignore
 import asyncio
+import time
 from typing import Any
 from unittest import mock
 
@@ -185,3 +186,240 @@ async def test_raw_server_html_exception_debug(
     )
 
     logger.exception.assert_called_with("Error handling request", exc_info=exc)
+
+
+async def test_raw_server_max_inflight_requests(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    event = asyncio.Event()
+
+    async def handler(request):
+        await event.wait()
+        return web.Response(text="OK")
+
+    server = await aiohttp_raw_server(handler, max_inflight_requests=1, retry_after=3)
+    cli = await aiohttp_client(server)
+
+    task = asyncio.ensure_future(cli.get("/"))
+    while server.runner.server.inflight_requests == 0:
+        await asyncio.sleep(0.01)
+
+    resp = await cli.get("/")
+    assert resp.status == 503
+    assert resp.headers["Retry-After"] == "3"
+    assert resp.content_type == "text/plain"
+    assert await resp.read() == server.runner.server._overload_body
+    assert server.runner.server.rejected_requests == 1
+    await resp.release()
+
+    event.set()
+    resp = await task
+    assert resp.status == 200
+    assert await resp.text() == "OK"
+    assert server.runner.server.inflight_requests == 0
+
+
+async def test_raw_server_max_connections_reject(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    server = await aiohttp_raw_server(handler, max_connections=1)
+    cli = await aiohttp_client(server)
+
+    reader1, writer1 = await asyncio.open_connection(server.host, server.port)
+    while len(server.runner.server.connections) == 0:
+        await asyncio.sleep(0.01)
+
+    reader2, writer2 = await asyncio.open_connection(server.host, server.port)
+    data = await reader2.read()
+    assert data.startswith(b"HTTP/1.1 503 Service Unavailable\r\n")
+    assert b"\r\nRetry-After: 1\r\n" in data
+    assert server.runner.server.rejected_connections == 1
+
+    writer1.close()
+    writer2.close()
+    while server.runner.server.connections:
+        await asyncio.sleep(0.01)
+
+    resp = await cli.get("/")
+    assert resp.status == 200
+
+
+async def test_raw_server_max_connections_pause(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    server = await aiohttp_raw_server(
+        handler, max_connections=1, pause_on_max_connections=True
+    )
+
+    reader1, writer1 = await asyncio.open_connection(server.host, server.port)
+    while len(server.runner.server.connections) == 0:
+        await asyncio.sleep(0.01)
+
+    reader2, writer2 = await asyncio.open_connection(server.host, server.port)
+    writer2.write(b"GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+    while server.runner.server.paused_connections == 0:
+        await asyncio.sleep(0.01)
+    assert server.runner.server.requests_count == 0
+
+    writer1.close()
+    data = await reader2.read()
+    assert data.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert server.runner.server.paused_connections == 0
+    writer2.close()
+
+
+def test_server_invalid_limits(loop: Any) -> None:
+    async def make(**kwargs):
+        return web.Server(None, **kwargs)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(make(max_connections=0))
+    with pytest.raises(ValueError):
+        loop.run_until_complete(make(max_inflight_requests=0))
+
+
+async def test_raw_server_handler_timeout_cancels_handler(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    cancelled = False
+
+    async def handler(request):
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return web.Response(text="OK")
+
+    logger = mock.Mock()
+    server = await aiohttp_raw_server(handler, logger=logger, handler_timeout=0.05)
+    cli = await aiohttp_client(server)
+    resp = await cli.get("/")
+    assert resp.status == 504
+    await resp.release()
+    assert cancelled
+
+
+async def test_raw_server_handler_timeout_not_expired(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    server = await aiohttp_raw_server(handler, handler_timeout=10)
+    cli = await aiohttp_client(server)
+    for i in range(3):
+        resp = await cli.get("/")
+        assert resp.status == 200
+        assert await resp.text() == "OK"
+
+
+async def test_raw_server_handler_timeout_fires_after_handler(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    protocols = []
+
+    class Response(web.Response):
+        async def prepare(self, request):
+            await asyncio.sleep(0)
+            return await super().prepare(request)
+
+    async def handler(request):
+        # the timer fires after the handler has returned
+        # but while the response is still being sent
+        protocols.append(request.protocol)
+        task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        loop.call_soon(request.protocol._on_handler_timeout, task)
+        return Response(text="OK")
+
+    server = await aiohttp_raw_server(handler, handler_timeout=10)
+    cli = await aiohttp_client(server)
+    for i in range(2):
+        resp = await cli.get("/")
+        assert resp.status == 200
+        assert await resp.text() == "OK"
+    # the keep-alive connection survived the late timer
+    assert protocols[0] is protocols[1]
+
+
+@pytest.mark.skipif(
+    not hasattr(asyncio.Task, "uncancel"), reason="Task.uncancel() is required"
+)
+async def test_raw_server_handler_timeout_swallowed(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    class Response(web.Response):
+        async def prepare(self, request):
+            cancelling = asyncio.current_task().cancelling()
+            self.headers["X-Cancelling"] = str(cancelling)
+            return await super().prepare(request)
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            pass
+        return Response(text="swallowed")
+
+    server = await aiohttp_raw_server(handler, handler_timeout=0.05)
+    cli = await aiohttp_client(server)
+    resp = await cli.get("/")
+    assert resp.status == 200
+    assert await resp.text() == "swallowed"
+    # the cancellation request doesn't leak past the handler
+    assert resp.headers["X-Cancelling"] == "0"
+
+
+async def test_raw_server_deadline_header_expired(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    handler = mock.Mock()
+
+    logger = mock.Mock()
+    server = await aiohttp_raw_server(
+        handler, logger=logger, deadline_header="X-Request-Deadline"
+    )
+    cli = await aiohttp_client(server)
+    resp = await cli.get("/", headers={"X-Request-Deadline": str(time.time() - 1)})
+    assert resp.status == 503
+    await resp.release()
+    assert not handler.called
+
+
+async def test_raw_server_deadline_header_cancels_handler(
+    aiohttp_raw_server: Any, aiohttp_client: Any
+) -> None:
+    async def handler(request):
+        await asyncio.sleep(10)
+        return web.Response(text="OK")
+
+    logger = mock.Mock()
+    server = await aiohttp_raw_server(
+        handler, logger=logger, handler_timeout=10, deadline_header="X-Deadline"
+    )
+    cli = await aiohttp_client(server)
+    resp = await cli.get("/", headers={"X-Deadline": str(time.time() + 0.05)})
+    assert resp.status == 504
+    await resp.release()
+
+
+@pytest.mark.parametrize("value", ["garbage", "nan", "inf"])
+async def test_raw_server_deadline_header_invalid(
+    aiohttp_raw_server: Any, aiohttp_client: Any, value: str
+) -> None:
+    async def handler(request):
+        return web.Response(text="OK")
+
+    server = await aiohttp_raw_server(handler, deadline_header="X-Deadline")
+    cli = await aiohttp_client(server)
+    resp = await cli.get("/", headers={"X-Deadline": value})
+    assert resp.status == 200
+    await resp.release()
@@ -0,0 +1,135 @@
+import asyncio
+import socket
+import threading
+from typing import Any
+
+import pytest
+
+import aiohttp
+from aiohttp import web
+from aiohttp.web_limiter import AIMDLimiter
+from aiohttp.web_metrics import ServerMetrics
+from aiohttp.web_workers import (
+    HAS_REUSE_PORT,
+    LoopThread,
+    WorkerSupervisor,
+    _ThreadRunner,
+    bind_same,
+    bind_tcp,
+    clone_listening,
+)
+
+
+def test_supervisor_invalid_workers() -> None:
+    with pytest.raises(ValueError):
+        WorkerSupervisor(lambda index: None, 0)
+
+
+@pytest.mark.skipif(not HAS_REUSE_PORT, reason="SO_REUSEPORT is not available")
+def test_bind_same() -> None:
+    sockets = bind_tcp("127.0.0.1", 0, reuse_port=True)
+    try:
+        assert len(sockets) == 1
+        same = bind_same(sockets)
+        try:
+            assert same[0].getsockname() == sockets[0].getsockname()
+        finally:
+            same[0].close()
+    finally:
+        sockets[0].close()
+
+
+def test_clone_listening_shared() -> None:
+    sockets = bind_tcp("127.0.0.1", 0, reuse_port=False)
+    clones = clone_listening(sockets)
+    try:
+        assert clones[0].fileno() != sockets[0].fileno()
+        assert clones[0].getsockname() == sockets[0].getsockname()
+    finally:
+        for sock in sockets + clones:
+            sock.close()
+
+
+async def test_loop_thread_not_setup_runner() -> None:
+    runner = web.AppRunner(web.Application())
+    with pytest.raises(RuntimeError):
+        LoopThread(runner, [])
+
+
+async def test_loop_thread_cleanup_ctx() -> None:
+    async def ctx(app: web.Application) -> Any:
+        yield
+
+    subapp = web.Application()
+    subapp.cleanup_ctx.append(ctx)
+    app = web.Application()
+    app.add_subapp("/sub", subapp)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    with pytest.raises(RuntimeError):
+        LoopThread(runner, [])
+    await runner.cleanup()
+
+
+async def test_loop_thread_metrics() -> None:
+    runner = web.AppRunner(web.Application(), metrics=ServerMetrics())
+    await runner.setup()
+    with pytest.raises(RuntimeError):
+        LoopThread(runner, [])
+    await runner.cleanup()
+
+
+async def test_thread_runner_own_limiter() -> None:
+    limiter = AIMDLimiter(initial_limit=5, max_limit=10)
+    runner = web.AppRunner(web.Application(), limiter=limiter)
+    thread_runner = _ThreadRunner(runner)
+    copy = thread_runner._kwargs["limiter"]
+    assert copy is not limiter
+    assert copy.limit == 5
+
+
+async def test_loop_thread(aiohttp_unused_port: Any) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text=threading.current_thread().name)
+
+    cleanups = []
+
+    async def on_cleanup(app: web.Application) -> None:
+        cleanups.append(threading.current_thread())
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    app.on_cleanup.append(on_cleanup)
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    sockets = bind_tcp("127.0.0.1", aiohttp_unused_port())
+    port = sockets[0].getsockname()[1]
+    loop_thread = LoopThread(runner, sockets)
+    loop_thread.start()
+    with pytest.raises(RuntimeError):
+        loop_thread.start()
+    assert loop_thread.loop is not asyncio.get_running_loop()
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"http://127.0.0.1:{port}/") as resp:
+            assert resp.status == 200
+            assert await resp.text() == "aiohttp-loop"
+
+    await loop_thread.stop()
+    assert sockets[0].fileno() == -1
+    # the application is cleaned up by the main runner
+    assert cleanups == []
+    await runner.cleanup()
+    assert cleanups == [threading.current_thread()]
+
+
+async def test_loop_thread_start_error() -> None:
+    runner = web.AppRunner(web.Application())
+    await runner.setup()
+    sock = socket.socket()
+    sock.close()
+    loop_thread = LoopThread(runner, [sock])
+    with pytest.raises(OSError):
+        loop_thread.start()
+    await runner.cleanup()
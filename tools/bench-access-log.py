@@ -0,0 +1,55 @@
+"""Cost of formatting an access log line.
+
+AccessLogger.log() is called with a mocked request and response for
+the default log format, the logger has a single stream handler writing
+to an in-memory buffer. Time per call is printed in microseconds.
+
+    python tools/bench-access-log.py [-n 200000] [--extra]
+"""
+import argparse
+import io
+import logging
+import timeit
+from unittest import mock
+
+from aiohttp import HttpVersion
+from aiohttp.web_log import AccessLogger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="log calls")
+    parser.add_argument(
+        "--extra",
+        action="store_true",
+        help="use a formatter referring to extra record attributes",
+    )
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench.access")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = logging.StreamHandler(io.StringIO())
+    if args.extra:
+        handler.setFormatter(logging.Formatter("%(remote_address)s %(message)s"))
+    logger.addHandler(handler)
+
+    request = mock.Mock(
+        headers={"Referer": "http://example.com/", "User-Agent": "bench/1.0"},
+        method="GET",
+        path_qs="/path?q=1",
+        version=HttpVersion(1, 1),
+        remote="127.0.0.1",
+    )
+    response = mock.Mock(headers={}, body_length=1234, status=200)
+    access_logger = AccessLogger(logger, AccessLogger.LOG_FORMAT)
+
+    def log():
+        access_logger.log(request, response, 0.0123)
+
+    best = min(timeit.repeat(log, number=args.n, repeat=5))
+    print(f"{best / args.n * 1e6:.2f} us per access log line")
+
+
+if __name__ == "__main__":
+    main()
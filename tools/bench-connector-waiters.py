@@ -0,0 +1,81 @@
+"""Cost of waking connection waiters in BaseConnector.
+
+REQUESTS requests to HOSTS distinct hosts go through a connector with
+limit=LIMIT, so nearly all of them wait in the connector queue. The
+connections are fake and are released right after they are acquired,
+the time per connect/release pair is printed.
+
+    python tools/bench-connector-waiters.py [--hosts 10000] [--limit 100]
+"""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from yarl import URL
+
+import aiohttp
+from aiohttp.client_reqrep import ConnectionKey
+
+
+class Protocol:
+    should_close = True
+    transport = None
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class Connector(aiohttp.BaseConnector):
+    async def _create_connection(self, req, traces, timeout):
+        await asyncio.sleep(0)
+        return Protocol()
+
+
+async def run(hosts, limit, limit_per_host, requests):
+    loop = asyncio.get_running_loop()
+    connector = Connector(limit=limit, limit_per_host=limit_per_host)
+    timeout = aiohttp.ClientTimeout()
+    reqs = []
+    for i in range(hosts):
+        key = ConnectionKey(f"host{i}.example.com", 80, False, True, None, None, None)
+        url = URL(f"http://host{i}.example.com/")
+        reqs.append(SimpleNamespace(connection_key=key, url=url))
+
+    async def one(req):
+        conn = await connector.connect(req, [], timeout)
+        await asyncio.sleep(0)
+        conn.release()
+
+    start = loop.time()
+    await asyncio.gather(*(one(reqs[i % hosts]) for i in range(requests)))
+    elapsed = loop.time() - start
+    await connector.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=10000, help="distinct hosts")
+    parser.add_argument("--limit", type=int, default=100, help="connector limit")
+    parser.add_argument(
+        "--limit-per-host", type=int, default=0, help="connector limit_per_host"
+    )
+    parser.add_argument("-n", type=int, default=50000, help="requests")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    elapsed = asyncio.run(run(args.hosts, args.limit, args.limit_per_host, args.n))
+    print(
+        f"{args.n} requests, {args.hosts} hosts, limit={args.limit}, "
+        f"limit_per_host={args.limit_per_host}"
+    )
+    print(f"{elapsed / args.n * 1e6:.1f} us per request")
+    print(f"total {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Throughput of reading multipart/form-data bodies.
+
+Every case feeds MULTIPART body of TOTAL bytes into StreamReader in
+network sized pieces and reads all the parts with
+BodyPartReader.read_chunk(), the result is printed in MB/s.
+
+    python tools/bench-multipart.py [--skip-huge]
+"""
+import argparse
+import asyncio
+import time
+from unittest import mock
+
+from aiohttp import MultipartReader
+from aiohttp.streams import StreamReader
+
+KiB = 1024
+MiB = 1024 * KiB
+GiB = 1024 * MiB
+
+BOUNDARY = "----------bench-boundary"
+FEED_SIZE = 64 * KiB
+READ_SIZE = 64 * KiB
+
+# (part size, amount of parts)
+CASES = [
+    (KiB, 64 * KiB),
+    (MiB, 64),
+    (GiB, 1),
+]
+
+
+def iter_body(part_size, parts):
+    payload = b"x" * FEED_SIZE
+    for i in range(parts):
+        yield (
+            "--{}\r\n"
+            'Content-Disposition: form-data; name="f{}"; filename="f{}"\r\n'
+            "\r\n".format(BOUNDARY, i, i)
+        ).encode()
+        left = part_size
+        while left > 0:
+            yield payload[:left]
+            left -= FEED_SIZE
+        yield b"\r\n"
+    yield "--{}--\r\n".format(BOUNDARY).encode()
+
+
+async def feed(stream, part_size, parts):
+    buf = bytearray()
+    for data in iter_body(part_size, parts):
+        buf += data
+        if len(buf) >= FEED_SIZE:
+            stream.feed_data(bytes(buf))
+            buf.clear()
+            # let the reader consume the data, like the network would
+            await asyncio.sleep(0)
+    stream.feed_data(bytes(buf))
+    stream.feed_eof()
+
+
+async def read_all(stream):
+    headers = {
+        "Content-Type": "multipart/form-data; boundary={}".format(BOUNDARY),
+    }
+    reader = MultipartReader(headers, stream)
+    total = 0
+    part = await reader.next()
+    while part is not None:
+        chunk = await part.read_chunk(READ_SIZE)
+        while chunk:
+            total += len(chunk)
+            chunk = await part.read_chunk(READ_SIZE)
+        part = await reader.next()
+    return total
+
+
+async def bench(part_size, parts):
+    loop = asyncio.get_running_loop()
+    stream = StreamReader(mock.Mock(_reading_paused=False), 64 * KiB, loop=loop)
+    start = time.perf_counter()
+    _, total = await asyncio.gather(feed(stream, part_size, parts), read_all(stream))
+    elapsed = time.perf_counter() - start
+    assert total == part_size * parts, (total, part_size * parts)
+    return total, elapsed
+
+
+def fm_size(s, _fms=("", "K", "M", "G")):
+    i = 0
+    while s >= 1024:
+        s /= 1024
+        i += 1
+    return "{:.0f}{}B".format(s, _fms[i])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--skip-huge", action="store_true", help="skip the 1 GiB part case"
+    )
+    args = parser.parse_args()
+
+    for part_size, parts in CASES:
+        if args.skip_huge and part_size >= GiB:
+            continue
+        total, elapsed = asyncio.run(bench(part_size, parts))
+        print(
+            "{:>6} parts x {:>5}: {:8.1f} MB/s".format(
+                parts, fm_size(part_size), total / elapsed / 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
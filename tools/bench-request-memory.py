@@ -0,0 +1,119 @@
+"""Memory held by in-flight web requests.
+
+N long-polling requests are fed into RequestHandler instances over a
+no-op transport, so only server side objects are accounted: parsed
+message, Request, payload StreamReader, StreamWriter, handler task
+and the protocol itself. Every handler waits for an event, memory is
+measured when all of them are in flight.
+
+    python tools/bench-request-memory.py [-n 20000] [--lazy-headers]
+"""
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+
+from aiohttp import web
+
+REQUEST = (
+    b"GET /poll?since=1234 HTTP/1.1\r\n"
+    b"Host: example.com\r\n"
+    b"User-Agent: bench/1.0\r\n"
+    b"Accept: application/json\r\n"
+    b"Accept-Encoding: gzip, deflate\r\n"
+    b"Cookie: session=0123456789abcdef\r\n"
+    b"X-Forwarded-For: 10.0.0.1, 10.0.0.2\r\n"
+    b"X-Forwarded-Proto: https\r\n"
+    b"X-Request-Id: 0123456789abcdef0123456789abcdef\r\n"
+    b"\r\n"
+)
+
+
+class Transport(asyncio.Transport):
+    """Transport shared by all connections, writes are dropped."""
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def is_closing(self):
+        return False
+
+    def write(self, data):
+        pass
+
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+    def close(self):
+        pass
+
+
+async def run(count, lazy_headers):
+    release = asyncio.Event()
+    waiting = 0
+    all_waiting = asyncio.Event()
+
+    async def handler(request):
+        nonlocal waiting
+        # typical accesses of a long-polling handler
+        request.query.get("since")
+        request.headers.get("X-Request-Id")
+        waiting += 1
+        if waiting == count:
+            all_waiting.set()
+        await release.wait()
+        return web.Response(text="done")
+
+    app = web.Application()
+    app.router.add_get("/poll", handler)
+    runner = web.AppRunner(app, access_log=None, lazy_headers=lazy_headers)
+    await runner.setup()
+    server = runner.server
+    transport = Transport()
+
+    protocols = []
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    mem_before = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(count):
+        protocol = server()
+        protocol.connection_made(transport)
+        protocol.data_received(REQUEST)
+        protocols.append(protocol)
+    await all_waiting.wait()
+
+    gc.collect()
+    mem_after = tracemalloc.get_traced_memory()[0]
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    release.set()
+    for protocol in protocols:
+        protocol.connection_lost(None)
+    await runner.cleanup()
+
+    return (mem_after - mem_before) / count, (blocks_after - blocks_before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=20000, help="in-flight requests")
+    parser.add_argument(
+        "--lazy-headers", action="store_true", help="build request.headers lazily"
+    )
+    args = parser.parse_args()
+
+    size, blocks = asyncio.run(run(args.n, args.lazy_headers))
+    print(f"{args.n} in-flight requests")
+    print(f"bytes per request:            {size:8.0f}")
+    print(f"allocated blocks per request: {blocks:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Throughput of run_app(threads=N) compared with run_app(workers=N).
+
+The server runs in a subprocess with a trivial handler, the load is
+generated by a separate process with a client per CPU, every client
+keeps CONCURRENCY requests in flight over keep-alive connections.
+Requests per second and resident memory of the server are printed
+for every mode.
+
+Threads can serve in parallel on free-threaded CPython builds only,
+with the GIL the thread mode is expected to be on par with a single
+process.
+
+    python tools/bench-server-threads.py [-n 4] [-d 10]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+CONCURRENCY = 64
+
+SERVER = """
+import sys
+
+from aiohttp import web
+
+
+async def handler(request):
+    return web.Response(text="Hello, world")
+
+app = web.Application()
+app.router.add_get("/", handler)
+mode, count, port = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+kwargs = {} if mode == "single" else {mode: count}
+web.run_app(app, host="127.0.0.1", port=port, access_log=None, **kwargs)
+"""
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def load(url, duration):
+    count = 0
+    deadline = time.monotonic() + duration
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def worker():
+            nonlocal count
+            while time.monotonic() < deadline:
+                async with session.get(url) as resp:
+                    await resp.read()
+                count += 1
+
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return count
+
+
+def run_client(url, duration):
+    return asyncio.run(load(url, duration))
+
+
+def rss(pid):
+    """Resident memory of process *pid* and its children, in MiB."""
+    pids = [pid]
+    try:
+        out = subprocess.run(
+            ["pgrep", "-P", str(pid)], capture_output=True, text=True
+        ).stdout
+        pids.extend(int(p) for p in out.split())
+    except FileNotFoundError:
+        pass
+    total = 0
+    for p in pids:
+        try:
+            with open(f"/proc/{p}/statm") as f:
+                total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            pass
+    return total / (1024 * 1024)
+
+
+def bench(mode, count, duration, clients):
+    port = unused_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "-c", SERVER, mode, str(count), str(port)],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        for line in proc.stdout:
+            if line.startswith(b"======== Running on"):
+                break
+        url = f"http://127.0.0.1:{port}/"
+        with multiprocessing.Pool(clients) as pool:
+            result = pool.starmap_async(run_client, [(url, duration)] * clients)
+            time.sleep(duration / 2)
+            memory = rss(proc.pid)
+            total = sum(result.get())
+    finally:
+        proc.send_signal(signal.SIGINT)
+        proc.wait()
+    return total / duration, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n", type=int, default=os.cpu_count() or 1, help="threads / workers"
+    )
+    parser.add_argument("-d", type=float, default=10, help="seconds per mode")
+    parser.add_argument(
+        "-c", type=int, default=os.cpu_count() or 1, help="client processes"
+    )
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    for mode, count in (("single", 1), ("threads", args.n), ("workers", args.n)):
+        rps, memory = bench(mode, count, args.d, args.c)
+        print(f"{mode:>7} x {count:<3} {rps:10.0f} req/s {memory:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()